@@ -0,0 +1,328 @@
+"""Optional background watcher that keeps category indexes hot."""
+
+import asyncio
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple
+
+from .content_cache import FileFingerprint, fingerprint_files
+from .document_cache import DirectoryFingerprint, directory_fingerprint
+from .logging_config import get_logger
+from .utils.glob_walker import DirectoryStamp, scan_category_patterns, stamps_current
+
+try:
+    # watchdog delivers native events: inotify on Linux, FSEvents/kqueue/ReadDirectoryChangesW elsewhere
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None  # type: ignore[assignment, misc]
+
+logger = get_logger()
+
+# Seconds between stat-polling scans when native events are unavailable
+DEFAULT_POLL_INTERVAL = 2.0
+
+# Seconds between safety-net scans when native events are available
+DEFAULT_NATIVE_POLL_INTERVAL = 30.0
+
+# Seconds to let a burst of native events settle before rescanning
+DEFAULT_DEBOUNCE = 0.2
+
+# Native events that do not modify anything
+_READ_ONLY_EVENTS = frozenset({"opened", "closed_no_write"})
+
+# Rebuilds a category's cached views: (category, search dir, patterns)
+RefreshCallback = Callable[[str, Path, Tuple[str, ...]], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class CategorySnapshot:
+    """File list and fingerprints of a category's tree as of one scan."""
+
+    files: Tuple[Path, ...]
+    stamps: Tuple[DirectoryStamp, ...]  # Directories the scan walked
+    fingerprint: Optional[Tuple[FileFingerprint, ...]]  # Matched files
+    documents: DirectoryFingerprint  # Managed documents directory
+
+    def same_content(self, other: "CategorySnapshot") -> bool:
+        """Check whether two scans saw the same files in the same state."""
+        return (self.files, self.fingerprint, self.documents) == (other.files, other.fingerprint, other.documents)
+
+
+@dataclass
+class WatchedCategory:
+    """A category registered with the watcher and what it last saw of it."""
+
+    search_dir: Path
+    patterns: Tuple[str, ...]
+    root: str  # Real path of search_dir, for matching native event paths
+    snapshot: Optional[CategorySnapshot] = None
+    changes: int = 0  # Native change events received
+    scanned: int = -1  # Value of ``changes`` when the last scan completed
+
+
+def _documents_fingerprint(search_dir: Path) -> DirectoryFingerprint:
+    """Fingerprint a category's managed documents directory.
+
+    The category directory itself is left out: its mtime also moves for files
+    the patterns do not match, which the scan already accounts for.
+    """
+    return directory_fingerprint(search_dir)[1:]
+
+
+class _EventForwarder:
+    """watchdog event handler that hands changed paths to the watcher's event loop."""
+
+    def __init__(self, watcher: "CategoryWatcher", loop: asyncio.AbstractEventLoop):
+        self._watcher = watcher
+        self._loop = loop
+
+    def dispatch(self, event: Any) -> None:
+        if event.event_type in _READ_ONLY_EVENTS:
+            return
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            if path:
+                try:
+                    self._loop.call_soon_threadsafe(self._watcher.path_changed, os.fsdecode(path))
+                except RuntimeError:
+                    # Event loop already closed during shutdown
+                    return
+
+
+class CategoryWatcher:
+    """Background service that keeps category file lists and content indexes hot.
+
+    Categories register themselves as they are read. The watcher scans each
+    one off the event loop, remembers its matched files and fingerprints, and
+    calls ``refresh`` whenever a later scan sees a difference, so the caches
+    are rebuilt before the next read. While a category's last scan is current,
+    ``is_current`` lets readers trust cached results without re-validating
+    them against the filesystem.
+
+    Changes are detected with native filesystem events when ``watchdog`` is
+    installed, backed up by an infrequent scan, and otherwise by stat-polling
+    every ``poll_interval`` seconds, which bounds how long an external edit can
+    go unnoticed. Each poll costs one ``stat`` per scanned directory and
+    matched file; a category is only walked again when those change.
+
+    Only assembled category content is served through ``is_current``.
+    Managed document listings are left to the per-directory document
+    manifest, which already costs one ``stat`` per document; the watcher
+    fingerprints just the top-level documents directory, which misses
+    in-place edits and sidecar changes, so it cannot vouch for them.
+    """
+
+    def __init__(
+        self,
+        refresh: RefreshCallback,
+        *,
+        max_depth: int,
+        limit: int,
+        exclude_suffix: str,
+        poll_interval: Optional[float] = None,
+        debounce: float = DEFAULT_DEBOUNCE,
+        use_native: bool = True,
+    ):
+        self.refresh = refresh
+        self.max_depth = max_depth
+        self.limit = limit
+        self.exclude_suffix = exclude_suffix
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.use_native = use_native
+        self._categories: Dict[str, WatchedCategory] = {}
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._observer: Any = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._watches: Dict[str, Any] = {}  # Real directory path -> native watch handle
+
+    @property
+    def running(self) -> bool:
+        """Whether the watcher is currently scanning."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def native(self) -> bool:
+        """Whether native filesystem events are in use."""
+        return self._observer is not None
+
+    def __len__(self) -> int:
+        return len(self._categories)
+
+    async def start(self) -> None:
+        """Start watching, using native events if available."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        if self.use_native and Observer is not None:
+            try:
+                observer = Observer()
+                observer.start()
+                self._observer = observer
+            except Exception as e:
+                logger.warning(f"Native filesystem events unavailable, polling instead: {e}")
+        for watched in self._categories.values():
+            self._schedule(watched.root)
+        self._task = asyncio.create_task(self._run())
+        logger.debug(f"Category watcher started ({'native events' if self.native else 'polling'})")
+
+    async def stop(self) -> None:
+        """Stop watching and release the native observer."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._observer is not None:
+            observer, self._observer = self._observer, None
+            self._watches.clear()
+            observer.stop()
+            await asyncio.to_thread(observer.join)
+        logger.debug("Category watcher stopped")
+
+    def watch(self, category: str, search_dir: Path, patterns: Sequence[str]) -> None:
+        """Register a category, replacing any earlier registration with a different directory or patterns."""
+        key = tuple(patterns)
+        watched = self._categories.get(category)
+        if watched is not None and watched.search_dir == search_dir and watched.patterns == key:
+            return
+        root = os.path.realpath(search_dir)
+        self._categories[category] = WatchedCategory(search_dir, key, root)
+        if watched is not None:
+            self._unschedule(watched.root)
+        self._schedule(root)
+        self._wake.set()
+
+    def unwatch(self, category: str) -> None:
+        """Stop tracking a category, e.g. after its configuration changes."""
+        watched = self._categories.pop(category, None)
+        if watched is not None:
+            self._unschedule(watched.root)
+
+    def is_current(self, category: str, search_dir: Path, patterns: Sequence[str]) -> bool:
+        """Check whether cached results for a category can be trusted without re-validation."""
+        watched = self._categories.get(category)
+        return (
+            self.running
+            and watched is not None
+            and watched.snapshot is not None
+            and watched.scanned == watched.changes
+            and watched.search_dir == search_dir
+            and watched.patterns == tuple(patterns)
+        )
+
+    def path_changed(self, path: str) -> None:
+        """Record a native change event for every category containing ``path``."""
+        for watched in self._categories.values():
+            if path == watched.root or path.startswith(watched.root + os.sep):
+                watched.changes += 1
+                self._wake.set()
+
+    async def scan_once(self) -> None:
+        """Check every registered category once, refreshing those that changed."""
+        for category, watched in list(self._categories.items()):
+            changes = watched.changes
+            try:
+                snapshot = await asyncio.to_thread(self._rescan, watched, changes != watched.scanned)
+            except Exception as e:
+                logger.warning(f"Failed to scan category '{category}': {e}")
+                continue
+            if self._categories.get(category) is not watched:
+                # Unwatched or re-registered while scanning
+                continue
+
+            if snapshot is not None:
+                previous, watched.snapshot = watched.snapshot, snapshot
+                # The first scan also refreshes, covering changes made since the caches were filled
+                if previous is None or not previous.same_content(snapshot):
+                    logger.debug(f"Category '{category}' changed on disk, refreshing")
+                    try:
+                        await self.refresh(category, watched.search_dir, watched.patterns)
+                    except Exception as e:
+                        logger.warning(f"Failed to refresh category '{category}': {e}")
+            watched.scanned = changes
+
+    async def _run(self) -> None:
+        interval = self.poll_interval
+        if interval is None:
+            interval = DEFAULT_NATIVE_POLL_INTERVAL if self.native else DEFAULT_POLL_INTERVAL
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=interval)
+                await asyncio.sleep(self.debounce)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.scan_once()
+
+    def _rescan(self, watched: WatchedCategory, force: bool) -> Optional[CategorySnapshot]:
+        """Scan a category, or return None when a stat check shows nothing changed."""
+        previous = watched.snapshot
+        if (
+            not force
+            and previous is not None
+            and stamps_current(previous.stamps)
+            and fingerprint_files(previous.files) == previous.fingerprint
+            and _documents_fingerprint(watched.search_dir) == previous.documents
+        ):
+            return None
+
+        files, stamps = scan_category_patterns(
+            watched.search_dir,
+            watched.patterns,
+            max_depth=self.max_depth,
+            limit=self.limit,
+            exclude_suffix=self.exclude_suffix,
+        )
+        return CategorySnapshot(
+            files=tuple(files),
+            stamps=stamps,
+            fingerprint=fingerprint_files(files),
+            documents=_documents_fingerprint(watched.search_dir),
+        )
+
+    def _schedule(self, root: str) -> None:
+        if self._observer is None or self._loop is None or root in self._watches:
+            return
+        try:
+            self._watches[root] = self._observer.schedule(_EventForwarder(self, self._loop), root, recursive=True)
+        except Exception as e:
+            # Polling still covers the directory, just less promptly
+            logger.debug(f"Cannot watch {root} for native events: {e}")
+
+    def _unschedule(self, root: str) -> None:
+        if any(watched.root == root for watched in self._categories.values()):
+            return
+        handle = self._watches.pop(root, None)
+        if handle is not None and self._observer is not None:
+            try:
+                self._observer.unschedule(handle)
+            except Exception as e:
+                logger.debug(f"Failed to stop watching {root}: {e}")
+
+
+# Global watcher instance, set only when the server enables watching
+_category_watcher: Optional[CategoryWatcher] = None
+
+
+def get_category_watcher() -> Optional[CategoryWatcher]:
+    """Get the process-wide category watcher, if watching is enabled."""
+    return _category_watcher
+
+
+def set_category_watcher(watcher: Optional[CategoryWatcher]) -> None:
+    """Install (or with None, remove) the process-wide category watcher."""
+    global _category_watcher
+    _category_watcher = watcher
+
+
+__all__ = [
+    "CategorySnapshot",
+    "CategoryWatcher",
+    "DEFAULT_POLL_INTERVAL",
+    "get_category_watcher",
+    "set_category_watcher",
+]
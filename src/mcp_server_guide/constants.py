@@ -3,3 +3,6 @@
 # Document management constants
 METADATA_SUFFIX = "_.json"
 DOCUMENT_SUBDIR = "__docs__"
+
+# Per-__docs__ index of managed documents (hidden, so never listed as a document)
+DOCUMENT_MANIFEST = ".manifest.json"
@@ -0,0 +1,209 @@
+"""Fingerprint-validated in-memory cache for assembled category content."""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .logging_config import get_logger
+from .utils.lru_cache import CacheStats, LRUCache
+
+logger = get_logger()
+
+# Default byte budget for cached category content (32MB)
+DEFAULT_CONTENT_CACHE_BYTES = 32 * 1024 * 1024
+
+# (path, size, mtime_ns, inode) for a single matched file
+FileFingerprint = Tuple[str, int, int, int]
+
+
+def fingerprint_files(paths: Sequence[Path]) -> Optional[Tuple[FileFingerprint, ...]]:
+    """Build a cheap change-detection fingerprint for a list of files.
+
+    Returns None if any file cannot be stat'ed, in which case the caller
+    should treat the content as uncacheable.
+    """
+    fingerprint: List[FileFingerprint] = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        fingerprint.append((str(path), st.st_size, st.st_mtime_ns, st.st_ino))
+    return tuple(fingerprint)
+
+
+@dataclass(frozen=True)
+class ContentSection:
+    """Location of one document's body within combined category content.
+
+    Offsets and lengths are string indices into the combined content, so a
+    section body is a direct slice rather than a re-scan of the whole string.
+    """
+
+    header: str
+    offset: int
+    length: int
+    path: str
+
+
+@dataclass
+class AssembledContent:
+    """A category content result together with its section index."""
+
+    result: Dict[str, Any]
+    sections: Tuple[ContentSection, ...] = ()
+    _by_path: Dict[str, ContentSection] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for section in self.sections:
+            self._by_path.setdefault(section.path, section)
+
+    @property
+    def content(self) -> str:
+        """The combined category content."""
+        return str(self.result.get("content", ""))
+
+    def section_for_path(self, path: str) -> Optional[ContentSection]:
+        """Look up the section assembled from a source file."""
+        return self._by_path.get(path)
+
+    def section_text(self, section: ContentSection) -> str:
+        """Slice a section's body out of the combined content."""
+        return self.content[section.offset : section.offset + section.length]
+
+
+@dataclass
+class CategoryContentEntry:
+    """Cached category result with the fingerprint it was assembled from."""
+
+    search_dir: str
+    patterns: Tuple[str, ...]
+    fingerprint: Tuple[FileFingerprint, ...]
+    result: Dict[str, Any]
+    sections: Tuple[ContentSection, ...]
+    size: int
+
+
+class CategoryContentCache:
+    """Process-wide LRU cache of assembled category content bounded by a byte budget.
+
+    Entries are keyed by category name and are only served when the search
+    directory, patterns and file fingerprint all match the current request.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CONTENT_CACHE_BYTES):
+        self._entries: LRUCache[str, CategoryContentEntry] = LRUCache(max_size=max_bytes, sizeof=lambda e: e.size)
+
+    @property
+    def max_bytes(self) -> int:
+        """Byte budget for cached content."""
+        return self._entries.max_size or 0
+
+    @property
+    def total_bytes(self) -> int:
+        """Total bytes currently held by the cache."""
+        return self._entries.total_size
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit/miss/eviction counters."""
+        return self._entries.stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        category: str,
+        search_dir: str,
+        patterns: Sequence[str],
+        fingerprint: Tuple[FileFingerprint, ...],
+    ) -> Optional[AssembledContent]:
+        """Return a copy of the cached result and its sections if still valid, else None."""
+        entry = self._entries.get(
+            category,
+            lambda e: e.search_dir == search_dir and e.patterns == tuple(patterns) and e.fingerprint == fingerprint,
+        )
+        if entry is None:
+            return None
+        logger.debug(f"Category content cache hit: {category}")
+        return AssembledContent(self._copy_result(entry.result), entry.sections)
+
+    def peek(self, category: str, search_dir: str, patterns: Sequence[str]) -> Optional[AssembledContent]:
+        """Return the cached result without checking its fingerprint.
+
+        Only for callers that know the files are unchanged, such as while a
+        filesystem watcher vouches for the category's directory.
+        """
+        entry = self._entries.get(category, lambda e: e.search_dir == search_dir and e.patterns == tuple(patterns))
+        if entry is None:
+            return None
+        return AssembledContent(self._copy_result(entry.result), entry.sections)
+
+    def put(
+        self,
+        category: str,
+        search_dir: str,
+        patterns: Sequence[str],
+        fingerprint: Tuple[FileFingerprint, ...],
+        assembled: AssembledContent,
+    ) -> None:
+        """Store an assembled category result, evicting least recently used entries to fit."""
+        entry = CategoryContentEntry(
+            search_dir=search_dir,
+            patterns=tuple(patterns),
+            fingerprint=fingerprint,
+            result=self._copy_result(assembled.result),
+            sections=assembled.sections,
+            size=len(assembled.content.encode("utf-8")),
+        )
+        if not self._entries.put(category, entry):
+            logger.debug(f"Category '{category}' content ({entry.size} bytes) exceeds cache budget, not caching")
+
+    def invalidate(self, category: str) -> None:
+        """Drop the cached entry for a category."""
+        self._entries.invalidate(category)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        self._entries.clear()
+
+    @staticmethod
+    def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Shallow-copy a result so callers cannot mutate cached lists."""
+        return {key: list(value) if isinstance(value, list) else value for key, value in result.items()}
+
+
+# Global content cache instance (singleton)
+_content_cache: Optional[CategoryContentCache] = None
+
+
+def get_content_cache() -> CategoryContentCache:
+    """Get the process-wide category content cache."""
+    global _content_cache
+    if _content_cache is None:
+        _content_cache = CategoryContentCache()
+    return _content_cache
+
+
+def configure_content_cache(max_bytes: int) -> CategoryContentCache:
+    """Replace the process-wide category content cache with one using a new byte budget."""
+    global _content_cache
+    if max_bytes < 0:
+        raise ValueError("max_bytes must be non-negative")
+    _content_cache = CategoryContentCache(max_bytes=max_bytes)
+    return _content_cache
+
+
+__all__ = [
+    "AssembledContent",
+    "CacheStats",
+    "CategoryContentCache",
+    "CategoryContentEntry",
+    "ContentSection",
+    "DEFAULT_CONTENT_CACHE_BYTES",
+    "configure_content_cache",
+    "fingerprint_files",
+    "get_content_cache",
+]
@@ -1,8 +1,41 @@
 """Universal category document cache system."""
 
-import asyncio
+import os
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import ClassVar, List, Optional, Tuple
+
+from .constants import DOCUMENT_SUBDIR
+
+# (path, mtime_ns, inode) for each directory that determines a category's document set
+DirectoryFingerprint = Tuple[Tuple[str, int, int], ...]
+
+# Cache sizing and expiry defaults
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_POSITIVE_TTL = 300.0
+# Directory fingerprints only cover a category's top level and its __docs__
+# directory, so a negative entry for a document that would be matched in a
+# subdirectory (by a recursive pattern) is only rechecked once this expires
+DEFAULT_NEGATIVE_TTL = 30.0
+
+
+def directory_fingerprint(category_dir: Path) -> DirectoryFingerprint:
+    """Fingerprint a category directory and its managed documents directory.
+
+    Directory mtimes change whenever an entry is added, removed or renamed, so
+    a matching fingerprint means no document has appeared or disappeared at
+    the top level of the category. Missing directories fingerprint as zeros.
+    """
+    parts = []
+    for path in (category_dir, category_dir / DOCUMENT_SUBDIR):
+        try:
+            st = os.stat(path)
+            parts.append((str(path), st.st_mtime_ns, st.st_ino))
+        except OSError:
+            parts.append((str(path), 0, 0))
+    return tuple(parts)
 
 
 @dataclass
@@ -11,43 +44,105 @@ class DocumentCacheEntry:
 
     exists: bool
     matched: Optional[List[str]]  # None for non-existent, List for glob matches
+    expires_at: float = float("inf")
+    fingerprint: Optional[DirectoryFingerprint] = None
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Check whether the entry has outlived its TTL."""
+        return (time.monotonic() if now is None else now) >= self.expires_at
 
 
 class CategoryDocumentCache:
-    """Universal document metadata cache for all categories."""
+    """Universal document metadata cache for all categories.
+
+    No operation awaits while touching the cache, so none can interleave with
+    another coroutine and no locking is needed. Entries expire after a TTL
+    (shorter for negative lookups), the cache is bounded with LRU eviction,
+    and an entry stored with a directory fingerprint is discarded as soon as
+    the caller presents a different one.
+    """
 
-    _cache: Dict[str, Dict[str, DocumentCacheEntry]] = {}
-    _lock: asyncio.Lock = asyncio.Lock()
+    _cache: ClassVar["OrderedDict[Tuple[str, str], DocumentCacheEntry]"] = OrderedDict()
+
+    max_entries: ClassVar[int] = DEFAULT_MAX_ENTRIES
+    positive_ttl: ClassVar[float] = DEFAULT_POSITIVE_TTL
+    negative_ttl: ClassVar[float] = DEFAULT_NEGATIVE_TTL
 
     @classmethod
-    async def get(cls, category: str, document: str) -> Optional[DocumentCacheEntry]:
-        """Get cached document entry."""
-        async with cls._lock:
-            return cls._cache.get(category, {}).get(document)
+    def configure(
+        cls,
+        *,
+        max_entries: Optional[int] = None,
+        positive_ttl: Optional[float] = None,
+        negative_ttl: Optional[float] = None,
+    ) -> None:
+        """Adjust cache bounds and expiry; existing entries keep their original expiry."""
+        if max_entries is not None:
+            if max_entries < 1:
+                raise ValueError("max_entries must be at least 1")
+            cls.max_entries = max_entries
+        if positive_ttl is not None:
+            cls.positive_ttl = positive_ttl
+        if negative_ttl is not None:
+            cls.negative_ttl = negative_ttl
 
     @classmethod
-    async def set(cls, category: str, document: str, exists: bool, matched: Optional[List[str]]) -> None:
+    async def get(
+        cls, category: str, document: str, fingerprint: Optional[DirectoryFingerprint] = None
+    ) -> Optional[DocumentCacheEntry]:
+        """Get cached document entry.
+
+        Expired entries, and entries whose stored fingerprint differs from the
+        one supplied, are dropped and reported as a miss.
+        """
+        key = (category, document)
+        entry = cls._cache.get(key)
+        if entry is None:
+            return None
+
+        if entry.is_expired() or (
+            fingerprint is not None and entry.fingerprint is not None and entry.fingerprint != fingerprint
+        ):
+            cls._cache.pop(key, None)
+            return None
+
+        cls._cache.move_to_end(key)
+        return entry
+
+    @classmethod
+    async def set(
+        cls,
+        category: str,
+        document: str,
+        exists: bool,
+        matched: Optional[List[str]],
+        *,
+        fingerprint: Optional[DirectoryFingerprint] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
         """Set cached document entry."""
-        async with cls._lock:
-            if category not in cls._cache:
-                cls._cache[category] = {}
-            cls._cache[category][document] = DocumentCacheEntry(exists, matched)
+        if ttl is None:
+            ttl = cls.positive_ttl if exists else cls.negative_ttl
+        entry = DocumentCacheEntry(exists, matched, time.monotonic() + ttl, fingerprint)
+
+        key = (category, document)
+        cls._cache[key] = entry
+        cls._cache.move_to_end(key)
+        while len(cls._cache) > cls.max_entries:
+            cls._cache.popitem(last=False)
 
     @classmethod
     async def invalidate_category(cls, category: str) -> None:
         """Invalidate all cache entries for a category."""
-        async with cls._lock:
-            cls._cache.pop(category, None)
+        for key in [key for key in cls._cache if key[0] == category]:
+            cls._cache.pop(key, None)
 
     @classmethod
     async def invalidate(cls, category: str, document: str) -> None:
         """Invalidate specific document cache entry."""
-        async with cls._lock:
-            if category in cls._cache:
-                cls._cache[category].pop(document, None)
+        cls._cache.pop((category, document), None)
 
     @classmethod
     async def clear_all(cls) -> None:
         """Clear all cache entries."""
-        async with cls._lock:
-            cls._cache.clear()
+        cls._cache.clear()
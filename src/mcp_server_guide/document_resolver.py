@@ -0,0 +1,89 @@
+"""Direct document-name resolution for file-based categories."""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+import aiofiles
+
+from .utils.file_extensions import get_extension_candidates
+
+
+def _index_keys(filename: str) -> Tuple[str, ...]:
+    """Return every lookup key a file name answers to.
+
+    A file answers to its full name and to each dot-delimited prefix, so
+    ``guide.v2.md`` resolves from ``guide.v2.md``, ``guide.v2`` and ``guide``.
+    """
+    name = filename.strip().lower()
+    keys = [name]
+    dot = name.find(".", 1)
+    while dot != -1:
+        keys.append(name[:dot])
+        dot = name.find(".", dot + 1)
+    return tuple(keys)
+
+
+@dataclass
+class CategoryNameIndex:
+    """Case-insensitive name index over the files matched by a category.
+
+    Each key maps to the first matched file (in match order) that answers
+    to it, mirroring the precedence of the combined-content section lookup.
+    """
+
+    paths: Tuple[Path, ...]
+    _positions: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, paths: Sequence[Path]) -> "CategoryNameIndex":
+        """Build an index from matched file paths."""
+        index = cls(tuple(paths))
+        for position, path in enumerate(index.paths):
+            for key in _index_keys(path.name):
+                index._positions.setdefault(key, position)
+        return index
+
+    def resolve(self, document: str) -> Optional[Path]:
+        """Map a document name to a matched file, trying extension fallbacks in priority order."""
+        for candidate in get_extension_candidates(document):
+            position = self._positions.get(candidate.strip().lower())
+            if position is not None:
+                return self.paths[position]
+        return None
+
+
+# Name indexes per category, reused while the matched file list is unchanged
+_name_indexes: Dict[str, CategoryNameIndex] = {}
+
+
+def get_name_index(category: str, matched_files: Sequence[Path]) -> CategoryNameIndex:
+    """Get the name index for a category, rebuilding it if its matched files changed."""
+    index = _name_indexes.get(category)
+    if index is None or index.paths != tuple(matched_files):
+        index = CategoryNameIndex.build(matched_files)
+        _name_indexes[category] = index
+    return index
+
+
+def invalidate_name_index(category: str) -> None:
+    """Drop the name index for a category."""
+    _name_indexes.pop(category, None)
+
+
+async def read_category_document(path: Path) -> str:
+    """Read a single category document, formatted as its combined-content section body."""
+    try:
+        async with aiofiles.open(path, "r", encoding="utf-8") as f:
+            content = await f.read()
+    except Exception as e:
+        return f"Error reading file: {str(e)}"
+    return content.strip()
+
+
+__all__ = [
+    "CategoryNameIndex",
+    "get_name_index",
+    "invalidate_name_index",
+    "read_category_document",
+]
@@ -1,13 +1,18 @@
 """HTTP-aware file caching system (Issue 003 Phase 3)."""
 
+import asyncio
 import hashlib
 import json
+import os
+import tempfile
+import threading
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from .logging_config import get_logger
+from .utils.lru_cache import LRUCache
 
 logger = get_logger()
 
@@ -35,12 +40,12 @@ class CacheEntry:
         """Get Cache-Control header."""
         return self.headers.get("cache-control")
 
-    def needs_validation(self) -> bool:
-        """Check if cache entry needs validation."""
+    def freshness_lifetime(self) -> float:
+        """Seconds after ``cached_at`` during which the entry is fresh; 0 if it must always be validated."""
         # Check Cache-Control directives first
         if self.cache_control:
             if "no-cache" in self.cache_control:
-                return True
+                return 0.0
 
             # Check max-age
             if "max-age=" in self.cache_control:
@@ -49,31 +54,65 @@ class CacheEntry:
                     max_age_end = self.cache_control.find(",", max_age_start)
                     if max_age_end == -1:
                         max_age_end = len(self.cache_control)
-                    max_age = int(self.cache_control[max_age_start:max_age_end].strip())
-
-                    age = time.time() - self.cached_at
-                    return age > max_age
+                    return float(int(self.cache_control[max_age_start:max_age_end].strip()))
                 except (ValueError, IndexError):
                     pass
 
         # If we have Last-Modified or ETag, assume fresh for a short time
         if self.last_modified or self.etag:
-            age = time.time() - self.cached_at
-            return age > 300  # 5 minutes default freshness
+            return 300.0  # 5 minutes default freshness
 
         # If no cache headers, always validate
-        return True
+        return 0.0
+
+    @property
+    def expires_at(self) -> float:
+        """Wall-clock time at which the entry stops being fresh."""
+        return self.cached_at + self.freshness_lifetime()
+
+    def needs_validation(self) -> bool:
+        """Check if cache entry needs validation."""
+        lifetime = self.freshness_lifetime()
+        if lifetime <= 0:
+            return True
+        return time.time() - self.cached_at > lifetime
+
+
+@dataclass
+class IndexEntry:
+    """Size and last-access time of one on-disk cache file."""
+
+    size: int
+    accessed_at: float
 
 
 class FileCache:
-    """HTTP-aware file cache."""
+    """HTTP-aware file cache.
+
+    Entries are stored as JSON files sharded into subdirectories by the first
+    characters of their key, written atomically via a temporary file and rename.
+    An in-memory index of file sizes and access times enforces ``max_size_mb``
+    with least-recently-used eviction. The index is built on first use, which
+    also compacts the directory: abandoned temporary files are removed, entries
+    from the old flat layout are moved into their shard and the size limit is
+    applied. The ``*_async`` methods run the same operations in a worker thread
+    so callers on the event loop never block on disk I/O.
+
+    Several server processes may share one cache directory. Entries another
+    process writes are picked up on lookup, but each process only counts the
+    entries it has seen, so the size limit is enforced per process rather
+    than for the directory as a whole.
+    """
+
+    SHARD_WIDTH = 2
+    TEMP_SUFFIX = ".tmp"
+    # Temporary files older than this are abandoned writes, not ones still in progress
+    STALE_TEMP_SECONDS = 3600
 
     def __init__(self, cache_dir: Optional[str] = None, max_size_mb: int = 100):
         if cache_dir:
             self.cache_dir = Path(cache_dir)
         else:
-            import os
-
             from .naming import cache_directory_name
 
             xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
@@ -86,57 +125,292 @@ class FileCache:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
         except PermissionError:
             # Fallback to temp directory if cache creation fails
-            import tempfile
-
             self.cache_dir = Path(tempfile.gettempdir()) / cache_directory_name()
             self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.max_size_mb = max_size_mb
+        self._index: Dict[str, IndexEntry] = {}
+        self._indexed = False
+        self._total_size = 0
+        self._lock = threading.RLock()
+
+    @property
+    def max_size_bytes(self) -> int:
+        """Maximum total size of cached files in bytes."""
+        return self.max_size_mb * 1024 * 1024
+
+    @property
+    def total_size(self) -> int:
+        """Total size of cached files in bytes."""
+        with self._lock:
+            self._ensure_index()
+            return self._total_size
 
     def _generate_key(self, url: str) -> str:
         """Generate filesystem-safe cache key from URL."""
         # Use SHA256 hash for consistent, filesystem-safe keys
         return hashlib.sha256(url.encode()).hexdigest()
 
+    def _cache_file(self, key: str) -> Path:
+        """Get the sharded path of the cache file for a key."""
+        return self.cache_dir / key[: self.SHARD_WIDTH] / f"{key}.json"
+
+    def _ensure_index(self) -> Dict[str, IndexEntry]:
+        """Build the size/access index on first use, compacting the cache directory."""
+        if not self._indexed:
+            self._index = {}
+            self._total_size = 0
+            self._compact()
+        return self._index
+
+    def compact(self) -> None:
+        """Rebuild the index from disk, tidy the directory and enforce the size limit."""
+        with self._lock:
+            self._index = {}
+            self._total_size = 0
+            self._compact()
+
+    def _compact(self) -> None:
+        self._indexed = True
+        # Remove interrupted writes and migrate entries from the flat layout
+        stale_before = time.time() - self.STALE_TEMP_SECONDS
+        for stray in self.cache_dir.rglob(f"*{self.TEMP_SUFFIX}"):
+            try:
+                if stray.stat().st_mtime < stale_before:
+                    stray.unlink(missing_ok=True)
+            except OSError:
+                continue
+        for legacy in self.cache_dir.glob("*.json"):
+            target = self._cache_file(legacy.stem)
+            try:
+                target.parent.mkdir(exist_ok=True)
+                legacy.replace(target)
+            except OSError:
+                legacy.unlink(missing_ok=True)
+
+        for cache_file in self.cache_dir.glob("*/*.json"):
+            try:
+                st = cache_file.stat()
+            except OSError:
+                continue
+            self._index[cache_file.stem] = IndexEntry(st.st_size, st.st_mtime)
+            self._total_size += st.st_size
+
+        self._evict()
+        logger.debug(f"File cache index built: {len(self._index)} entries, {self._total_size} bytes")
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits its size limit."""
+        if self._total_size <= self.max_size_bytes:
+            return
+        for key, entry in sorted(self._index.items(), key=lambda item: item[1].accessed_at):
+            if self._total_size <= self.max_size_bytes:
+                break
+            self._cache_file(key).unlink(missing_ok=True)
+            del self._index[key]
+            self._total_size -= entry.size
+            logger.debug(f"Evicted cache entry {key} ({entry.size} bytes)")
+
+    def _forget(self, key: str) -> None:
+        entry = self._index.pop(key, None)
+        if entry is not None:
+            self._total_size -= entry.size
+
     def get(self, url: str) -> Optional[CacheEntry]:
         """Get cached entry for URL."""
         key = self._generate_key(url)
-        cache_file = self.cache_dir / f"{key}.json"
+        cache_file = self._cache_file(key)
 
-        if not cache_file.exists():
-            logger.debug(f"Cache miss: {url}")
-            return None
+        with self._lock:
+            index = self._ensure_index()
+            if key not in index:
+                # Another process may have written the entry since the index was built
+                try:
+                    size = cache_file.stat().st_size
+                except OSError:
+                    logger.debug(f"Cache miss: {url}")
+                    return None
+                index[key] = IndexEntry(size, time.time())
+                self._total_size += size
 
-        try:
-            with open(cache_file, "r") as f:
-                data = json.load(f)
+            try:
+                with open(cache_file, "r") as f:
+                    data = json.load(f)
 
-            entry = CacheEntry(
-                content=data["content"], headers=data.get("headers", {}), cached_at=data.get("cached_at", time.time())
-            )
+                entry = CacheEntry(
+                    content=data["content"],
+                    headers=data.get("headers", {}),
+                    cached_at=data.get("cached_at", time.time()),
+                )
+            except (json.JSONDecodeError, KeyError, IOError):
+                logger.debug(f"Invalid cache file for {url}, removing")
+                # Invalid cache file, remove it
+                cache_file.unlink(missing_ok=True)
+                self._forget(key)
+                return None
+
+            # Record the access in memory and on disk so LRU order survives restarts
+            now = time.time()
+            index[key].accessed_at = now
+            try:
+                os.utime(cache_file, (now, now))
+            except OSError:
+                pass
             logger.debug(f"Cache hit: {url}")
             return entry
-        except (json.JSONDecodeError, KeyError, IOError):
-            logger.debug(f"Invalid cache file for {url}, removing")
-            # Invalid cache file, remove it
-            cache_file.unlink(missing_ok=True)
-            return None
+
+    def touch(self, url: str) -> None:
+        """Record an access served from elsewhere (such as a memory tier) in the index.
+
+        Only the in-memory index is updated, so this never touches the disk.
+        """
+        key = self._generate_key(url)
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is not None:
+                entry.accessed_at = time.time()
 
     def put(self, url: str, content: str, headers: Optional[Dict[str, str]] = None) -> None:
         """Put content in cache with HTTP headers."""
         logger.debug(f"Caching content for {url} ({len(content)} chars)")
         key = self._generate_key(url)
-        cache_file = self.cache_dir / f"{key}.json"
+        cache_file = self._cache_file(key)
 
         data = {"content": content, "headers": headers or {}, "cached_at": time.time()}
+        payload = json.dumps(data).encode("utf-8")
 
-        try:
-            with open(cache_file, "w") as f:
-                json.dump(data, f)
-        except IOError:
-            # Ignore cache write failures
-            pass
+        with self._lock:
+            self._ensure_index()
+            try:
+                cache_file.parent.mkdir(exist_ok=True)
+                fd, temp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=self.TEMP_SUFFIX)
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(payload)
+                    os.replace(temp_name, cache_file)
+                except BaseException:
+                    Path(temp_name).unlink(missing_ok=True)
+                    raise
+            except IOError:
+                # Ignore cache write failures
+                return
+
+            self._forget(key)
+            self._index[key] = IndexEntry(len(payload), time.time())
+            self._total_size += len(payload)
+            self._evict()
 
     def clear(self) -> None:
         """Clear all cached entries."""
-        for cache_file in self.cache_dir.glob("*.json"):
-            cache_file.unlink(missing_ok=True)
+        with self._lock:
+            for cache_file in self.cache_dir.glob("*.json"):
+                cache_file.unlink(missing_ok=True)
+            for cache_file in self.cache_dir.glob("*/*.json"):
+                cache_file.unlink(missing_ok=True)
+            self._index = {}
+            self._total_size = 0
+
+    async def get_async(self, url: str) -> Optional[CacheEntry]:
+        """Get cached entry for URL without blocking the event loop."""
+        return await asyncio.to_thread(self.get, url)
+
+    async def put_async(self, url: str, content: str, headers: Optional[Dict[str, str]] = None) -> None:
+        """Put content in cache without blocking the event loop."""
+        await asyncio.to_thread(self.put, url, content, headers)
+
+    async def clear_async(self) -> None:
+        """Clear all cached entries without blocking the event loop."""
+        await asyncio.to_thread(self.clear)
+
+
+class TieredFileCache:
+    """In-memory LRU tier layered over an on-disk FileCache.
+
+    Reads are served from memory when possible, so a hot entry costs a dict
+    lookup rather than a file open and JSON parse. Memory hits still refresh
+    the entry's access time in the disk tier's index, so hot entries are not
+    the first evicted from disk. Misses fall through to disk and promote the
+    entry into memory. Writes go to both tiers, so entries
+    demoted from memory to stay within ``max_memory_bytes`` remain available on
+    disk. Entries keep their original ``cached_at`` and headers in both tiers,
+    so ``CacheEntry.needs_validation()`` behaves identically wherever they came
+    from.
+    """
+
+    DEFAULT_MAX_MEMORY_BYTES = 16 * 1024 * 1024
+
+    def __init__(self, disk: FileCache, max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES):
+        self.disk = disk
+        self._memory: LRUCache[str, Tuple[CacheEntry, int]] = LRUCache(
+            max_size=max_memory_bytes, sizeof=lambda item: item[1]
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def cache_dir(self) -> Path:
+        """Directory of the underlying disk cache."""
+        return self.disk.cache_dir
+
+    @property
+    def max_memory_bytes(self) -> int:
+        """Byte budget for the memory tier."""
+        return self._memory.max_size or 0
+
+    @property
+    def memory_size(self) -> int:
+        """Bytes currently held in the memory tier."""
+        return self._memory.total_size
+
+    def _memory_get(self, url: str) -> Optional[CacheEntry]:
+        with self._lock:
+            item = self._memory.get(url)
+        return item[0] if item is not None else None
+
+    def _promote(self, url: str, entry: CacheEntry) -> None:
+        """Place an entry in the memory tier, demoting least recently used entries to fit."""
+        with self._lock:
+            self._memory.put(url, (entry, len(entry.content.encode("utf-8"))))
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Get cached entry for URL, promoting disk hits into memory."""
+        entry = self._memory_get(url)
+        if entry is None:
+            entry = self.disk.get(url)
+            if entry is not None:
+                self._promote(url, entry)
+        else:
+            # Keep hot entries at the recent end of the disk tier's LRU order
+            self.disk.touch(url)
+        return entry
+
+    def put(self, url: str, content: str, headers: Optional[Dict[str, str]] = None) -> None:
+        """Put content in both tiers."""
+        self._promote(url, CacheEntry(content=content, headers=dict(headers or {}), cached_at=time.time()))
+        self.disk.put(url, content, headers)
+
+    def clear(self) -> None:
+        """Clear both tiers."""
+        with self._lock:
+            self._memory.clear()
+        self.disk.clear()
+
+    async def get_async(self, url: str) -> Optional[CacheEntry]:
+        """Get cached entry for URL, only reading the disk tier on a memory miss."""
+        entry = self._memory_get(url)
+        if entry is None:
+            entry = await self.disk.get_async(url)
+            if entry is not None:
+                self._promote(url, entry)
+        else:
+            self.disk.touch(url)
+        return entry
+
+    async def put_async(self, url: str, content: str, headers: Optional[Dict[str, str]] = None) -> None:
+        """Put content in memory immediately and write it to disk off the event loop."""
+        self._promote(url, CacheEntry(content=content, headers=dict(headers or {}), cached_at=time.time()))
+        await self.disk.put_async(url, content, headers)
+
+    async def clear_async(self) -> None:
+        """Clear both tiers without blocking the event loop."""
+        with self._lock:
+            self._memory.clear()
+        await self.disk.clear_async()
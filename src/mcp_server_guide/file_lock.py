@@ -1,14 +1,45 @@
-"""File locking strategy for configuration updates."""
+"""File locking strategy for configuration updates.
+
+Locks are taken with an exclusive ``fcntl.flock`` on a ``.lock`` file next
+to the protected file. The kernel drops them when their holder exits, so
+they never go stale. Where ``flock`` is unavailable (Windows, or filesystems
+that do not support it) the lock is the exclusive creation of the ``.lock``
+file itself, with hostname/PID/mtime staleness checks.
+
+Waiting never blocks the event loop: a waiter retries with a short backoff,
+and is woken as soon as a lock on the same file is released in this process.
+
+Upgrade caveat: releases before ``flock`` locking only ever used the
+lock-file protocol. An older process cannot take the lock while a newer one
+holds it (the ``.lock`` file exists), but a newer process does not see the
+older one's lock-file as held, so the two do not exclude each other. Stop
+older servers sharing a config file before starting upgraded ones.
+"""
 
 import asyncio
+import errno
 import os
+import threading
 import time
+from collections import deque
 from pathlib import Path
-from typing import Any, Awaitable, Callable, TypeVar
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore[assignment]
 
 T = TypeVar("T")
 STALE_LOCK_SECONDS = 600  # 10 minutes
 
+# Bounds of the backoff between attempts while another process holds a lock
+LOCK_RETRY_MIN_SECONDS = 0.0005
+LOCK_RETRY_MAX_SECONDS = 0.02
+
+# flock errors meaning the filesystem does not support it, rather than contention
+_FLOCK_UNSUPPORTED = frozenset({errno.ENOLCK, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EINVAL, errno.ENOSYS})
+
 
 def is_process_running(pid: int) -> bool:
     """Check if a process with given PID is running."""
@@ -48,30 +79,200 @@ def is_lock_stale(lock_file: Path, current_hostname: str) -> bool:
         return True  # Error reading lock file, consider stale
 
 
+class _ReleaseNotifier:
+    """Wakes coroutines waiting for a lock file when a holder in this process releases it.
+
+    Waiters may belong to different event loops (or threads), so each is a
+    future resolved through its own loop.
+    """
+
+    def __init__(self) -> None:
+        self._waiters: Dict[str, Deque["asyncio.Future[None]"]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, lock_file: Path) -> "asyncio.Future[None]":
+        waiter = asyncio.get_running_loop().create_future()
+        with self._lock:
+            self._waiters.setdefault(str(lock_file), deque()).append(waiter)
+        return waiter
+
+    def unregister(self, lock_file: Path, waiter: "asyncio.Future[None]") -> None:
+        with self._lock:
+            waiters = self._waiters.get(str(lock_file))
+            if waiters is not None and waiter in waiters:
+                waiters.remove(waiter)
+                if not waiters:
+                    del self._waiters[str(lock_file)]
+
+    def notify(self, lock_file: Path) -> None:
+        # Wake every waiter; whichever retries first takes the lock
+        with self._lock:
+            waiters = self._waiters.pop(str(lock_file), None)
+        for waiter in waiters or ():
+            try:
+                waiter.get_loop().call_soon_threadsafe(_resolve, waiter)
+            except RuntimeError:
+                # The waiter's event loop has closed
+                continue
+
+
+def _resolve(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+_release_notifier = _ReleaseNotifier()
+
+
+class _FlockUnsupported(Exception):
+    """Raised when the lock file's filesystem does not support ``flock``."""
+
+
+def _try_flock(lock_file: Path) -> Optional[int]:
+    """Try once to flock the lock file, returning the locked descriptor or None if it is held."""
+    if fcntl is None:
+        raise _FlockUnsupported
+    fd = os.open(lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    except OSError as e:
+        os.close(fd)
+        if e.errno in _FLOCK_UNSUPPORTED:
+            raise _FlockUnsupported from e
+        raise
+
+    # The previous holder may have removed the file between our open and flock,
+    # in which case we locked an orphaned inode and must start over
+    try:
+        current = os.stat(lock_file)
+    except FileNotFoundError:
+        current = None
+    st = os.fstat(fd)
+    if current is None or (current.st_dev, current.st_ino) != (st.st_dev, st.st_ino):
+        os.close(fd)
+        return None
+    return fd
+
+
+def _release_flock(fd: int, lock_file: Path) -> None:
+    """Release a flock, removing the lock file unless it has been replaced meanwhile."""
+    try:
+        current = os.stat(lock_file)
+        st = os.fstat(fd)
+        if (current.st_dev, current.st_ino) == (st.st_dev, st.st_ino):
+            os.unlink(lock_file)
+    except FileNotFoundError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _try_lock_file(lock_file: Path, hostname: str, pid: int) -> bool:
+    """Try once to take the lock by creating the lock file, clearing it first if stale."""
+    # Attempt to create the lock file
+    try:
+        with open(lock_file, "x") as lockfile:
+            lockfile.write(f"{hostname}:{pid}")
+        return True
+    except FileExistsError:
+        # Check if the lock is stale
+        try:
+            if is_lock_stale(lock_file, hostname):
+                lock_file.unlink(missing_ok=True)
+        except Exception:
+            # If we can't read the lock file, treat as stale
+            lock_file.unlink(missing_ok=True)
+        return False
+
+
+async def _wait_for_release(lock_file: Path, waiter: "asyncio.Future[None]", delay: float) -> None:
+    """Wait until a holder in this process releases the lock, or ``delay`` seconds pass."""
+    try:
+        await asyncio.wait_for(waiter, timeout=delay)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        _release_notifier.unregister(lock_file, waiter)
+
+
+def _lock_file_for(file_path: Path) -> Path:
+    return file_path.with_suffix(f"{file_path.suffix}.lock")
+
+
+def _holder() -> Tuple[str, int]:
+    return os.uname().nodename.split(".")[0], os.getpid()
+
+
+def _try_acquire(lock_file: Path, use_flock: bool) -> Tuple[bool, Optional[int], bool]:
+    """Try once to take the lock, returning ``(acquired, flock descriptor, use_flock)``.
+
+    ``use_flock`` turns False for good once the filesystem turns out not to
+    support ``flock``, and the lock-file protocol is used instead.
+    """
+    if use_flock:
+        try:
+            fd = _try_flock(lock_file)
+        except _FlockUnsupported:
+            use_flock = False
+        else:
+            return fd is not None, fd, use_flock
+    return _try_lock_file(lock_file, *_holder()), None, use_flock
+
+
+def _record_holder(fd: Optional[int]) -> None:
+    if fd is not None:
+        # Record the holder, as the lock-file protocol does, for anyone inspecting the lock
+        os.ftruncate(fd, 0)
+        os.write(fd, "{}:{}".format(*_holder()).encode())
+
+
+def _release(lock_file: Path, fd: Optional[int]) -> None:
+    if fd is not None:
+        _release_flock(fd, lock_file)
+    else:
+        lock_file.unlink(missing_ok=True)
+    _release_notifier.notify(lock_file)
+
+
 async def lock_update(file_path: Path, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
     """Execute function with file locking to prevent concurrent updates."""
-    pid = os.getpid()
-    hostname = os.uname().nodename.split(".")[0]
-    lock_file = file_path.with_suffix(f"{file_path.suffix}.lock")
+    lock_file = _lock_file_for(file_path)
 
+    use_flock = fcntl is not None
+    delay = LOCK_RETRY_MIN_SECONDS
     while True:
-        # Attempt to create the lock file
-        try:
-            with open(lock_file, "x") as lockfile:
-                lockfile.write(f"{hostname}:{pid}")
+        # Register before trying, so a release between the attempt and the wait is not missed
+        waiter = _release_notifier.register(lock_file)
+        acquired, fd, use_flock = _try_acquire(lock_file, use_flock)
+        if acquired:
+            _release_notifier.unregister(lock_file, waiter)
             break
-        except FileExistsError:
-            # Check if the lock is stale
-            try:
-                if is_lock_stale(lock_file, hostname):
-                    lock_file.unlink(missing_ok=True)
-                else:
-                    await asyncio.sleep(1)
-            except Exception:
-                # If we can't read the lock file, treat as stale
-                lock_file.unlink(missing_ok=True)
+        await _wait_for_release(lock_file, waiter, delay)
+        delay = min(delay * 2, LOCK_RETRY_MAX_SECONDS)
 
     try:
+        _record_holder(fd)
         return await func(file_path, *args, **kwargs)
     finally:
-        lock_file.unlink(missing_ok=True)
+        _release(lock_file, fd)
+
+
+def try_lock_update(file_path: Path, func: Callable[..., T], *args: Any, **kwargs: Any) -> Optional[T]:
+    """Run a synchronous ``func`` under the same lock as ``lock_update``, if it is free right now.
+
+    Never waits: returns None without calling ``func`` when the lock is held.
+    Meant for best-effort writes from synchronous code, such as refreshing a
+    cache file that the next reader can rebuild anyway.
+    """
+    lock_file = _lock_file_for(file_path)
+    acquired, fd, _ = _try_acquire(lock_file, fcntl is not None)
+    if not acquired:
+        return None
+    try:
+        _record_holder(fd)
+        return func(file_path, *args, **kwargs)
+    finally:
+        _release(lock_file, fd)
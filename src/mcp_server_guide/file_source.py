@@ -1,14 +1,24 @@
 """File source abstraction for hybrid file access with HTTP-aware caching."""
 
+import asyncio
+import time
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, Coroutine, Dict, Optional, Tuple
 
 import aiofiles
 
+from .logging_config import get_logger
+
 if TYPE_CHECKING:
-    from .file_cache import FileCache
+    from .file_cache import CacheEntry, FileCache, TieredFileCache
+    from .http.async_client import HTTPClientPool
+
+logger = get_logger()
+
+# In-flight fetch key: URL plus sorted auth headers
+FetchKey = Tuple[str, Tuple[Tuple[str, str], ...]]
 
 
 class FileSourceType(Enum):
@@ -77,12 +87,38 @@ class FileSource:
 class FileAccessor:
     """File accessor with HTTP-aware caching."""
 
-    def __init__(self, cache: Optional["FileCache"] = None, cache_dir: Optional[str] = None):
-        if cache_dir and not cache:
-            from .file_cache import FileCache
+    def __init__(
+        self,
+        cache: Optional["FileCache | TieredFileCache"] = None,
+        cache_dir: Optional[str] = None,
+        max_memory_bytes: Optional[int] = None,
+        http_pool: Optional["HTTPClientPool"] = None,
+        stale_while_revalidate: float = 0.0,
+        refresh_backoff: float = 5.0,
+        max_refresh_backoff: float = 300.0,
+    ):
+        from .file_cache import FileCache, TieredFileCache
 
+        if cache_dir and not cache:
             cache = FileCache(cache_dir)
+        if isinstance(cache, FileCache):
+            # Keep hot entries in memory in front of the disk cache
+            if max_memory_bytes is None:
+                cache = TieredFileCache(cache)
+            else:
+                cache = TieredFileCache(cache, max_memory_bytes)
         self.cache = cache
+        # Shared HTTP session pool; without one each fetch opens its own session
+        self.http_pool = http_pool
+        # Entries expired less than this many seconds ago are served stale while revalidating
+        self.stale_while_revalidate = stale_while_revalidate
+        self.refresh_backoff = refresh_backoff
+        self.max_refresh_backoff = max_refresh_backoff
+        # In-flight HTTP fetches keyed by URL and auth headers
+        self._inflight: Dict[FetchKey, "asyncio.Task[str]"] = {}
+        # Consecutive background refresh failures and when to retry, per URL
+        self._refresh_failures: Dict[str, int] = {}
+        self._refresh_retry_at: Dict[str, float] = {}
 
     def resolve_path(self, relative_path: str, source: FileSource) -> str:
         """Resolve relative path against source base path."""
@@ -120,70 +156,125 @@ class FileAccessor:
 
     async def _read_http_file(self, relative_path: str, source: FileSource) -> str:
         """Read HTTP file with caching support."""
-        from .http.async_client import AsyncHTTPClient
-
         full_url = self.resolve_path(relative_path, source)
 
         # Check cache if enabled
         cached_entry = None
         if source.cache_enabled and self.cache:
-            cached_entry = self.cache.get(full_url)
+            cached_entry = await self.cache.get_async(full_url)
 
         # If we have cached content, try conditional request
         if cached_entry and not cached_entry.needs_validation():
             # Cache is fresh, use it
             cached_content: str = cached_entry.content
             return cached_content
-        elif cached_entry:
-            # Cache needs validation, make conditional request
+
+        key = (full_url, tuple(sorted((source.auth_headers or {}).items())))
+
+        # Within the stale window, serve stale content and revalidate in the background
+        if (
+            cached_entry
+            and self.stale_while_revalidate > 0
+            and time.time() - cached_entry.expires_at <= self.stale_while_revalidate
+        ):
+            if key not in self._inflight and time.monotonic() >= self._refresh_retry_at.get(full_url, 0.0):
+                self._start_fetch(key, self._refresh_http_file(full_url, source, cached_entry))
+            stale_content: str = cached_entry.content
+            return stale_content
+
+        # Concurrent misses and revalidations for the same URL share one fetch
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._start_fetch(key, self._fetch_http_file(full_url, source, cached_entry))
+        # Shield so a cancelled waiter does not cancel the fetch for everyone else
+        return await asyncio.shield(task)
+
+    def _start_fetch(self, key: FetchKey, fetch: Coroutine[Any, Any, str]) -> "asyncio.Task[str]":
+        """Run a fetch as a task registered in the in-flight table."""
+        task = asyncio.ensure_future(fetch)
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._fetch_finished(key, done))
+        return task
+
+    def _fetch_finished(self, key: FetchKey, task: "asyncio.Task[str]") -> None:
+        """Forget a completed in-flight fetch."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every waiter was cancelled
+            task.exception()
+
+    async def _refresh_http_file(self, full_url: str, source: FileSource, cached_entry: "CacheEntry") -> str:
+        """Revalidate a stale entry in the background, backing off after failures."""
+        try:
+            content = await self._revalidate_http_file(full_url, source, cached_entry)
+        except Exception as e:
+            failures = self._refresh_failures.get(full_url, 0) + 1
+            delay = min(self.refresh_backoff * 2 ** (failures - 1), self.max_refresh_backoff)
+            self._refresh_failures[full_url] = failures
+            self._refresh_retry_at[full_url] = time.monotonic() + delay
+            logger.warning(f"Background refresh of {full_url} failed ({e}); retrying in {delay:.0f}s")
+            stale_content: str = cached_entry.content
+            return stale_content
+        self._refresh_failures.pop(full_url, None)
+        self._refresh_retry_at.pop(full_url, None)
+        return content
+
+    async def _fetch_http_file(self, full_url: str, source: FileSource, cached_entry: Optional["CacheEntry"]) -> str:
+        """Fetch an HTTP file, revalidating the cached entry if there is one."""
+        from .http.async_client import AsyncHTTPClient
+
+        if cached_entry:
             try:
-                async with AsyncHTTPClient() as client:
-                    # Try conditional request if client supports it
-                    if hasattr(client, "get_conditional"):
-                        # Build conditional headers from cached entry
-                        conditional_headers = dict(source.auth_headers) if source.auth_headers else {}
-                        if cached_entry.last_modified:
-                            conditional_headers["if_modified_since"] = cached_entry.last_modified
-                        if cached_entry.etag:
-                            conditional_headers["if_none_match"] = cached_entry.etag
-
-                        response = await client.get_conditional(full_url, **conditional_headers)
-                        if response is None:  # 304 Not Modified
-                            not_modified_content: str = cached_entry.content
-                            return not_modified_content
-                        content: str = response.content if hasattr(response, "content") else str(response)
-                    else:
-                        # Fallback to regular GET
-                        response = await client.get(full_url, headers=source.auth_headers)
-                        content = response.content if hasattr(response, "content") else str(response)
-
-                    # Update cache
-                    if source.cache_enabled and self.cache:
-                        response_headers = response.headers if hasattr(response, "headers") else {}
-                        self.cache.put(full_url, content, headers=response_headers)
-
-                    return content
+                return await self._revalidate_http_file(full_url, source, cached_entry)
             except Exception:
                 # If HTTP fails and we have cached content, use it
-                if cached_entry:
-                    error_fallback_content: str = cached_entry.content
-                    return error_fallback_content
-                raise
-        else:
-            # No cache, make fresh request
-            try:
-                async with AsyncHTTPClient() as client:
-                    response = await client.get(full_url, headers=source.auth_headers)
-                    content = response.content if hasattr(response, "content") else response
-
-                    # Cache the result
-                    if source.cache_enabled and self.cache:
-                        response_headers = response.headers if hasattr(response, "headers") else {}
-                        self.cache.put(full_url, content, headers=response_headers)
-
-                    return content
-            except Exception as e:
-                raise RuntimeError(f"Failed to read HTTP file {full_url}: {e}") from e
+                error_fallback_content: str = cached_entry.content
+                return error_fallback_content
+
+        # No cache, make fresh request
+        try:
+            async with AsyncHTTPClient(pool=self.http_pool) as client:
+                response = await client.get(full_url, headers=source.auth_headers)
+
+                # Cache the result
+                if source.cache_enabled and self.cache:
+                    await self.cache.put_async(full_url, response.content, headers=response.headers)
+
+                return response.content
+        except Exception as e:
+            raise RuntimeError(f"Failed to read HTTP file {full_url}: {e}") from e
+
+    async def _revalidate_http_file(self, full_url: str, source: FileSource, cached_entry: "CacheEntry") -> str:
+        """Make a conditional request for a cached entry and update the cache."""
+        from .http.async_client import AsyncHTTPClient
+
+        async with AsyncHTTPClient(pool=self.http_pool) as client:
+            response = await client.get_conditional(
+                full_url,
+                if_modified_since=cached_entry.last_modified,
+                if_none_match=cached_entry.etag,
+                headers=source.auth_headers,
+            )
+            if response is None:  # 304 Not Modified
+                # Restart the freshness window so the next reads skip revalidation
+                if source.cache_enabled and self.cache:
+                    await self.cache.put_async(full_url, cached_entry.content, headers=cached_entry.headers)
+                not_modified_content: str = cached_entry.content
+                return not_modified_content
+
+            # Update cache
+            if source.cache_enabled and self.cache:
+                await self.cache.put_async(full_url, response.content, headers=response.headers)
+
+            return response.content
+
+    async def cleanup(self) -> None:
+        """Cancel outstanding fetches, including background refreshes."""
+        tasks = list(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     def file_exists(self, relative_path: str, source: FileSource) -> bool:
         """Check if file exists."""
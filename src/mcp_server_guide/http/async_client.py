@@ -1,6 +1,7 @@
 """Async HTTP client with security features."""
 
 import asyncio
+from dataclasses import dataclass
 from types import TracebackType
 from typing import Any, Dict, Optional, Type
 from urllib.parse import urlparse
@@ -12,27 +13,106 @@ from ..logging_config import get_logger
 logger = get_logger()
 
 
+@dataclass
+class HTTPResponse:
+    """Response to a GET request.
+
+    Header names are lower-cased so they can be stored directly as cache
+    validators (``etag``, ``last-modified``, ``cache-control``).
+    """
+
+    status: int
+    headers: Dict[str, str]
+    content: str
+
+
+class HTTPClientPool:
+    """Long-lived aiohttp session shared by every AsyncHTTPClient bound to it.
+
+    Keeping one session (and its connector) alive lets TLS sessions, DNS
+    lookups and keep-alive connections be reused across requests. The session
+    is created lazily on first use and recreated if it has been closed; the
+    owner must call ``close()`` on shutdown.
+    """
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: int = 300,
+    ):
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def closed(self) -> bool:
+        """Whether the pool currently has no open session."""
+        return self._session is None or self._session.closed
+
+    async def session(self) -> aiohttp.ClientSession:
+        """Get the shared session, creating it on first use."""
+        session = self._session
+        if session is None or session.closed:
+            async with self._lock:
+                session = self._session
+                if session is None or session.closed:
+                    connector = aiohttp.TCPConnector(
+                        limit=self.limit,
+                        limit_per_host=self.limit_per_host,
+                        keepalive_timeout=self.keepalive_timeout,
+                        ttl_dns_cache=self.dns_cache_ttl,
+                    )
+                    session = aiohttp.ClientSession(timeout=self.timeout, connector=connector)
+                    self._session = session
+                    logger.debug("Opened pooled HTTP session")
+        return session
+
+    async def close(self) -> None:
+        """Close the shared session and its pooled connections."""
+        async with self._lock:
+            if self._session is not None:
+                await self._session.close()
+                self._session = None
+                logger.debug("Closed pooled HTTP session")
+
+
 class AsyncHTTPClient:
-    """Async HTTP client with SSRF protection and rate limiting."""
+    """Async HTTP client with SSRF protection and rate limiting.
+
+    With a ``pool`` the client borrows the pool's shared session and leaves
+    it open on exit; without one it owns a short-lived session of its own.
+    """
 
-    def __init__(self, timeout: int = 30, max_redirects: int = 5):
+    def __init__(self, timeout: int = 30, max_redirects: int = 5, pool: Optional[HTTPClientPool] = None):
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.max_redirects = max_redirects
+        self.pool = pool
         self._session: Optional[aiohttp.ClientSession] = None
 
     async def __aenter__(self) -> "AsyncHTTPClient":
         """Async context manager entry."""
-        self._session = aiohttp.ClientSession(
-            timeout=self.timeout, connector=aiohttp.TCPConnector(limit=10, limit_per_host=5)
-        )
+        if self.pool is not None:
+            self._session = await self.pool.session()
+        else:
+            self._session = aiohttp.ClientSession(
+                timeout=self.timeout, connector=aiohttp.TCPConnector(limit=10, limit_per_host=5)
+            )
         return self
 
     async def __aexit__(
         self, exc_type: Optional[Type[BaseException]], exc_val: Optional[BaseException], exc_tb: Optional[TracebackType]
     ) -> None:
         """Async context manager exit."""
-        if self._session:
+        if self._session and self.pool is None:
             await self._session.close()
+        self._session = None
 
     def _validate_url(self, url: str) -> None:
         """Validate URL for SSRF protection."""
@@ -49,8 +129,30 @@ class AsyncHTTPClient:
         if hostname in ("localhost", "127.0.0.1", "::1"):
             raise ValueError("Access to localhost is not allowed")
 
-    async def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> str:
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> HTTPResponse:
         """Perform async GET request."""
+        return await self._get(url, headers)
+
+    async def get_conditional(
+        self,
+        url: str,
+        if_modified_since: Optional[str] = None,
+        if_none_match: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[HTTPResponse]:
+        """Perform conditional GET request. Returns None for 304 Not Modified."""
+        conditional_headers = dict(headers or {})
+        if if_modified_since:
+            conditional_headers["If-Modified-Since"] = if_modified_since
+        if if_none_match:
+            conditional_headers["If-None-Match"] = if_none_match
+        response = await self._get(url, conditional_headers or None)
+        if response.status == 304:
+            logger.debug(f"HTTP 304 Not Modified: {url}")
+            return None
+        return response
+
+    async def _get(self, url: str, headers: Optional[Dict[str, str]]) -> HTTPResponse:
         self._validate_url(url)
 
         if not self._session:
@@ -63,7 +165,11 @@ class AsyncHTTPClient:
                 response.raise_for_status()
                 content = await response.text()
                 logger.debug(f"Received {len(content)} characters from {url}")
-                return content
+                return HTTPResponse(
+                    status=response.status,
+                    headers={key.lower(): value for key, value in response.headers.items()},
+                    content=content,
+                )
         except aiohttp.ClientError as e:
             logger.error(f"HTTP request failed: {e}")
             raise
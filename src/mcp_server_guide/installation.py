@@ -1,12 +1,13 @@
 """Shared installation module for both auto-init and manual install."""
 
+import asyncio
 from pathlib import Path
 
-import aiofiles
 import yaml
 
 from .exceptions import ConfigurationError
 from .models.config_file import get_default_docroot
+from .utils.atomic_write import write_text_atomic
 from .utils.installation_utils import copy_templates, get_templates_dir
 
 
@@ -66,8 +67,8 @@ async def create_default_config(config_path: Path, docroot: Path) -> None:
         config_data = {"docroot": str(docroot.resolve())}
         yaml_content = yaml.dump(config_data, default_flow_style=False, sort_keys=False)
 
-        async with aiofiles.open(config_path, "w") as f:
-            await f.write(yaml_content)
+        # Replace atomically, so lock-free config readers never see a partial file
+        await asyncio.to_thread(write_text_atomic, config_path, yaml_content, durable=True)
 
     except (OSError, yaml.YAMLError) as e:
         raise ConfigurationError(f"Failed to create config file: {e}") from e
@@ -3,7 +3,12 @@
 from typing import Any, Dict, Optional
 
 from ..models.project_config import ProjectConfig
-from ..tools.document_tools import create_mcp_document, delete_mcp_document, list_mcp_documents, update_mcp_document
+from ..tools.document_tools import (
+    create_mcp_document,
+    delete_mcp_document,
+    list_mcp_documents,
+    update_mcp_document,
+)
 from .operation_base import BaseOperation
 
 
@@ -58,8 +63,14 @@ class DocumentListOperation(BaseOperation):
     category_dir: str
     mime_type: Optional[str] = None
     source_type: Optional[str] = None
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
 
     async def execute(self, config: ProjectConfig) -> Dict[str, Any]:
         return await list_mcp_documents(
-            category_dir=self.category_dir, mime_type=self.mime_type, source_type=self.source_type
+            category_dir=self.category_dir,
+            mime_type=self.mime_type,
+            source_type=self.source_type,
+            limit=self.limit,
+            cursor=self.cursor,
         )
@@ -1,8 +1,10 @@
 """Persistent project configuration (Issue 004)."""
 
+import asyncio
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 import yaml
 
@@ -12,6 +14,9 @@ from .models.config_file import ConfigFile
 from .models.project_config import ProjectConfig
 from .models.speckit_config import SpecKitConfig
 from .path_resolver import LazyPath
+from .utils.atomic_write import write_text_atomic
+from .utils.lru_cache import CacheStats, LRUCache
+from .utils.stat_stamp import FileStamp, stat_stamp
 
 __all__ = ["ProjectConfig", "ProjectConfigManager"]
 
@@ -21,6 +26,47 @@ logger = get_logger(__name__)
 yaml.add_representer(datetime, lambda dumper, data: dumper.represent_scalar("tag:yaml.org,2002:str", data.isoformat()))
 
 
+def _config_stamp(config_file: Path) -> Optional[FileStamp]:
+    """Stat the config file for comparison with a cached parse, or None if it is missing."""
+    try:
+        st = os.stat(config_file)
+    except OSError:
+        return None
+    return stat_stamp(st)
+
+
+class ParsedConfigCache:
+    """The most recently parsed config file, valid while the file's stat is unchanged.
+
+    Reloading an unchanged file, for example when switching projects, reuses
+    the validated ``ConfigFile`` instead of parsing and validating the YAML
+    again; a change by any process moves the file's mtime or size and forces
+    a fresh parse. The cached model is shared, so callers copy whatever they
+    hand out or modify.
+    """
+
+    def __init__(self) -> None:
+        self._entries: LRUCache[Path, Tuple[FileStamp, ConfigFile]] = LRUCache(max_entries=1)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit/miss/invalidation counters."""
+        return self._entries.stats
+
+    def get(self, config_file: Path) -> Optional[ConfigFile]:
+        """Return the cached config if it was parsed from this file in its current state."""
+        entry = self._entries.get(config_file, lambda e: e[0] == _config_stamp(config_file))
+        return entry[1] if entry is not None else None
+
+    def put(self, config_file: Path, stamp: FileStamp, config_data: ConfigFile) -> None:
+        """Remember a config parsed from (or just written to) a file with this stamp."""
+        self._entries.put(config_file, (stamp, config_data))
+
+    def invalidate(self) -> None:
+        """Forget the cached config."""
+        self._entries.invalidate_all()
+
+
 class ProjectConfigManager:
     """Manager for persistent project configuration."""
 
@@ -28,6 +74,7 @@ class ProjectConfigManager:
         """Initialize project config manager."""
         self._config_filename: Optional[Path] = None  # Lazy initialization
         self._docroot: Optional[LazyPath] = None  # Cached docroot from config file
+        self._config_cache = ParsedConfigCache()  # Last parsed config file
 
     def set_config_filename(self, filename: str | LazyPath | Path | None) -> None:
         """Set the config filename explicitly."""
@@ -54,7 +101,7 @@ class ProjectConfigManager:
         config_file.parent.mkdir(parents=True, exist_ok=True)
 
         # Use lock_update for proper file locking
-        docroot = await lock_update(config_file, _save_config_locked, project_name, config)
+        docroot = await lock_update(config_file, _save_config_locked, project_name, config, cache=self._config_cache)
 
         # Cache the docroot after successful save (preserve new functionality)
         from .models.config_file import get_default_docroot
@@ -82,8 +129,12 @@ class ProjectConfigManager:
 
         config_file = Path(self.get_config_filename())
 
-        # Use file locking to ensure thread-safe reads
-        result = await lock_update(config_file, _load_config_locked, project_name_str)
+        if config_file.exists():
+            # Saves replace the file atomically, so reads need no lock
+            result = await _load_config_locked(config_file, project_name_str, cache=self._config_cache)
+        else:
+            # Loading will create the file, which must not race with other writers
+            result = await lock_update(config_file, _load_config_locked, project_name_str, cache=self._config_cache)
         project_config, docroot = result
         # Update cached docroot
         self._docroot = docroot
@@ -106,23 +157,17 @@ class ProjectConfigManager:
             if not file_path.exists():
                 return []
             try:
-                import aiofiles
-
-                async with aiofiles.open(file_path, "r") as f:
-                    content = await f.read()
-                    data = yaml.safe_load(content) or {}
-                config_data = ConfigFile(**data)
+                config_data = await _read_config_file(file_path, self._config_cache)
                 return list(config_data.projects.keys())
             except Exception as e:
                 logger.exception(f"Failed to load projects from config file {file_path}: {e}")
                 return []
 
-        return await lock_update(config_file, _load_projects)
+        # Saves replace the file atomically, so reads need no lock
+        return await _load_projects(config_file)
 
     async def get_speckit_config(self) -> Optional["SpecKitConfig"]:
         """Get SpecKit configuration from global config file."""
-        from .file_lock import lock_update
-
         config_file = self.get_config_filename()
 
         async def _load_speckit(file_path: Path) -> Optional["SpecKitConfig"]:
@@ -130,17 +175,13 @@ class ProjectConfigManager:
                 return None
 
             try:
-                import aiofiles
-
-                async with aiofiles.open(file_path, "r") as f:
-                    content = await f.read()
-                    data = yaml.safe_load(content) or {}
-                config_data = ConfigFile(**data)
-                return config_data.speckit
+                config_data = await _read_config_file(file_path, self._config_cache)
+                return config_data.speckit.model_copy(deep=True) if config_data.speckit else None
             except Exception:
                 return None
 
-        return await lock_update(config_file, _load_speckit)
+        # Saves replace the file atomically, so reads need no lock
+        return await _load_speckit(config_file)
 
     async def set_speckit_config(self, speckit_config: "SpecKitConfig") -> None:
         """Set SpecKit configuration in global config file."""
@@ -173,15 +214,13 @@ class ProjectConfigManager:
             # Update speckit config
             config_data.speckit = config
 
-            # Save back to file
+            # Save back to file, replacing it atomically so lock-free readers never see a partial write
             file_path.parent.mkdir(parents=True, exist_ok=True)
-            import aiofiles
-
-            async with aiofiles.open(file_path, "w") as f:
-                yaml_content = yaml.dump(config_data.model_dump(exclude_none=True), default_flow_style=False)
-                await f.write(yaml_content)
+            yaml_content = yaml.dump(config_data.model_dump(exclude_none=True), default_flow_style=False)
+            await asyncio.to_thread(write_text_atomic, file_path, yaml_content, durable=True)
 
         await lock_update(config_file, _save_speckit, speckit_config)
+        self._config_cache.invalidate()
 
 
 def _get_global_config_path() -> Path:
@@ -191,56 +230,57 @@ def _get_global_config_path() -> Path:
     return get_default_config_file()
 
 
-async def _save_config_locked(config_file: Path, project_name: str, config: ProjectConfig) -> str:
-    """Save project configuration with file locking (internal function)."""
-    try:
-        # Load existing config file or create new one
-        if config_file.exists():
-            try:
-                import aiofiles
+async def _read_config_file(config_file: Path, cache: Optional[ParsedConfigCache] = None) -> ConfigFile:
+    """Read, parse and validate the config file, reusing ``cache`` while the file is unchanged.
 
-                async with aiofiles.open(config_file, "r") as f:
-                    content = await f.read()
-                    data = yaml.safe_load(content) or {}
-            except yaml.YAMLError:
-                # If existing file is corrupted, start fresh
-                data = {}
-        else:
-            # Config file doesn't exist - trigger auto-initialization
-            from .installation import auto_initialize_new_installation
+    Raises whatever reading, YAML parsing or validation raises. The returned
+    model may be the cached one and must not be modified.
+    """
+    if cache is not None:
+        cached = cache.get(config_file)
+        if cached is not None:
+            return cached
 
-            await auto_initialize_new_installation(config_file)
+    # Stat before reading, so a concurrent rewrite can only make the cached entry miss
+    stamp = _config_stamp(config_file)
+    import aiofiles
 
-            # Load the newly created config
-            import aiofiles
+    async with aiofiles.open(config_file, "r") as f:
+        content = await f.read()
+        data = yaml.safe_load(content) or {}
+    config_data = ConfigFile(**data)
+    if cache is not None and stamp is not None:
+        cache.put(config_file, stamp, config_data)
+    return config_data
 
-            async with aiofiles.open(config_file, "r") as f:
-                content = await f.read()
-                data = yaml.safe_load(content) or {}
-
-        # Create ConfigFile instance
-        try:
-            config_data = ConfigFile(**data)
-        except Exception:
-            # If existing data is invalid, start fresh with proper default
-            from .models.config_file import get_default_docroot
 
-            config_data = ConfigFile(
-                projects={}, docroot=get_default_docroot(), speckit=SpecKitConfig(enabled=False, url="", version="")
-            )
+async def _save_config_locked(
+    config_file: Path, project_name: str, config: ProjectConfig, cache: Optional[ParsedConfigCache] = None
+) -> str:
+    """Save project configuration with file locking (internal function)."""
+    try:
+        cached = cache.get(config_file) if cache is not None else None
+        if cached is not None:
+            # Modify a copy, so a failed write leaves the cached config intact
+            config_data = cached.model_copy(deep=True)
+        else:
+            config_data = await _load_config_for_update(config_file)
 
-        # Update the specific project
-        config_data.projects[project_name] = config
+        # Update the specific project (copied, so later changes by the caller cannot reach the cache)
+        config_data.projects[project_name] = config.model_copy(deep=True)
 
-        # Save back to file
+        # Save back to file, replacing it atomically so lock-free readers never see a partial write
         try:
-            import aiofiles
-
-            async with aiofiles.open(config_file, "w") as f:
-                yaml_content = yaml.dump(config_data.model_dump(), default_flow_style=False, sort_keys=False)
-                await f.write(yaml_content)
+            yaml_content = yaml.dump(config_data.model_dump(), default_flow_style=False, sort_keys=False)
         except yaml.YAMLError as e:
             raise ValueError("Cannot serialize configuration to YAML") from e
+        await asyncio.to_thread(write_text_atomic, config_file, yaml_content, durable=True)
+
+        # The file now holds exactly config_data, so the next load needs no parse
+        if cache is not None:
+            stamp = _config_stamp(config_file)
+            if stamp is not None:
+                cache.put(config_file, stamp, config_data)
 
         # Return docroot
         from .models.config_file import get_default_docroot
@@ -254,10 +294,52 @@ async def _save_config_locked(config_file: Path, project_name: str, config: Proj
         raise
 
 
+async def _load_config_for_update(config_file: Path) -> ConfigFile:
+    """Load the existing config file for modification, starting fresh if it is missing or invalid."""
+    # Load existing config file or create new one
+    if config_file.exists():
+        try:
+            import aiofiles
+
+            async with aiofiles.open(config_file, "r") as f:
+                content = await f.read()
+                data = yaml.safe_load(content) or {}
+        except yaml.YAMLError:
+            # If existing file is corrupted, start fresh
+            data = {}
+    else:
+        # Config file doesn't exist - trigger auto-initialization
+        from .installation import auto_initialize_new_installation
+
+        await auto_initialize_new_installation(config_file)
+
+        # Load the newly created config
+        import aiofiles
+
+        async with aiofiles.open(config_file, "r") as f:
+            content = await f.read()
+            data = yaml.safe_load(content) or {}
+
+    # Create ConfigFile instance
+    try:
+        return ConfigFile(**data)
+    except Exception:
+        # If existing data is invalid, start fresh with proper default
+        from .models.config_file import get_default_docroot
+
+        return ConfigFile(
+            projects={}, docroot=get_default_docroot(), speckit=SpecKitConfig(enabled=False, url="", version="")
+        )
+
+
 async def _load_config_locked(
-    config_file: Path, project_name: str
+    config_file: Path, project_name: str, cache: Optional[ParsedConfigCache] = None
 ) -> tuple[Optional[ProjectConfig], Optional[LazyPath]]:
-    """Load project configuration with file locking (internal function)."""
+    """Load project configuration (internal function).
+
+    Reading needs no lock; callers take it when the file is missing and
+    will be created.
+    """
     logger = get_logger(__name__)
 
     try:
@@ -268,20 +350,13 @@ async def _load_config_locked(
             await auto_initialize_new_installation(config_file)
 
         try:
-            import aiofiles
-
-            async with aiofiles.open(config_file, "r") as f:
-                content = await f.read()
-                data = yaml.safe_load(content) or {}
+            config_data = await _read_config_file(config_file, cache)
         except yaml.YAMLError as e:
             logger.warning(f"Failed to parse YAML config for {project_name}: {e}")
             return None, None
         except (OSError, IOError) as e:
             logger.warning(f"Failed to read config file for {project_name}: {e}")
             return None, None
-
-        try:
-            config_data = ConfigFile(**data)
         except Exception as e:
             logger.warning(f"Invalid config data for {project_name}: {e}")
             return None, None
@@ -289,7 +364,8 @@ async def _load_config_locked(
         project_config = config_data.projects.get(project_name)
         docroot = LazyPath(config_data.docroot) if config_data.docroot else None
 
-        return project_config, docroot
+        # Hand out a copy; the parsed config may be cached
+        return (project_config.model_copy(deep=True) if project_config else None), docroot
     except Exception as e:
         logger.error(f"Unexpected error loading config for {project_name}: {e}")
         return None, None
@@ -1,52 +1,288 @@
 """Thread-safe category queue with supervised task management."""
 
 import asyncio
+import queue
 import threading
-from queue import Queue
-from typing import Optional
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Deque, Dict, Optional, Set, Union
 
 from ..logging_config import get_logger
+from ..services.external_sync import _cleanup_category_documents
+
+# Maximum number of categories waiting to be processed
+DEFAULT_QUEUE_CAPACITY = 256
+
+# Number of categories processed concurrently
+DEFAULT_WORKER_COUNT = 2
+
+# Processes one category directory
+CategoryProcessor = Callable[[str], Awaitable[None]]
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class QueueStats:
+    """Counters and timings for the category queue and its workers."""
+
+    enqueued: int = 0
+    coalesced: int = 0  # Adds merged into an entry that was already pending
+    dropped: int = 0  # Oldest entries discarded to stay within capacity
+    processed: int = 0
+    failed: int = 0
+    restarts: int = 0  # Workers replaced after crashing
+    wait_seconds: float = 0.0  # Total time entries spent queued
+    processing_seconds: float = 0.0  # Total time spent processing entries
+    max_processing_seconds: float = 0.0
+
+    def as_dict(self) -> Dict[str, Union[int, float]]:
+        """Return counters, plus average latencies, as a plain dictionary."""
+        finished = self.processed + self.failed
+        return {
+            "enqueued": self.enqueued,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "processed": self.processed,
+            "failed": self.failed,
+            "restarts": self.restarts,
+            "avg_wait_seconds": self.wait_seconds / finished if finished else 0.0,
+            "avg_processing_seconds": self.processing_seconds / finished if finished else 0.0,
+            "max_processing_seconds": self.max_processing_seconds,
+        }
+
+
+class CategoryQueue:
+    """Bounded FIFO of category directories awaiting processing.
+
+    Adding a category that is already pending keeps its original place
+    instead of queueing it twice, and adding to a full queue drops the oldest
+    pending entry, so producers never block. A category being processed is
+    held back from other consumers until ``task_done`` is called for it, so
+    one directory is never processed twice at once.
+
+    State is guarded by a thread lock and waiting consumers are woken through
+    their own event loop, so categories may be added from any thread.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_QUEUE_CAPACITY):
+        self.maxsize = maxsize
+        self.stats = QueueStats()
+        self._pending: "OrderedDict[str, float]" = OrderedDict()  # Category -> monotonic enqueue time
+        self._active: Set[str] = set()
+        self._getters: Deque["asyncio.Future[None]"] = deque()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def active(self) -> int:
+        """Number of categories currently being processed."""
+        return len(self._active)
+
+    def put_nowait(self, category_dir: str) -> bool:
+        """Queue a category without waiting; returns False if it was already pending."""
+        with self._lock:
+            if category_dir in self._pending:
+                self.stats.coalesced += 1
+                return False
+            while self.maxsize > 0 and len(self._pending) >= self.maxsize:
+                dropped, _ = self._pending.popitem(last=False)
+                self.stats.dropped += 1
+                logger.debug(f"Category queue full, dropped oldest entry {dropped}")
+            self._pending[category_dir] = time.monotonic()
+            self.stats.enqueued += 1
+            self._wake_getter()
+        return True
+
+    def get_nowait(self) -> str:
+        """Take the oldest category not already being processed, or raise ``queue.Empty``."""
+        with self._lock:
+            category_dir = self._take()
+        if category_dir is None:
+            raise queue.Empty
+        return category_dir
+
+    async def get(self) -> str:
+        """Wait for and take the oldest category not already being processed."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                category_dir = self._take()
+                if category_dir is not None:
+                    return category_dir
+                getter = loop.create_future()
+                self._getters.append(getter)
+            try:
+                await getter
+            except asyncio.CancelledError:
+                with self._lock:
+                    if getter in self._getters:
+                        self._getters.remove(getter)
+                    elif self._pending:
+                        # Woken but cancelled before taking anything; pass the wake-up on
+                        self._wake_getter()
+                raise
+
+    def task_done(self, category_dir: str, *, elapsed: float = 0.0, failed: bool = False) -> None:
+        """Release a category taken with ``get``, recording how long it took."""
+        with self._lock:
+            self._active.discard(category_dir)
+            if failed:
+                self.stats.failed += 1
+            else:
+                self.stats.processed += 1
+            self.stats.processing_seconds += elapsed
+            self.stats.max_processing_seconds = max(self.stats.max_processing_seconds, elapsed)
+            if self._pending:
+                # A pending entry for this category may have been held back
+                self._wake_getter()
+
+    def reset_consumers(self) -> None:
+        """Forget consumers that no longer exist, such as workers from a closed event loop.
+
+        Pending categories are kept.
+        """
+        with self._lock:
+            self._active.clear()
+            self._getters.clear()
+
+    def _take(self) -> Optional[str]:
+        # Callers hold self._lock
+        for category_dir, enqueued_at in self._pending.items():
+            if category_dir not in self._active:
+                del self._pending[category_dir]
+                self._active.add(category_dir)
+                self.stats.wait_seconds += time.monotonic() - enqueued_at
+                return category_dir
+        return None
+
+    def _wake_getter(self) -> None:
+        # Callers hold self._lock
+        while self._getters:
+            getter = self._getters.popleft()
+            if getter.done():
+                continue
+            try:
+                getter.get_loop().call_soon_threadsafe(_resolve, getter)
+                return
+            except RuntimeError:
+                # The getter's event loop has closed
+                continue
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
 
 # Global queue state (simpler than ContextVar for this use case)
-_category_queue: Optional[Queue[str]] = None
+_category_queue: Optional[CategoryQueue] = None
 _supervisor_task: Optional[asyncio.Task[None]] = None
 _lock = threading.Lock()
 
-logger = get_logger(__name__)
-
 
-def get_queue() -> Queue[str]:
+def get_queue() -> CategoryQueue:
     """Get or create the category queue."""
     global _category_queue
-    if _category_queue is None:
-        _category_queue = Queue()
-    return _category_queue
+    with _lock:
+        if _category_queue is None:
+            _category_queue = CategoryQueue()
+        return _category_queue
 
 
 def add_category(category_dir: str) -> None:
     """Add category to queue and ensure supervisor is running."""
-    get_queue().put(category_dir)
+    try:
+        get_queue().put_nowait(category_dir)
+    except Exception as e:
+        logger.warning(f"Failed to queue category {category_dir}: {e}")
+        return
     _ensure_supervisor_running()
 
 
 def get_next_category() -> Optional[str]:
-    """Get next category from queue (non-blocking)."""
+    """Get next category from queue (non-blocking).
+
+    The caller must release the category with ``get_queue().task_done()``
+    once it has been processed.
+    """
     try:
         return get_queue().get_nowait()
     except Exception:
         return None
 
 
+def get_queue_stats() -> Dict[str, Union[int, float]]:
+    """Report queue depth, worker activity and processing latency."""
+    category_queue = get_queue()
+    return {
+        "depth": len(category_queue),
+        "active": category_queue.active,
+        "supervisor_running": is_supervisor_running(),
+        **category_queue.stats.as_dict(),
+    }
+
+
 def _ensure_supervisor_running() -> None:
-    """Start supervisor if not already running. TEMPORARILY DISABLED."""
-    # Feature temporarily disabled to prevent RuntimeWarning
-    pass
+    """Start supervisor if not already running on the current event loop.
+
+    Without a running event loop the category stays queued until the next
+    call made from inside one.
+    """
+    global _supervisor_task
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    if is_supervisor_running() and _supervisor_task is not None and _supervisor_task.get_loop() is loop:
+        return
+    _supervisor_task = loop.create_task(_run_supervisor())
+
 
+async def _run_supervisor(process: Optional[CategoryProcessor] = None, workers: int = DEFAULT_WORKER_COUNT) -> None:
+    """Supervised task manager for category processing.
+
+    Runs a fixed pool of workers draining the queue, by default into the
+    external sync cleanup. A worker that crashes is replaced so the pool
+    stays at full strength, while a cancelled worker has simply stopped and
+    is not; cancelling the supervisor cancels its workers.
+    """
+    if process is None:
+        process = _cleanup_category_documents
+    category_queue = get_queue()
+    # Workers of an earlier supervisor (e.g. on a closed event loop) are gone
+    category_queue.reset_consumers()
+    pool = {asyncio.create_task(_worker(category_queue, process)) for _ in range(workers)}
+    try:
+        while pool:
+            done, _ = await asyncio.wait(pool, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                pool.discard(task)
+                if task.cancelled():
+                    continue
+                logger.error(f"Category worker crashed, restarting: {task.exception()!r}")
+                category_queue.stats.restarts += 1
+                pool.add(asyncio.create_task(_worker(category_queue, process)))
+    finally:
+        for task in pool:
+            task.cancel()
+        await asyncio.gather(*pool, return_exceptions=True)
 
-async def _run_supervisor() -> None:
-    """Supervised task manager for category processing. TEMPORARILY DISABLED."""
-    # Feature temporarily disabled to prevent RuntimeWarning
-    pass
+
+async def _worker(category_queue: CategoryQueue, process: CategoryProcessor) -> None:
+    """Process categories until cancelled; a failure ends the worker for the supervisor to replace."""
+    while True:
+        category_dir = await category_queue.get()
+        started = time.monotonic()
+        failed = True
+        try:
+            await process(category_dir)
+            failed = False
+        finally:
+            category_queue.task_done(category_dir, elapsed=time.monotonic() - started, failed=failed)
 
 
 def is_supervisor_running() -> bool:
@@ -58,6 +294,9 @@ def is_supervisor_running() -> bool:
 async def shutdown_supervisor() -> None:
     """Gracefully shutdown the supervisor task."""
     global _supervisor_task
+    if _supervisor_task and _supervisor_task.get_loop() is not asyncio.get_running_loop():
+        # Left behind by another event loop, which cannot be awaited from here
+        _supervisor_task = None
     if _supervisor_task and not _supervisor_task.done():
         _supervisor_task.cancel()
         try:
@@ -6,8 +6,12 @@ from typing import Any, Dict, List, Optional
 
 from mcp.server.fastmcp import FastMCP
 
+from .category_watcher import CategoryWatcher, set_category_watcher
+from .constants import METADATA_SUFFIX
+from .content_cache import configure_content_cache
 from .file_cache import FileCache
 from .file_source import FileAccessor
+from .http.async_client import HTTPClientPool
 from .logging_config import get_logger
 from .naming import MCP_GUIDE_VERSION, mcp_name
 from .server_extensions import ServerExtensions
@@ -15,9 +19,19 @@ from .server_lifecycle import server_lifespan
 from .session_manager import SessionManager
 from .tool_decoration import log_tool_usage
 from .tool_registry import register_tools
+from .tools.category_tools import (
+    MAX_DOCUMENTS_PER_GLOB,
+    MAX_GLOB_DEPTH,
+    configure_concurrent_reads,
+    refresh_category_index,
+)
 
 logger = get_logger()
 
+# Remote documents expired within this many seconds are served stale while refreshing;
+# off unless the server is configured with a window
+DEFAULT_STALE_WHILE_REVALIDATE = 0.0
+
 
 class GuideMCP(FastMCP):
     """MCP server with guide extensions."""
@@ -55,16 +69,9 @@ class GuideMCP(FastMCP):
 
     async def cleanup(self) -> None:
         """Clean up server resources."""
-        try:
-            # Clean up extensions if they have cleanup methods
-            if hasattr(self.extensions, "_session_manager") and hasattr(self.extensions._session_manager, "cleanup"):
-                await self.extensions._session_manager.cleanup()
-
-            if hasattr(self.extensions, "file_accessor") and hasattr(self.extensions.file_accessor, "cleanup"):
-                await self.extensions.file_accessor.cleanup()
-
-        except Exception as e:
-            logger.error(f"Error during server cleanup: {e}")
+        extensions = getattr(self, "extensions", None)
+        if extensions is not None:
+            await extensions.cleanup()
 
     async def __aenter__(self) -> "GuideMCP":
         """Async context manager entry."""
@@ -101,12 +108,41 @@ async def create_server(
     # Create file accessor
     cache_dir = kwargs.get("cache_dir")
     cache = FileCache(cache_dir) if cache_dir else FileCache()
-    file_accessor = FileAccessor(cache=cache)
+    http_pool = HTTPClientPool(limit_per_host=kwargs.get("http_limit_per_host", 10))
+    file_accessor = FileAccessor(
+        cache=cache,
+        http_pool=http_pool,
+        stale_while_revalidate=kwargs.get("stale_while_revalidate", DEFAULT_STALE_WHILE_REVALIDATE),
+    )
+
+    # Optionally tune category content assembly
+    if kwargs.get("content_cache_bytes") is not None:
+        configure_content_cache(kwargs["content_cache_bytes"])
+    if kwargs.get("max_concurrent_reads") is not None:
+        configure_concurrent_reads(kwargs["max_concurrent_reads"])
+
+    # Optionally watch category directories so reads can skip filesystem validation
+    category_watcher = None
+    if kwargs.get("watch_categories"):
+        category_watcher = CategoryWatcher(
+            refresh_category_index,
+            max_depth=MAX_GLOB_DEPTH,
+            limit=MAX_DOCUMENTS_PER_GLOB,
+            exclude_suffix=METADATA_SUFFIX,
+            poll_interval=kwargs.get("watch_poll_interval"),
+        )
+    set_category_watcher(category_watcher)
+
+    # Optionally coalesce session auto-saves into one write per window
+    session_manager = SessionManager()
+    session_manager.set_autosave_delay(kwargs.get("autosave_delay"))
 
     # Create extensions object with all server additions
     extensions = ServerExtensions(
-        _session_manager=SessionManager(),
+        _session_manager=session_manager,
         file_accessor=file_accessor,
+        http_pool=http_pool,
+        category_watcher=category_watcher,
     )
 
     # Single setattr to add all extensions
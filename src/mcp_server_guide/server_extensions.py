@@ -2,10 +2,13 @@
 
 import asyncio
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
 
 from .agent_detection import AgentInfo
+from .category_watcher import CategoryWatcher
 from .file_source import FileAccessor
+from .http.async_client import HTTPClientPool
+from .queue.category_queue import shutdown_supervisor
 from .session_manager import SessionManager
 
 
@@ -16,6 +19,8 @@ class ServerExtensions:
     _session_manager: SessionManager  # Session and project configuration management
     file_accessor: FileAccessor  # File reading and caching functionality
     agent_info: Optional[AgentInfo] = None  # Cached agent detection info
+    http_pool: Optional[HTTPClientPool] = None  # Shared keep-alive HTTP session, closed on cleanup
+    category_watcher: Optional[CategoryWatcher] = None  # Started by the server lifespan when enabled
     _prompts_registered: bool = False
     _tools_registered: bool = field(default=False)
     _registration_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
@@ -32,19 +37,38 @@ class ServerExtensions:
             self._tools_registered = True
 
     async def cleanup(self) -> None:
-        """Clean up extension resources."""
-        try:
-            # Clean up session manager if it has cleanup method
-            if hasattr(self._session_manager, "cleanup"):
-                await self._session_manager.cleanup()
-
-            # Clean up file accessor if it has cleanup method
-            if hasattr(self.file_accessor, "cleanup"):
-                await self.file_accessor.cleanup()
-
-        except Exception as e:
-            # Import logger here to avoid circular imports
-            from .logging_config import get_logger
-
-            logger = get_logger()
-            logger.error(f"Error during extensions cleanup: {e}")
+        """Clean up extension resources.
+
+        Every step runs even if an earlier one fails, so a failed session
+        flush never leaves the watcher running or HTTP connections open.
+        """
+        steps: List[Tuple[str, Callable[[], Awaitable[Any]]]] = []
+
+        # Clean up session manager if it has cleanup method
+        if hasattr(self._session_manager, "cleanup"):
+            steps.append(("session manager", self._session_manager.cleanup))
+
+        # Clean up file accessor if it has cleanup method
+        if hasattr(self.file_accessor, "cleanup"):
+            steps.append(("file accessor", self.file_accessor.cleanup))
+
+        # Stop watching category directories
+        if self.category_watcher is not None:
+            steps.append(("category watcher", self.category_watcher.stop))
+
+        # Stop background category processing
+        steps.append(("category supervisor", shutdown_supervisor))
+
+        # Close pooled HTTP connections
+        if self.http_pool is not None:
+            steps.append(("HTTP pool", self.http_pool.close))
+
+        for name, step in steps:
+            try:
+                await step()
+            except Exception as e:
+                # Import logger here to avoid circular imports
+                from .logging_config import get_logger
+
+                logger = get_logger()
+                logger.error(f"Error during extensions cleanup ({name}): {e}")
@@ -8,6 +8,7 @@ from mcp.server.fastmcp import FastMCP
 from .logging_config import get_logger
 from .prompts import register_prompts
 from .resource_registry import register_resources
+from .server_extensions import ServerExtensions
 from .session_manager import SessionManager
 from .utils.error_handler import ErrorHandler
 
@@ -70,6 +71,11 @@ async def server_lifespan(server: FastMCP) -> Any:
 
         register_prompts(server)
 
+        # Keep category indexes hot in the background if enabled
+        extensions = getattr(server, "extensions", None)
+        if isinstance(extensions, ServerExtensions) and extensions.category_watcher is not None:
+            await extensions.category_watcher.start()
+
         # Tools are already registered in create_server() - no need to register again here
 
         logger.info("MCP server initialized successfully")
@@ -81,7 +87,11 @@ async def server_lifespan(server: FastMCP) -> Any:
     finally:
         logger.info("MCP server shutting down")
         try:
-            if "session_manager" in locals() and hasattr(session_manager, "cleanup"):
+            # Extensions release everything the server owns, the session manager included
+            extensions = getattr(server, "extensions", None)
+            if isinstance(extensions, ServerExtensions):
+                await extensions.cleanup()
+            elif "session_manager" in locals() and hasattr(session_manager, "cleanup"):
                 await session_manager.cleanup()
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
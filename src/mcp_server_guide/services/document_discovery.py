@@ -1,6 +1,5 @@
 """Document discovery for managed documents."""
 
-import json
 from pathlib import Path
 from typing import Dict, List
 
@@ -8,12 +7,8 @@ from ..constants import DOCUMENT_SUBDIR
 from ..logging_config import get_logger
 from ..models.category import Category
 from ..models.document_info import DocumentInfo
-from ..utils.document_helpers import (
-    DOCUMENT_EXTENSIONS,
-    get_docs_dir,
-    get_metadata_path,
-    is_document_file,
-)
+from ..utils.document_helpers import get_docs_dir, get_metadata_path
+from ..utils.document_manifest import load_manifest
 
 logger = get_logger()
 
@@ -22,31 +17,18 @@ def get_category_documents_by_path(category_dir: Path) -> List[DocumentInfo]:
     """Discover all managed documents in category directory's DOCUMENT_SUBDIR."""
     docs_dir = category_dir / DOCUMENT_SUBDIR
 
-    if not docs_dir.exists():
-        return []
-
     documents = []
 
-    for file_path in docs_dir.rglob("*"):
-        if file_path.is_file() and is_document_file(file_path):
-            metadata_path = get_metadata_path(file_path)
-
-            # Try to read metadata, use empty dict if not available
-            metadata = {}
-            if metadata_path.exists():
-                try:
-                    with open(metadata_path) as f:
-                        metadata = json.load(f)
-                except (json.JSONDecodeError, OSError):
-                    logger.warning(f"Failed to read metadata for {file_path}")
-
-            # Create DocumentInfo with correct fields
-            doc_info = DocumentInfo(
+    for name, entry in load_manifest(docs_dir).items():
+        file_path = docs_dir / name
+        documents.append(
+            DocumentInfo(
                 path=file_path,
-                metadata_path=metadata_path,
-                metadata=metadata,
+                metadata_path=get_metadata_path(file_path),
+                # Unreadable metadata is reported as empty
+                metadata=dict(entry.metadata) if entry.metadata is not None else {},
             )
-            documents.append(doc_info)
+        )
 
     return documents
 
@@ -72,29 +54,15 @@ def get_category_documents(category: Category) -> Dict[str, DocumentInfo]:
     docs_dir = get_docs_dir(category_path)
     documents: Dict[str, DocumentInfo] = {}
 
-    if not docs_dir.exists():
-        return documents
-
-    # Find all document files with corresponding sidecar metadata
-    for ext in DOCUMENT_EXTENSIONS:
-        for doc_file in docs_dir.rglob(f"*{ext}"):
-            if not is_document_file(doc_file):
-                continue
-
-            sidecar_path = get_metadata_path(doc_file)
-            if sidecar_path.exists():
-                try:
-                    with open(sidecar_path) as f:
-                        metadata = json.load(f)
-
-                    documents[doc_file.stem] = DocumentInfo(
-                        path=doc_file.relative_to(category_path), metadata_path=sidecar_path, metadata=metadata
-                    )
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Corrupted JSON metadata file {sidecar_path}: {e}")
-                    continue
-                except OSError as e:
-                    logger.warning(f"Failed to read metadata file {sidecar_path}: {e}")
-                    continue
+    # Only documents with readable sidecar metadata are reported
+    for name, entry in load_manifest(docs_dir).items():
+        if entry.metadata is None:
+            continue
+        doc_file = docs_dir / name
+        documents[doc_file.stem] = DocumentInfo(
+            path=doc_file.relative_to(category_path),
+            metadata_path=get_metadata_path(doc_file),
+            metadata=dict(entry.metadata),
+        )
 
     return documents
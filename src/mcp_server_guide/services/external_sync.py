@@ -3,16 +3,18 @@
 import asyncio
 import hashlib
 import json
+import re
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Optional, Set
 
 from ..commands import CMD_CATEGORY
-from ..constants import DOCUMENT_SUBDIR, METADATA_SUFFIX
+from ..constants import DOCUMENT_SUBDIR
 from ..logging_config import get_logger
 from ..models.document_metadata import DocumentMetadata
-from ..utils.document_utils import detect_mime_type, generate_content_hash
+from ..utils.document_manifest import UNKNOWN_HASH, load_manifest
+from ..utils.document_utils import detect_mime_type, generate_file_hash
 from ..utils.sidecar_operations import create_sidecar_metadata, read_sidecar_metadata
 
 logger = get_logger()
@@ -20,13 +22,15 @@ logger = get_logger()
 # TTL for cache entries (5 minutes)
 CACHE_TTL = 300
 VALID_SOURCE_TYPES = {"manual", "external", "template", "generated"}
+# Content hashes as written by generate_content_hash/generate_file_hash; bare hex from older sidecars
+CONTENT_HASH_PATTERN = re.compile(r"(sha256:)?[0-9a-f]{64}")
 
 
 def validate_existing_metadata(metadata: DocumentMetadata) -> bool:
     """Validate metadata fields are reasonable."""
     if not metadata.source_type or metadata.source_type not in VALID_SOURCE_TYPES:
         return False
-    if metadata.content_hash and len(metadata.content_hash) != 64:  # SHA256 length
+    if metadata.content_hash and not CONTENT_HASH_PATTERN.fullmatch(metadata.content_hash):
         return False
     return True
 
@@ -97,8 +101,7 @@ async def validate_document_integrity(doc_path: Path) -> Dict[str, Any]:
         if not metadata:
             return {"success": False, "error": "Metadata file missing or invalid", "error_type": "metadata_missing"}
 
-        current_content = doc_path.read_text(encoding="utf-8")
-        current_hash = generate_content_hash(current_content)
+        current_hash = await asyncio.to_thread(generate_file_hash, doc_path)
 
         if current_hash == metadata.content_hash:
             return {"success": True}
@@ -120,8 +123,7 @@ async def sync_document_metadata(doc_path: Path) -> Dict[str, Any]:
         if not doc_path.exists():
             return {"success": False, "error": "Document file does not exist", "error_type": "not_found"}
 
-        current_content = doc_path.read_text(encoding="utf-8")
-        current_hash = generate_content_hash(current_content)
+        current_hash = await asyncio.to_thread(generate_file_hash, doc_path)
         current_mime = detect_mime_type(doc_path.name)
 
         if existing_metadata := read_sidecar_metadata(doc_path):
@@ -133,9 +135,9 @@ async def sync_document_metadata(doc_path: Path) -> Dict[str, Any]:
             if existing_metadata.content_hash and existing_metadata.content_hash != current_hash:
                 logger.warning(f"Content hash mismatch for {doc_path} - external modification detected")
 
-            # Update hash and mime type
-            updated_metadata = DocumentMetadata(
-                source_type=existing_metadata.source_type, content_hash=current_hash, mime_type=current_mime
+            # Update hash and mime type, keeping source_type and any other recorded fields
+            updated_metadata = existing_metadata.model_copy(
+                update={"content_hash": current_hash, "mime_type": current_mime}
             )
 
             # Save updated metadata
@@ -151,7 +153,12 @@ async def sync_document_metadata(doc_path: Path) -> Dict[str, Any]:
 
 
 async def _cleanup_category_documents(category_dir: str) -> None:
-    """Clean up documents in a category directory."""
+    """Clean up documents in a category directory.
+
+    Content hashes and sidecar metadata come from the directory's document
+    manifest, which only rehashes documents whose size or mtime changed since
+    it was last brought up to date; unchanged documents cost one ``stat``.
+    """
     try:
         category_path = Path(category_dir)
         docs_dir = category_path / DOCUMENT_SUBDIR
@@ -159,23 +166,31 @@ async def _cleanup_category_documents(category_dir: str) -> None:
         if not docs_dir.exists():
             return
 
-        for doc_path in docs_dir.iterdir():
-            if doc_path.is_file() and not doc_path.name.endswith(METADATA_SUFFIX):
-                # Check if document needs sync
-                validation_result = await validate_document_integrity(doc_path)
-                if not validation_result["success"]:
-                    logger.debug(f"Syncing modified document: {doc_path}")
-                    await sync_document_metadata(doc_path)
-
-                    # Log change in cache
-                    cache_key = str(doc_path)
-                    await _cache.add_change(
-                        cache_key,
-                        {
-                            "action": "modified",
-                            "category": category_dir,
-                        },
-                    )
+        # Hashing happens on a worker thread so large documents never block the event loop
+        entries = await asyncio.to_thread(load_manifest, docs_dir)
+
+        for name, entry in entries.items():
+            if "/" in name:
+                # Documents in nested directories are not managed by the scan
+                continue
+            doc_path = docs_dir / name
+
+            # Check if document needs sync
+            current_hash = entry.content_hash if entry.content_hash != UNKNOWN_HASH else None
+            recorded_hash = entry.metadata.get("content_hash") if entry.metadata_valid and entry.metadata else None
+            if current_hash is None or recorded_hash != current_hash:
+                logger.debug(f"Syncing modified document: {doc_path}")
+                await sync_document_metadata(doc_path)
+
+                # Log change in cache
+                cache_key = str(doc_path)
+                await _cache.add_change(
+                    cache_key,
+                    {
+                        "action": "modified",
+                        "category": category_dir,
+                    },
+                )
 
     except Exception as e:
         logger.exception(f"Error during category cleanup for {category_dir}: {e}")
@@ -20,6 +20,9 @@ logger = get_logger()
 # Instruction for when project name cannot be determined
 PROJECT_NAME_FIX_INSTRUCTION = "To fix: Call switch_project with the basename of the current working directory."
 
+# Seconds to coalesce session changes before auto-saving; 0 saves after every change
+DEFAULT_AUTOSAVE_DELAY = 0.0
+
 # Global session manager instance (singleton)
 _session_manager_instance: Optional["SessionManager"] = None
 
@@ -33,6 +36,10 @@ class SessionManager:
     _locks_lock: asyncio.Lock
     _context_lock: asyncio.Lock
     _context_project_name: Optional[str]
+    _autosave_delay: float
+    _autosave_task: Optional[asyncio.Task[None]]
+    _autosave_pending: bool
+    _save_lock: asyncio.Lock
 
     def __new__(cls) -> "SessionManager":
         # Check global instance first
@@ -45,6 +52,10 @@ class SessionManager:
             _session_manager_instance._locks_lock = asyncio.Lock()
             _session_manager_instance._context_lock = asyncio.Lock()
             _session_manager_instance._context_project_name = None  # Resolved from client context
+            _session_manager_instance._autosave_delay = DEFAULT_AUTOSAVE_DELAY
+            _session_manager_instance._autosave_task = None  # Timer for the pending auto-save, if any
+            _session_manager_instance._autosave_pending = False  # Changes not yet written
+            _session_manager_instance._save_lock = asyncio.Lock()
             logger.debug("Session manager initialized")
         return _session_manager_instance
 
@@ -341,8 +352,23 @@ class SessionManager:
         # Save using config manager with project name as key
         await self._config_manager.save_config(project_name, project_config)
 
+    def set_autosave_delay(self, delay: Optional[float]) -> None:
+        """Set how long auto-saves wait to coalesce further changes.
+
+        With a positive delay, ``safe_save_session`` only marks the session
+        dirty, and all changes made within ``delay`` seconds of the first are
+        written together; with None or 0 every call saves immediately.
+        """
+        self._autosave_delay = max(delay or 0.0, 0.0)
+
     async def safe_save_session(self) -> None:
         """Auto-save session state with error handling that won't propagate exceptions."""
+        if self._autosave_delay > 0:
+            self._autosave_pending = True
+            if self._autosave_task is None:
+                self._autosave_task = asyncio.create_task(self._autosave_after(self._autosave_delay))
+            return
+
         try:
             await self.save_session()
             logger.debug("Auto-saved session")
@@ -350,6 +376,45 @@ class SessionManager:
             logger.warning(f"Auto-save failed: {e}")
             # Don't raise - operations should succeed even if save fails
 
+    async def flush_session(self) -> None:
+        """Write any auto-save changes that are still pending.
+
+        For callers that need the session on disk now. Raises if saving
+        fails, in which case the changes stay pending.
+        """
+        if self._autosave_task is not None:
+            # Still waiting out the delay; this flush replaces it
+            self._autosave_task.cancel()
+            self._autosave_task = None
+
+        async with self._save_lock:
+            if not self._autosave_pending:
+                return
+            self._autosave_pending = False
+            try:
+                await self.save_session()
+            except BaseException:
+                self._autosave_pending = True
+                raise
+            logger.debug("Auto-saved session")
+
+    async def _autosave_after(self, delay: float) -> None:
+        """Flush pending changes once ``delay`` seconds have passed."""
+        await asyncio.sleep(delay)
+        # Detach first, so a concurrent flush never cancels the save itself
+        self._autosave_task = None
+        try:
+            await self.flush_session()
+        except Exception as e:
+            logger.warning(f"Auto-save failed: {e}")
+
+    async def cleanup(self) -> None:
+        """Flush pending auto-save changes, e.g. on server shutdown."""
+        try:
+            await self.flush_session()
+        except Exception as e:
+            logger.warning(f"Auto-save on shutdown failed: {e}")
+
     async def get_or_create_project_config(self, project: str) -> ProjectConfig:
         """Get project config and auto-save if project was newly created."""
 
@@ -381,6 +446,12 @@ class SessionManager:
             raise ValueError("Project name must be a non-empty string")
 
         if project_name != self.project_name:
+            # Pending auto-save changes belong to the project being left
+            try:
+                await self.flush_session()
+            except Exception as e:
+                logger.warning(f"Auto-save before switching project failed: {e}")
+
             project_config = await self.load_config(project_name)
             if project_config:
                 # Load existing config into session state
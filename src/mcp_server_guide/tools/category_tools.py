@@ -1,17 +1,21 @@
 """Category management tools for custom document categories."""
 
-import glob
+import asyncio
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import aiofiles
 
+from ..category_watcher import get_category_watcher
 from ..constants import METADATA_SUFFIX
+from ..content_cache import AssembledContent, ContentSection, fingerprint_files, get_content_cache
 from ..document_cache import CategoryDocumentCache
+from ..document_resolver import invalidate_name_index
 from ..logging_config import get_logger
 from ..models.category import Category
 from ..utils.document_discovery import get_category_documents_by_path
+from ..utils.glob_walker import get_glob_cache
 
 logger = get_logger()
 
@@ -19,10 +23,22 @@ logger = get_logger()
 MAX_GLOB_DEPTH = 8
 MAX_DOCUMENTS_PER_GLOB = 100
 
+# Default upper bound on files read at once while assembling category content
+DEFAULT_MAX_CONCURRENT_READS = 16
+_max_concurrent_reads = DEFAULT_MAX_CONCURRENT_READS
+
 # Category name validation pattern
 CATEGORY_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
 
 
+def configure_concurrent_reads(limit: int) -> None:
+    """Set how many files category content assembly may read at once."""
+    global _max_concurrent_reads
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    _max_concurrent_reads = limit
+
+
 def _validate_category_name(name: str) -> bool:
     """Validate category name against allowed pattern."""
     # Category names must not start with '-' to avoid confusion with commands
@@ -30,80 +46,19 @@ def _validate_category_name(name: str) -> bool:
 
 
 def _safe_glob_search(search_dir: Path, patterns: List[str]) -> List[Path]:
-    """Safely search for files using glob patterns with safety limits and smart .md extension."""
-    matched_files: List[Path] = []
-    seen_files: Set[Path] = set()
-
-    for pattern in patterns:
-        if len(matched_files) >= MAX_DOCUMENTS_PER_GLOB:
-            logger.warning(f"Reached maximum document limit ({MAX_DOCUMENTS_PER_GLOB}) for glob search")
-            break
-
-        pattern_path = search_dir / pattern
-
-        # Try original pattern first
-        matches_found = False
-        try:
-            # Use iglob for memory efficiency
-            for match_str in glob.iglob(str(pattern_path), recursive=True):
-                matches_found = True
-                if len(matched_files) >= MAX_DOCUMENTS_PER_GLOB:
-                    break
-
-                match_path = Path(match_str)
-                if match_path.is_file():
-                    # Resolve symlinks with error handling
-                    try:
-                        resolved_path = match_path.resolve()
-                    except OSError as e:
-                        logger.warning(f"Failed to resolve symlink {match_path}: {e}")
-                        continue
-
-                    # Check if we've already seen this resolved path
-                    if resolved_path in seen_files:
-                        continue
-
-                    # Exclude metadata files from pattern matching
-                    if resolved_path.name.endswith(METADATA_SUFFIX):
-                        continue
-
-                    # Check depth limit
-                    try:
-                        relative_path = resolved_path.relative_to(search_dir.resolve())
-                        depth = len(relative_path.parts) - 1  # Subtract 1 for the file itself
-                        if depth <= MAX_GLOB_DEPTH:
-                            matched_files.append(resolved_path)
-                            seen_files.add(resolved_path)
-                    except ValueError:
-                        # Path is not relative to search_dir, skip it
-                        logger.debug(f"Skipping file outside search directory: {resolved_path}")
-                        continue
-
-        except Exception as e:
-            logger.warning(f"Glob pattern '{pattern}' failed: {e}")
-            continue
+    """Safely search for files using glob patterns with safety limits and smart .md extension.
 
-        # If no matches and pattern doesn't end with .md, try adding .md
-        if not matches_found and not pattern.endswith(".md"):
-            md_pattern = f"{pattern}.md"
-            md_pattern_path = search_dir / md_pattern
-            try:
-                for match_str in glob.iglob(str(md_pattern_path), recursive=True):
-                    if len(matched_files) >= MAX_DOCUMENTS_PER_GLOB:
-                        break
-
-                    match_path = Path(match_str)
-                    if match_path.is_file() and match_path not in seen_files:
-                        # Exclude metadata files from pattern matching
-                        if not match_path.name.endswith(METADATA_SUFFIX):
-                            matched_files.append(match_path)
-                            seen_files.add(match_path)
-
-            except Exception as e:
-                logger.warning(f"Glob pattern '{md_pattern}' failed: {e}")
-                continue
-
-    return matched_files
+    All patterns are matched in one pruned walk of ``search_dir``; see
+    ``match_category_patterns`` for ordering and fallback rules. Results are
+    reused while none of the directories the walk scanned have changed.
+    """
+    return get_glob_cache().match(
+        search_dir,
+        patterns,
+        max_depth=MAX_GLOB_DEPTH,
+        limit=MAX_DOCUMENTS_PER_GLOB,
+        exclude_suffix=METADATA_SUFFIX,
+    )
 
 
 def _get_combined_category_files(category_dir: Path, patterns: List[str]) -> List[Path]:
@@ -130,6 +85,27 @@ def _get_combined_category_files(category_dir: Path, patterns: List[str]) -> Lis
     return deduplicated_pattern_files + managed_paths
 
 
+async def _invalidate_category_caches(name: str) -> None:
+    """Drop every cached view of a category after its configuration changes."""
+    await CategoryDocumentCache.invalidate_category(name)
+    get_content_cache().invalidate(name)
+    invalidate_name_index(name)
+    # Glob results are keyed by directory and patterns rather than category name
+    get_glob_cache().invalidate_all()
+    # The next read re-registers the category with its new directory and patterns
+    watcher = get_category_watcher()
+    if watcher is not None:
+        watcher.unwatch(name)
+
+
+async def refresh_category_index(name: str, search_dir: Path, patterns: Sequence[str]) -> None:
+    """Rebuild a watched category's cached views after its files change on disk."""
+    await CategoryDocumentCache.invalidate_category(name)
+    get_content_cache().invalidate(name)
+    invalidate_name_index(name)
+    await _assemble_category_content(name, search_dir, list(patterns))
+
+
 async def add_category(
     name: str,
     dir: str,
@@ -245,7 +221,7 @@ async def update_category(
     categories[name] = category
 
     # Invalidate cache for this category before updating session
-    await CategoryDocumentCache.invalidate_category(name)
+    await _invalidate_category_caches(name)
 
     # Update session
     session.session_state.set_project_config("categories", categories)
@@ -288,7 +264,7 @@ async def remove_category(name: str) -> Dict[str, Any]:
     updated_config = config.model_copy(update={"categories": new_categories})
 
     # Invalidate cache for this category before updating session
-    await CategoryDocumentCache.invalidate_category(name)
+    await _invalidate_category_caches(name)
 
     # Update session state with the new config
     session.session_state.project_config = updated_config
@@ -369,7 +345,7 @@ async def add_to_category(name: str, patterns: List[str]) -> Dict[str, Any]:
         config.categories[name] = updated_category
 
         # Invalidate cache for this category before updating session
-        await CategoryDocumentCache.invalidate_category(name)
+        await _invalidate_category_caches(name)
 
         # Update session
         session.session_state.set_project_config("categories", config.categories)
@@ -434,7 +410,7 @@ async def remove_from_category(name: str, patterns: List[str]) -> Dict[str, Any]
         config.categories[name] = updated_category
 
         # Invalidate cache for this category before updating session
-        await CategoryDocumentCache.invalidate_category(name)
+        await _invalidate_category_caches(name)
 
         # Update session
         session.session_state.set_project_config("categories", config.categories)
@@ -519,38 +495,150 @@ async def get_category_content(name: str, file: Optional[str] = None) -> Dict[st
     if not search_dir.exists():
         return {"success": False, "error": f"Category directory '{search_dir}' does not exist"}
 
-    matched_files = _safe_glob_search(search_dir, patterns)
-    content_parts = []
+    assembled = await _assemble_category_content(name, search_dir, patterns)
+    return assembled.result
 
-    for file_path in matched_files:
+
+async def _read_category_file(file_path: Path, semaphore: asyncio.Semaphore) -> Tuple[str, bool]:
+    """Read one matched file, returning its body (or error text) and whether the read failed."""
+    async with semaphore:
         try:
             async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-                content = await f.read()
-            content_parts.append(f"# {file_path.name}\n\n{content}")
+                return await f.read(), False
         except Exception as e:
-            content_parts.append(f"# {file_path.name}\n\nError reading file: {str(e)}")
+            return f"Error reading file: {str(e)}", True
+
+
+async def _assemble_category_content(name: str, search_dir: Path, patterns: List[str]) -> AssembledContent:
+    """Combine the files matched by a category into one document with a section index.
+
+    Each section records where its document body sits in the combined content,
+    so callers can slice single documents out without re-scanning the string.
+    """
+    content_cache = get_content_cache()
+    watcher = get_category_watcher()
+    if watcher is not None:
+        # While the watcher has seen no change, the cached index needs no re-validation
+        if watcher.is_current(name, search_dir, patterns):
+            cached = content_cache.peek(name, str(search_dir), patterns)
+            if cached is not None:
+                return cached
+        watcher.watch(name, search_dir, patterns)
+
+    matched_files = _safe_glob_search(search_dir, patterns)
+
+    # Serve from the content cache when none of the matched files have changed
+    fingerprint = fingerprint_files(matched_files) if matched_files else None
+    if fingerprint is not None:
+        cached = content_cache.get(name, str(search_dir), patterns, fingerprint)
+        if cached is not None:
+            return cached
+
+    content_parts = []
+    sections = []
+    offset = 0
+    read_errors = False
+
+    # Read concurrently; gather keeps results in match order
+    semaphore = asyncio.Semaphore(_max_concurrent_reads)
+    bodies = await asyncio.gather(*(_read_category_file(file_path, semaphore) for file_path in matched_files))
+
+    for file_path, (body, failed) in zip(matched_files, bodies, strict=True):
+        read_errors = read_errors or failed
+        header = f"# {file_path.name}\n\n"
+        content_parts.append(f"{header}{body}")
+        sections.append(ContentSection(file_path.name, offset + len(header), len(body), str(file_path)))
+        offset += len(header) + len(body) + len("\n\n")
 
     if not content_parts:
-        return {
+        return AssembledContent(
+            {
+                "success": True,
+                "content": "",
+                "message": f"No files found matching patterns in category '{name}'",
+                "matched_files": [],
+                "patterns": patterns,
+                "search_dir": str(search_dir),
+            }
+        )
+
+    combined_content = "\n\n".join(content_parts)
+    matched_file_names = [str(f) for f in matched_files]
+
+    assembled = AssembledContent(
+        {
             "success": True,
-            "content": "",
-            "message": f"No files found matching patterns in category '{name}'",
-            "matched_files": [],
+            "content": combined_content,
+            "matched_files": matched_file_names,
             "patterns": patterns,
             "search_dir": str(search_dir),
-        }
+            "file_count": len(matched_files),
+        },
+        tuple(sections),
+    )
 
-    combined_content = "\n\n".join(content_parts)
-    matched_file_names = [str(f) for f in matched_files]
+    # Read errors may be transient, so only cache fully successful assemblies
+    if fingerprint is not None and not read_errors:
+        content_cache.put(name, str(search_dir), patterns, fingerprint, assembled)
 
-    return {
-        "success": True,
-        "content": combined_content,
-        "matched_files": matched_file_names,
-        "patterns": patterns,
-        "search_dir": str(search_dir),
-        "file_count": len(matched_files),
-    }
+    return assembled
+
+
+async def get_indexed_category_content(name: str) -> Optional[AssembledContent]:
+    """Get a file-based category's combined content together with its section index.
+
+    Returns None when the category is not file-based, has no patterns or its
+    directory does not exist.
+    """
+    category = await _get_file_category(name)
+    if category is None or not category.patterns:
+        return None
+
+    search_dir = _category_search_dir(category)
+    if not search_dir.exists():
+        return None
+    return await _assemble_category_content(name, search_dir, category.patterns)
+
+
+async def _get_file_category(name: str) -> Optional[Category]:
+    """Return the configured category if it is file-based, else None."""
+    from ..session_manager import SessionManager
+
+    session = SessionManager()
+    config = await session.get_or_create_project_config(session.get_project_name())
+    category = config.categories.get(name)
+    if category is None or category.url or not category.dir:
+        return None
+    return category
+
+
+def _category_search_dir(category: Category) -> Path:
+    """Resolve a file-based category's directory against the docroot."""
+    from ..session_manager import SessionManager
+
+    docroot = SessionManager().config_manager().docroot
+    base_path = docroot.resolve() if docroot else Path(".")
+    return base_path / str(category.dir)
+
+
+async def resolve_file_category(name: str) -> Optional[Tuple[Category, Path]]:
+    """Look up a file-based category together with its on-disk directory.
+
+    Returns None for unknown, URL-based or directory-less categories.
+    """
+    category = await _get_file_category(name)
+    return (category, _category_search_dir(category)) if category is not None else None
+
+
+def match_category_files(category: Category, search_dir: Path) -> Optional[List[Path]]:
+    """Return the files a file-based category's patterns match, without reading them.
+
+    Returns None when the category has no patterns or its directory does not
+    exist.
+    """
+    if not category.patterns or not search_dir.exists():
+        return None
+    return _safe_glob_search(search_dir, category.patterns)
 
 
 async def _get_specific_document(category: Any, file: str, session: Any) -> Dict[str, Any]:
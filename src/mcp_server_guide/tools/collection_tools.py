@@ -5,9 +5,10 @@ import re
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Literal, Optional
 
+from ..content_cache import AssembledContent
 from ..logging_config import get_logger
 from ..models.collection import Collection
-from .category_tools import get_category_content
+from .category_tools import get_category_content, get_indexed_category_content
 
 logger = get_logger()
 
@@ -619,15 +620,17 @@ async def get_collection_document(
 
     collection = config.collections[name]
 
-    # Search for document in each category
+    # Search for document in each category, keeping each category's indexed content for extraction
     matches_found = []
+    indexed_content: Dict[str, AssembledContent] = {}
 
     for category_name in collection.categories:
         try:
-            result = await get_category_content(category_name)
-            if result.get("success") and result.get("matched_files"):
+            assembled = await get_indexed_category_content(category_name)
+            if assembled is not None and assembled.result.get("matched_files"):
+                indexed_content[category_name] = assembled
                 # Check for filename matches (exact, with extensions, or containing the document name)
-                for file_path in result["matched_files"]:
+                for file_path in assembled.result["matched_files"]:
                     filename = os.path.basename(file_path)
                     # Exact match or with common extensions
                     match = (
@@ -656,35 +659,28 @@ async def get_collection_document(
             "collection_name": name,
         }
 
-    # Process first match
+    # Process first match by slicing its section out of the already-assembled category content
     if matches_found:
         category_name, file_path = matches_found[0]
-        try:
-            result = await get_category_content(category_name)
-            if result.get("success"):
-                # Found the document, extract and return only its content
-                from .content_tools import _extract_document_from_content
-
-                document_content = _extract_document_from_content(result["content"], document)
-                # If extraction fails, return error instead of exposing full content
-                if document_content is None:
-                    logger.warning(f"Could not extract specific document '{document}' from '{file_path}'")
-                    return {
-                        "success": False,
-                        "error": f"Document '{document}' found but could not be extracted from '{file_path}'",
-                        "found_in_category": category_name,
-                        "collection_name": name,
-                    }
-                return {
-                    "success": True,
-                    "content": document_content,
-                    "found_in_category": category_name,
-                    "collection_name": name,
-                    "document": document,
-                    "file_path": file_path,
-                }
-        except Exception as e:
-            logger.warning(f"Error searching category '{category_name}' for document '{document}': {e}")
+        assembled = indexed_content[category_name]
+        section = assembled.section_for_path(file_path)
+        # If extraction fails, return error instead of exposing full content
+        if section is None:
+            logger.warning(f"Could not extract specific document '{document}' from '{file_path}'")
+            return {
+                "success": False,
+                "error": f"Document '{document}' found but could not be extracted from '{file_path}'",
+                "found_in_category": category_name,
+                "collection_name": name,
+            }
+        return {
+            "success": True,
+            "content": assembled.section_text(section).strip(),
+            "found_in_category": category_name,
+            "collection_name": name,
+            "document": document,
+            "file_path": file_path,
+        }
 
     return {
         "success": False,
@@ -1,38 +1,50 @@
 """Content retrieval tools."""
 
-import re
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from ..document_cache import CategoryDocumentCache
+from ..document_cache import CategoryDocumentCache, directory_fingerprint
+from ..document_resolver import get_name_index, read_category_document
 from ..logging_config import get_logger
-from .category_tools import get_category_content
+from .category_tools import get_category_content, match_category_files, resolve_file_category
 from .collection_tools import get_collection_document
 
 
 async def get_content(category_or_collection: str, document: str, project: Optional[str] = None) -> Optional[str]:
     """Get content for a specific document in a category or collection with caching."""
-    # Check cache first for category
-    cache_entry = await CategoryDocumentCache.get(category_or_collection, document)
+    category_error: Optional[Exception] = None
+
+    # Resolve the category configuration once, for both cache validation and matching
+    file_category = None
+    try:
+        file_category = await resolve_file_category(category_or_collection)
+    except Exception as e:
+        # Log exception for debugging
+        logger = get_logger(__name__)
+        logger.error(f"Category content retrieval failed: {e}", exc_info=True)
+        category_error = e
+
+    # Check cache first for category; a changed directory fingerprint invalidates the entry
+    fingerprint = directory_fingerprint(file_category[1]) if file_category is not None else None
+    cache_entry = await CategoryDocumentCache.get(category_or_collection, document, fingerprint)
     if cache_entry is not None:
         if not cache_entry.exists:
             return None
 
-    category_error: Optional[Exception] = None
-
-    # Try category first
+    # Try category first, resolving the document name straight to one matched file
     try:
-        result = await get_category_content(category_or_collection)
-        if result.get("success") and result.get("content"):
-            content = str(result["content"])
-            matched_files = result.get("matched_files", [])
-            document_content = _extract_document_from_content(content, document)
+        matched_paths = match_category_files(*file_category) if file_category is not None else None
+        if matched_paths:
+            matched_files = [str(path) for path in matched_paths]
+            document_path = get_name_index(category_or_collection, matched_paths).resolve(document)
+            document_content = await read_category_document(document_path) if document_path else None
 
             if document_content is not None:
-                await CategoryDocumentCache.set(category_or_collection, document, True, matched_files)
+                await CategoryDocumentCache.set(
+                    category_or_collection, document, True, matched_files, fingerprint=fingerprint
+                )
                 return document_content
             else:
-                await CategoryDocumentCache.set(category_or_collection, document, False, None)
+                await CategoryDocumentCache.set(category_or_collection, document, False, None, fingerprint=fingerprint)
                 return None
     except Exception as e:
         # Log exception for debugging
@@ -47,7 +59,7 @@ async def get_content(category_or_collection: str, document: str, project: Optio
             return str(result["content"])
         else:
             # Cache failed collection document lookup
-            await CategoryDocumentCache.set(category_or_collection, document, False, None)
+            await CategoryDocumentCache.set(category_or_collection, document, False, None, fingerprint=fingerprint)
     except Exception as ce:
         # Log exception for debugging
         logger = get_logger(__name__)
@@ -60,7 +72,7 @@ async def get_content(category_or_collection: str, document: str, project: Optio
         else:
             logger.error(f"Collection content retrieval failed: {ce}", exc_info=True)
         # Cache exception as failed lookup
-        await CategoryDocumentCache.set(category_or_collection, document, False, None)
+        await CategoryDocumentCache.set(category_or_collection, document, False, None, fingerprint=fingerprint)
 
     return None
 
@@ -73,64 +85,6 @@ async def get_guide(category_or_collection: str, document: str, project: Optiona
     return await get_content(category_or_collection, document, project)
 
 
-def _extract_document_from_content(content: str, document: str) -> Optional[str]:
-    """Extract a specific document from combined category content.
-
-    Matches document headers in format: # filename
-    Supports exact match, with extension (.md), or base name matching.
-    Handles edge cases with unusual headers and alternative formats.
-    """
-    if not content.strip():
-        return None
-
-    # Robust header detection - handle various markdown header formats
-    # Match: # filename, ## filename, ### filename at start of line
-    header_pattern = r"^(#{1,6})\s+(.+?)(?:\s*\{[^}]*\})?\s*$"
-
-    sections = []
-    current_section: list[str] = []
-    current_header = None
-
-    for line in content.split("\n"):
-        header_match = re.match(header_pattern, line.strip())
-        if header_match:
-            # Save previous section
-            if current_header and current_section:
-                sections.append((current_header, "\n".join(current_section)))
-            # Start new section
-            current_header = header_match.group(2).strip()
-            current_section = []
-        else:
-            current_section.append(line)
-
-    # Add final section
-    if current_header and current_section:
-        sections.append((current_header, "\n".join(current_section)))
-
-    # Find matching section using extension fallback logic
-    from ..utils.file_extensions import get_extension_candidates
-
-    # Get candidates with extension fallback
-    candidates = get_extension_candidates(document)
-
-    for candidate in candidates:
-        candidate_normalized = candidate.strip().lower()
-
-        for filename, section_content in sections:
-            filename_normalized = filename.strip().lower()
-            filename_path = Path(filename_normalized)
-
-            # Exact match, stem match, or document with extension match
-            if (
-                filename_normalized == candidate_normalized
-                or filename_path.stem == candidate_normalized
-                or (candidate_normalized + ".") in filename_normalized
-            ):
-                return section_content.strip()
-
-    return None
-
-
 async def search_content(query: str, project: Optional[str] = None) -> List[Dict[str, Any]]:
     """Search across all categories for content matching the query.
     This is a read-only operation that finds and displays matching content without making changes."""
@@ -1,7 +1,11 @@
 """Document CRUD operations for managed documents."""
 
+import asyncio
+import base64
+import os
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, Iterator, Literal, Optional, Tuple
 
 from ..constants import DOCUMENT_SUBDIR, METADATA_SUFFIX
 from ..file_lock import lock_update
@@ -9,17 +13,17 @@ from ..logging_config import get_logger
 from ..models.document_metadata import DocumentMetadata
 from ..queue.category_queue import add_category
 from ..utils.document_helpers import get_metadata_path
-from ..utils.document_utils import (
-    detect_best_mime_type,
-    detect_mime_type,
-    generate_content_hash,
-    normalize_document_name,
-)
+from ..utils.document_manifest import file_stamp, read_manifest, record_document, remove_document
+from ..utils.document_utils import detect_mime_type, generate_content_hash, resolve_document_type
 from ..utils.error_handler import handle_operation_error
 from ..utils.sidecar_operations import create_sidecar_metadata, read_sidecar_metadata
 
 logger = get_logger()
 
+# Documents per list_mcp_documents page when only a cursor is given, and at most
+DEFAULT_DOCUMENT_PAGE_SIZE = 100
+MAX_DOCUMENT_PAGE_SIZE = 1000
+
 
 async def _write_document_content(doc_path: Path, content: str) -> None:
     """Write document content to file (used with lock_update)."""
@@ -155,8 +159,9 @@ async def create_mcp_document(
         return {"success": False, "error": "Document content too large", "error_type": "validation"}
 
     try:
-        # Normalize document name based on content (appends correct extension if needed)
-        normalized_name = normalize_document_name(name, content)
+        # Normalize document name based on content (appends correct extension if needed) and
+        # detect its mime-type in the same pass, off the event loop
+        normalized_name, detected_mime = await asyncio.to_thread(resolve_document_type, name, content)
 
         # Re-validate normalized name
         if not _validate_document_name(normalized_name):
@@ -166,9 +171,9 @@ async def create_mcp_document(
                 "error_type": "validation",
             }
 
-        # Detect mime-type using hybrid approach if not provided
+        # Use the detected mime-type if none was provided
         if mime_type is None:
-            mime_type = detect_best_mime_type(normalized_name, content)
+            mime_type = detected_mime
 
         # Get documents directory
         docs_dir = _get_docs_dir(category_dir)
@@ -184,8 +189,9 @@ async def create_mcp_document(
 
         metadata = DocumentMetadata(source_type=source_type, content_hash=content_hash, mime_type=mime_type)
 
-        # Create sidecar metadata
+        # Create sidecar metadata and record both in the directory manifest
         create_sidecar_metadata(doc_path, metadata)
+        await record_document(doc_path, metadata)
 
         # Generate URI (use normalized name)
         uri = _generate_document_uri(category_dir, normalized_name)
@@ -254,8 +260,9 @@ async def update_mcp_document(
             mime_type=existing_metadata.mime_type,
         )
 
-        # Update sidecar metadata
+        # Update sidecar metadata and the directory manifest
         create_sidecar_metadata(doc_path, updated_metadata)
+        await record_document(doc_path, updated_metadata)
 
         # Generate URI
         uri = _generate_document_uri(category_dir, name)
@@ -304,66 +311,155 @@ async def delete_mcp_document(
         if metadata_path.exists():
             metadata_path.unlink()
 
+        await remove_document(doc_path)
+
         return {"success": True, "message": f"Document '{name}' deleted successfully"}
 
     except Exception as e:
         return handle_operation_error("delete_mcp_document", e, {"category_dir": category_dir, "name": name})
 
 
+def _encode_cursor(name: str) -> str:
+    """Encode the last listed document name as an opaque pagination cursor."""
+    return base64.urlsafe_b64encode(name.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> Optional[str]:
+    """Decode a pagination cursor, returning None if it is malformed."""
+    try:
+        return base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+    except (ValueError, UnicodeError):
+        return None
+
+
+def _iter_document_names(docs_dir: Path, after: Optional[str]) -> Iterator[Tuple[str, bool]]:
+    """Yield ``(name, has_sidecar)`` for each document in name order, starting after ``after``.
+
+    Only the directory listing is read; nothing is stat'ed or opened.
+    """
+    with os.scandir(docs_dir) as it:
+        entries = {entry.name: entry for entry in it}
+
+    for name in sorted(entries):
+        # Hidden files (such as the document manifest) are bookkeeping, not documents
+        if name.endswith(METADATA_SUFFIX) or name.startswith(".") or (after is not None and name <= after):
+            continue
+        if entries[name].is_file():
+            yield name, f"{name}{METADATA_SUFFIX}" in entries
+
+
+def _iter_document_infos(
+    docs_dir: Path,
+    names: Iterator[Tuple[str, bool]],
+    source_type: Optional[str],
+    mime_type: Optional[str],
+) -> Iterator[Dict[str, Any]]:
+    """Yield listing entries for documents passing the filters.
+
+    Filters are applied before each document is stat'ed. Documents without a
+    sidecar are filtered on their name alone, and sidecar metadata comes from
+    the directory manifest when its recorded stamp is still current, so a
+    sidecar is only parsed when the manifest is stale.
+    """
+    manifest = read_manifest(docs_dir)
+
+    for name, has_sidecar in names:
+        doc_path = docs_dir / name
+        stored_metadata: Dict[str, Any] = {}
+        if has_sidecar:
+            entry = manifest.get(name)
+            if entry is not None and entry.sidecar == file_stamp(get_metadata_path(doc_path)):
+                if entry.metadata is not None and entry.metadata_valid:
+                    stored_metadata = entry.metadata
+            else:
+                stored_metadata_obj = read_sidecar_metadata(doc_path)
+                stored_metadata = stored_metadata_obj.model_dump() if stored_metadata_obj else {}
+
+        doc_source_type = stored_metadata.get("source_type", "unknown")
+        doc_mime_type = stored_metadata["mime_type"] if "mime_type" in stored_metadata else detect_mime_type(name)
+
+        # Apply filters
+        if source_type and doc_source_type != source_type:
+            continue
+        if mime_type and doc_mime_type != mime_type:
+            continue
+
+        # Get filesystem metadata
+        try:
+            stat = doc_path.stat()
+        except FileNotFoundError:
+            # Deleted since the directory was listed
+            continue
+
+        # Use birth time if available (macOS/BSD), fall back to ctime
+        try:
+            created_at = getattr(stat, "st_birthtime", stat.st_ctime)  # type: ignore[attr-defined]
+        except AttributeError:
+            created_at = stat.st_ctime  # Linux/other Unix (inode change time)
+
+        yield {
+            "name": name,
+            "path": str(doc_path),
+            "size": stat.st_size,
+            "created_at": created_at,
+            "updated_at": stat.st_mtime,
+            "source_type": doc_source_type,
+            "mime_type": doc_mime_type,
+            "content_hash": stored_metadata.get("content_hash", ""),
+        }
+
+
 async def list_mcp_documents(
     category_dir: str,
     source_type: Optional[str] = None,
     mime_type: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
 ) -> Dict[str, Any]:
     """List server documents from category/__docs__/ with optional filtering.
-    This is a read-only operation that displays available documents without making changes."""
-    try:
-        # Trigger async cleanup for this category
-        add_category(category_dir)
+    This is a read-only operation that displays available documents without making changes.
+
+    Documents are returned in name order. Without `limit` or `cursor` every document is
+    returned. With either, results are paginated (at most `limit` per call): when more
+    remain, pass the returned `next_cursor` as `cursor` to fetch the next page."""
+    if limit is None and cursor:
+        limit = DEFAULT_DOCUMENT_PAGE_SIZE
+    if limit is not None and (limit < 1 or limit > MAX_DOCUMENT_PAGE_SIZE):
+        return {
+            "success": False,
+            "error": f"limit must be between 1 and {MAX_DOCUMENT_PAGE_SIZE}",
+            "error_type": "validation",
+        }
+
+    after = None
+    if cursor:
+        after = _decode_cursor(cursor)
+        if after is None:
+            return {"success": False, "error": "Invalid cursor", "error_type": "validation"}
 
+    try:
         # Get documents directory
         docs_dir = _get_docs_dir(category_dir)
 
+        # Trigger async cleanup for this category, resolved against the docroot
+        add_category(str(docs_dir.parent))
+
         if not docs_dir.exists():
-            return {"success": True, "documents": []}
+            return {"success": True, "documents": [], "next_cursor": None}
 
-        documents = []
+        pipeline = _iter_document_infos(docs_dir, _iter_document_names(docs_dir, after), source_type, mime_type)
+        if limit is None:
+            return {"success": True, "documents": list(pipeline), "next_cursor": None}
 
-        for doc_path in docs_dir.iterdir():
-            if doc_path.is_file() and not doc_path.name.endswith(METADATA_SUFFIX):
-                # Get filesystem metadata
-                stat = doc_path.stat()
+        # Pull one document past the page to learn whether another page exists
+        documents = list(islice(pipeline, limit + 1))
 
-                # Get stored metadata
-                stored_metadata_obj = read_sidecar_metadata(doc_path)
-                stored_metadata = stored_metadata_obj.model_dump() if stored_metadata_obj else {}
+        next_cursor = None
+        if len(documents) > limit:
+            documents = documents[:limit]
+            next_cursor = _encode_cursor(documents[-1]["name"])
 
-                # Use birth time if available (macOS/BSD), fall back to ctime
-                try:
-                    created_at = getattr(stat, "st_birthtime", stat.st_ctime)  # type: ignore[attr-defined]
-                except AttributeError:
-                    created_at = stat.st_ctime  # Linux/other Unix (inode change time)
-
-                doc_info = {
-                    "name": doc_path.name,
-                    "path": str(doc_path),
-                    "size": stat.st_size,
-                    "created_at": created_at,
-                    "updated_at": stat.st_mtime,
-                    "source_type": stored_metadata.get("source_type", "unknown"),
-                    "mime_type": stored_metadata.get("mime_type", detect_mime_type(doc_path.name)),
-                    "content_hash": stored_metadata.get("content_hash", ""),
-                }
-
-                # Apply filters
-                if source_type and doc_info["source_type"] != source_type:
-                    continue
-                if mime_type and doc_info["mime_type"] != mime_type:
-                    continue
-
-                documents.append(doc_info)
-
-        return {"success": True, "documents": documents}
+        return {"success": True, "documents": documents, "next_cursor": next_cursor}
 
     except Exception as e:
         return handle_operation_error("list_mcp_documents", e, {"category_dir": category_dir})
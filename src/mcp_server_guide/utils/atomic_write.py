@@ -0,0 +1,65 @@
+"""Atomic file replacement."""
+
+import os
+import tempfile
+from pathlib import Path
+
+TEMP_SUFFIX = ".tmp"
+
+
+def _read_umask() -> int:
+    """Return the process umask, which can only be read by setting it."""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Read once at import: swapping the umask later would race with other threads creating files
+_UMASK = _read_umask()
+
+
+def write_text_atomic(path: Path, text: str, encoding: str = "utf-8", *, durable: bool = False) -> None:
+    """Write text to a hidden temporary file beside ``path``, then rename it into place.
+
+    Readers see either the old file or the new one, never a partial write.
+    A symlinked ``path`` has its target replaced, not the link. An existing
+    file's permissions carry over to its replacement; a new file gets the
+    usual ``0o666`` less the umask rather than ``mkstemp``'s ``0o600``. With
+    ``durable=True`` the data is fsynced before the rename and the rename
+    itself afterwards, so the new content also survives a crash. The
+    temporary file is removed if writing fails.
+    """
+    path = Path(os.path.realpath(path))
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=TEMP_SUFFIX)
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as f:
+            f.write(text)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        try:
+            mode = os.stat(path).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(temp_name, mode)
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+    if durable:
+        _fsync_directory(path.parent)
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist a rename in ``directory``, where the platform allows opening directories."""
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
@@ -5,40 +5,25 @@ from typing import List
 
 from ..constants import DOCUMENT_SUBDIR
 from ..models.document_info import DocumentInfo
-from ..utils.document_helpers import get_metadata_path, is_document_file
-from ..utils.sidecar_operations import read_sidecar_metadata
+from ..utils.document_helpers import get_metadata_path
+from ..utils.document_manifest import load_manifest
 
 
 def get_category_documents_by_path(category_dir: Path) -> List[DocumentInfo]:
     """Discover all managed documents in category directory's DOCUMENT_SUBDIR."""
     docs_dir = category_dir / DOCUMENT_SUBDIR
 
-    if not docs_dir.exists():
-        return []
-
     documents = []
 
-    for file_path in docs_dir.rglob("*"):
-        if file_path.is_file() and is_document_file(file_path):
-            metadata_path = get_metadata_path(file_path)
-
-            # Try to read metadata, use empty dict if not available
-            metadata = {}
-            if metadata_path.exists():
-                try:
-                    metadata_obj = read_sidecar_metadata(file_path)
-                    if metadata_obj:
-                        metadata = metadata_obj.model_dump()
-                except Exception:
-                    # If metadata is corrupted, continue with empty metadata
-                    pass
-
-            documents.append(
-                DocumentInfo(
-                    path=file_path,
-                    metadata_path=metadata_path,
-                    metadata=metadata,
-                )
+    for name, entry in load_manifest(docs_dir).items():
+        file_path = docs_dir / name
+        documents.append(
+            DocumentInfo(
+                path=file_path,
+                metadata_path=get_metadata_path(file_path),
+                # Missing or invalid metadata is reported as empty
+                metadata=dict(entry.metadata) if entry.metadata and entry.metadata_valid else {},
             )
+        )
 
     return documents
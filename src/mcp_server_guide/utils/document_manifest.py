@@ -0,0 +1,283 @@
+"""Per-directory manifest of managed documents.
+
+Each ``__docs__`` directory keeps one ``DOCUMENT_MANIFEST`` file recording
+every document's inode, size, mtime, content hash and sidecar metadata, so listing
+a category reads one file and stats the directory instead of opening and
+parsing a sidecar per document. The manifest is only ever a cache of what is
+on disk: entries whose document or sidecar no longer matches the recorded
+stat are rebuilt on load, and the manifest is rewritten when anything drifted.
+"""
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..constants import DOCUMENT_MANIFEST, METADATA_SUFFIX
+from ..file_lock import lock_update, try_lock_update
+from ..logging_config import get_logger
+from ..models.document_metadata import DocumentMetadata
+from .atomic_write import write_text_atomic
+from .document_helpers import is_document_file
+from .document_utils import generate_file_hash
+from .stat_stamp import FileStamp, stat_stamp
+
+logger = get_logger()
+
+# Bumped whenever the entry layout changes; other versions are rebuilt
+MANIFEST_VERSION = 2
+
+# Recorded hash of a document that could not be read; rebuilt on the next load
+UNKNOWN_HASH = ""
+
+
+@dataclass
+class ManifestEntry:
+    """One managed document as recorded in its directory's manifest."""
+
+    name: str  # POSIX path relative to the __docs__ directory
+    ino: int
+    size: int
+    mtime_ns: int
+    content_hash: str  # UNKNOWN_HASH if the document could not be read
+    metadata: Optional[Dict[str, Any]] = None  # Raw sidecar JSON; None if missing or unreadable
+    metadata_valid: bool = False  # Whether the sidecar validates as DocumentMetadata
+    sidecar: Optional[FileStamp] = None
+
+    def matches(self, stamp: FileStamp, sidecar: Optional[FileStamp]) -> bool:
+        """Check whether the document and its sidecar are unchanged since this entry was built."""
+        return (self.ino, self.size, self.mtime_ns) == stamp and self.sidecar == sidecar
+
+
+def load_manifest(docs_dir: Path) -> Dict[str, ManifestEntry]:
+    """Return the managed documents under ``docs_dir`` keyed by relative name.
+
+    The directory tree is walked and stat'ed, but documents and sidecars are
+    only read for entries missing from the manifest or whose stats drifted.
+    The refreshed manifest is written back when anything changed, under the
+    lock ``record_document`` and ``remove_document`` take, merged with
+    whatever they recorded since it was read. The write is skipped if the
+    lock is busy or the tree is read-only, which only costs the next load the
+    same rebuild.
+    """
+    if not docs_dir.is_dir():
+        return {}
+
+    stored = read_manifest(docs_dir)
+    entries: Dict[str, ManifestEntry] = {}
+    drifted = False
+    for name, path, stamp, sidecar in _scan(docs_dir):
+        entry = stored.get(name)
+        if entry is None or entry.content_hash == UNKNOWN_HASH or not entry.matches(stamp, sidecar):
+            drifted = True
+            entry = _build_entry(name, path, stamp, sidecar)
+        entries[name] = entry
+
+    if drifted or entries.keys() != stored.keys():
+        logger.debug(f"Rebuilt document manifest for {docs_dir} ({len(entries)} documents)")
+        try:
+            if try_lock_update(docs_dir / DOCUMENT_MANIFEST, _write_back, stored, entries) is None:
+                logger.debug(f"Document manifest for {docs_dir} is being updated; not writing it back")
+        except OSError as e:
+            logger.debug(f"Could not write document manifest for {docs_dir}: {e}")
+    return entries
+
+
+def _write_back(manifest_path: Path, stored: Dict[str, ManifestEntry], entries: Dict[str, ManifestEntry]) -> bool:
+    """Write scanned ``entries`` over the manifest, keeping changes recorded since ``stored`` was read."""
+    docs_dir = manifest_path.parent
+    current = read_manifest(docs_dir)
+    merged = dict(entries)
+    for name in stored.keys() | current.keys():
+        if current.get(name) == stored.get(name):
+            continue
+        # Recorded or removed by the server after the scan started; that is newer
+        if name in current:
+            merged[name] = current[name]
+        else:
+            merged.pop(name, None)
+    _write_manifest(docs_dir, merged)
+    return True
+
+
+async def record_document(doc_path: Path, metadata: DocumentMetadata) -> None:
+    """Record a document just written by the server, with the metadata written to its sidecar.
+
+    The hash is taken from the file as ``_build_entry`` would, not from
+    ``metadata``, so the entry matches what a rebuild would record.
+    """
+
+    async def update(manifest_path: Path) -> None:
+        docs_dir = manifest_path.parent
+        entries = read_manifest(docs_dir)
+        name = doc_path.relative_to(docs_dir).as_posix()
+        ino, size, mtime_ns = stat_stamp(os.stat(doc_path))
+        entries[name] = ManifestEntry(
+            name=name,
+            ino=ino,
+            size=size,
+            mtime_ns=mtime_ns,
+            content_hash=_hash_document(doc_path),
+            metadata=metadata.model_dump(),
+            metadata_valid=True,
+            sidecar=file_stamp(doc_path.parent / f"{doc_path.name}{METADATA_SUFFIX}"),
+        )
+        _write_manifest(docs_dir, entries)
+
+    await lock_update(doc_path.parent / DOCUMENT_MANIFEST, update)
+
+
+async def remove_document(doc_path: Path) -> None:
+    """Drop a deleted document from its directory's manifest."""
+
+    async def update(manifest_path: Path) -> None:
+        docs_dir = manifest_path.parent
+        entries = read_manifest(docs_dir)
+        if entries.pop(doc_path.relative_to(docs_dir).as_posix(), None) is not None:
+            _write_manifest(docs_dir, entries)
+
+    await lock_update(doc_path.parent / DOCUMENT_MANIFEST, update)
+
+
+def _scan(docs_dir: Path) -> Iterator[Tuple[str, Path, FileStamp, Optional[FileStamp]]]:
+    """Yield ``(name, path, stamp, sidecar stamp)`` for every document file under ``docs_dir``.
+
+    Symlinked files are followed, symlinked directories are not (as with
+    ``Path.rglob``). Names are yielded in sorted order.
+    """
+    stack: List[Tuple[str, str]] = [(str(docs_dir), "")]
+    while stack:
+        dir_path, prefix = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                listing = sorted(it, key=lambda entry: entry.name)
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory {dir_path}: {e}")
+            continue
+
+        by_name = {entry.name: entry for entry in listing}
+        subdirs: List[Tuple[str, str]] = []
+        for entry in listing:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append((entry.path, f"{prefix}{entry.name}/"))
+                    continue
+                if not entry.is_file() or not is_document_file(Path(entry.name)):
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+
+            sidecar_stamp = None
+            sidecar = by_name.get(f"{entry.name}{METADATA_SUFFIX}")
+            if sidecar is not None:
+                try:
+                    sidecar_st = sidecar.stat()
+                    sidecar_stamp = stat_stamp(sidecar_st)
+                except OSError:
+                    pass
+            yield f"{prefix}{entry.name}", Path(entry.path), stat_stamp(st), sidecar_stamp
+
+        stack.extend(reversed(subdirs))
+
+
+def _build_entry(name: str, path: Path, stamp: FileStamp, sidecar: Optional[FileStamp]) -> ManifestEntry:
+    """Read a document and its sidecar into a fresh manifest entry.
+
+    A document that cannot be read is still listed, with ``UNKNOWN_HASH``.
+    """
+    content_hash = _hash_document(path)
+
+    metadata = None
+    metadata_valid = False
+    if sidecar is not None:
+        sidecar_path = path.parent / f"{path.name}{METADATA_SUFFIX}"
+        try:
+            with open(sidecar_path) as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+            logger.warning(f"Failed to read metadata for {path}")
+        else:
+            if isinstance(data, dict):
+                metadata = data
+                try:
+                    DocumentMetadata(**data)
+                    metadata_valid = True
+                except ValueError:
+                    logger.debug(f"Metadata for {path} does not validate")
+            else:
+                logger.warning(f"Failed to read metadata for {path}")
+
+    return ManifestEntry(
+        name=name,
+        ino=stamp[0],
+        size=stamp[1],
+        mtime_ns=stamp[2],
+        content_hash=content_hash,
+        metadata=metadata,
+        metadata_valid=metadata_valid,
+        sidecar=sidecar,
+    )
+
+
+def _hash_document(path: Path) -> str:
+    """Hash a document file, or return ``UNKNOWN_HASH`` if it cannot be read."""
+    try:
+        return generate_file_hash(path)
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning(f"Failed to read document {path}: {e}")
+        return UNKNOWN_HASH
+
+
+def file_stamp(path: Path) -> Optional[FileStamp]:
+    """Stat a file for comparison with recorded stamps, or None if it is missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return stat_stamp(st)
+
+
+def read_manifest(docs_dir: Path) -> Dict[str, ManifestEntry]:
+    """Read a stored manifest as-is, treating a missing, corrupt or outdated one as empty.
+
+    Entries may be stale; check them with ``ManifestEntry.matches`` or use
+    ``load_manifest`` to bring the manifest up to date first.
+    """
+    try:
+        with open(docs_dir / DOCUMENT_MANIFEST, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != MANIFEST_VERSION:
+            return {}
+        entries = {}
+        for raw in data["documents"]:
+            sidecar = raw.get("sidecar")
+            entry = ManifestEntry(**{**raw, "sidecar": tuple(sidecar) if sidecar is not None else None})
+            entries[entry.name] = entry
+        return entries
+    except FileNotFoundError:
+        return {}
+    except (json.JSONDecodeError, OSError, UnicodeDecodeError, AttributeError, KeyError, TypeError) as e:
+        logger.debug(f"Ignoring unreadable document manifest in {docs_dir}: {e}")
+        return {}
+
+
+def _write_manifest(docs_dir: Path, entries: Dict[str, ManifestEntry]) -> None:
+    """Atomically replace the manifest so readers never see a partial file."""
+    payload = json.dumps(
+        {"version": MANIFEST_VERSION, "documents": [asdict(entries[name]) for name in sorted(entries)]},
+        separators=(",", ":"),
+    )
+    write_text_atomic(docs_dir / DOCUMENT_MANIFEST, payload)
+
+
+__all__ = [
+    "UNKNOWN_HASH",
+    "ManifestEntry",
+    "file_stamp",
+    "load_manifest",
+    "read_manifest",
+    "record_document",
+    "remove_document",
+]
@@ -2,15 +2,35 @@
 
 import hashlib
 import mimetypes
+import mmap
+import os
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 import magic
 
 from ..logging_config import get_logger
+from .lru_cache import CacheStats, LRUCache
+from .stat_stamp import FileStamp, stat_stamp
 
 logger = get_logger()
 
+# Bytes (or characters, when newlines must be translated) read per chunk when hashing a document file
+HASH_CHUNK_SIZE = 64 * 1024
+
+# Files at least this large are hashed through a memory map instead of chunked reads
+HASH_MMAP_THRESHOLD = 1024 * 1024
+
+# Maximum number of file hashes remembered
+DEFAULT_FILE_HASH_CACHE_ENTRIES = 4096
+
+# Characters of content inspected when sniffing a MIME type
+MIME_SNIFF_CHARS = 64 * 1024
+
+# Maximum number of content sniffing results remembered
+DEFAULT_MIME_CACHE_ENTRIES = 1024
+
 # Initialize mimetypes and add common types that might be missing
 mimetypes.init()
 mimetypes.add_type("text/yaml", ".yaml")
@@ -25,12 +45,197 @@ def generate_content_hash(content: str) -> str:
     return f"sha256:{hashlib.sha256(content.encode('utf-8')).hexdigest()}"
 
 
+class FileHashCache:
+    """LRU memo of document hashes keyed by path and stat.
+
+    An entry is only served while the file's inode, size and mtime still
+    match the ones it was hashed at, so edits are picked up without explicit
+    invalidation. Files are hashed on worker threads, so operations are
+    guarded by a lock.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_FILE_HASH_CACHE_ENTRIES):
+        self._entries: LRUCache[str, Tuple[FileStamp, str]] = LRUCache(max_entries=max_entries)
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit/miss/eviction counters."""
+        return self._entries.stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, path: Path, stamp: FileStamp) -> Optional[str]:
+        """Return the cached hash if the file was hashed with this stamp."""
+        with self._lock:
+            entry = self._entries.get(str(path), lambda e: e[0] == stamp)
+        return entry[1] if entry is not None else None
+
+    def put(self, path: Path, stamp: FileStamp, content_hash: str) -> None:
+        """Store a file's hash, evicting the least recently used entries."""
+        with self._lock:
+            self._entries.put(str(path), (stamp, content_hash))
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Global file hash cache instance (singleton)
+_file_hash_cache: Optional[FileHashCache] = None
+
+
+def get_file_hash_cache() -> FileHashCache:
+    """Get the process-wide file hash cache."""
+    global _file_hash_cache
+    if _file_hash_cache is None:
+        _file_hash_cache = FileHashCache()
+    return _file_hash_cache
+
+
+def generate_file_hash(path: Path) -> str:
+    """Generate SHA256 hash of a document file without holding its text in memory.
+
+    For any UTF-8 document this equals
+    ``generate_content_hash(path.read_text(encoding="utf-8"))``. Files are
+    hashed as raw bytes, streamed in chunks or through ``mmap`` when large,
+    so nothing is decoded or re-encoded; only documents containing carriage
+    returns fall back to decoding, to apply the same newline translation as
+    ``read_text``. Binary files that are not valid UTF-8 hash as their raw
+    bytes. Results are remembered until the file's inode, size or mtime
+    changes.
+    """
+    st = os.stat(path)
+    stamp = stat_stamp(st)
+    cache = get_file_hash_cache()
+    cached = cache.get(path, stamp)
+    if cached is not None:
+        return cached
+
+    content_hash = _hash_bytes(path)
+    if content_hash is None:
+        try:
+            content_hash = _hash_text(path)
+        except UnicodeDecodeError:
+            # Not text, so there are no newlines to translate
+            content_hash = _hash_raw_bytes(path)
+    cache.put(path, stamp, content_hash)
+    return content_hash
+
+
+def _hash_bytes(path: Path) -> Optional[str]:
+    """Hash a file's raw bytes, or return None if it contains a carriage return."""
+    digest = hashlib.sha256()
+    if not _digest_file(digest, path, stop_at_cr=True):
+        return None
+    return f"sha256:{digest.hexdigest()}"
+
+
+def _hash_raw_bytes(path: Path) -> str:
+    """Hash a file's raw bytes, carriage returns included."""
+    digest = hashlib.sha256()
+    _digest_file(digest, path, stop_at_cr=False)
+    return f"sha256:{digest.hexdigest()}"
+
+
+def _digest_file(digest: "hashlib._Hash", path: Path, stop_at_cr: bool) -> bool:
+    """Feed a file's bytes into ``digest``; returns False if stopped at a carriage return."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= HASH_MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if stop_at_cr and mapped.find(b"\r") != -1:
+                    return False
+                digest.update(mapped)
+        else:
+            while chunk := f.read(HASH_CHUNK_SIZE):
+                if stop_at_cr and b"\r" in chunk:
+                    return False
+                digest.update(chunk)
+    return True
+
+
+def _hash_text(path: Path) -> str:
+    """Hash a file's decoded text in chunks, translating newlines like ``read_text``."""
+    digest = hashlib.sha256()
+    with open(path, encoding="utf-8") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk.encode("utf-8"))
+    return f"sha256:{digest.hexdigest()}"
+
+
 def detect_mime_type(filename: str) -> str:
     """Detect MIME type using Python stdlib (from filename only)."""
     mime_type, _ = mimetypes.guess_type(filename, strict=False)
     return mime_type or "application/octet-stream"
 
 
+class MimeDetector:
+    """Content-based MIME detection sharing one libmagic handle.
+
+    Only the first ``sniff_chars`` characters of a document are encoded and
+    passed to libmagic, and results are remembered by a digest of that
+    prefix, so detecting the same content again (for example once for the
+    requested name and once for the normalized one) costs a hash of the
+    prefix. ``magic.Magic`` serializes access to its handle, so a detector
+    can be shared between threads.
+    """
+
+    def __init__(self, sniff_chars: int = MIME_SNIFF_CHARS, max_entries: int = DEFAULT_MIME_CACHE_ENTRIES):
+        self.sniff_chars = sniff_chars
+        self._magic: Optional[magic.Magic] = None
+        self._entries: LRUCache[bytes, str] = LRUCache(max_entries=max_entries)
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit/miss/eviction counters."""
+        return self._entries.stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def from_content(self, content: str) -> str:
+        """Detect a MIME type from the start of the content, or application/octet-stream on failure."""
+        try:
+            sample = content[: self.sniff_chars].encode("utf-8")
+            key = hashlib.sha256(sample).digest()
+            with self._lock:
+                cached = self._entries.get(key)
+                if cached is not None:
+                    return cached
+                if self._magic is None:
+                    self._magic = magic.Magic(mime=True)
+                detector = self._magic
+
+            mime_type = str(detector.from_buffer(sample))
+        except Exception as e:
+            logger.warning(f"Failed to detect mime-type from content ({type(e).__name__}): {e}")
+            return "application/octet-stream"
+
+        with self._lock:
+            self._entries.put(key, mime_type)
+        return mime_type
+
+    def clear(self) -> None:
+        """Drop all remembered results and reset counters."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Global MIME detector instance (singleton)
+_mime_detector: Optional[MimeDetector] = None
+
+
+def get_mime_detector() -> MimeDetector:
+    """Get the process-wide MIME detector."""
+    global _mime_detector
+    if _mime_detector is None:
+        _mime_detector = MimeDetector()
+    return _mime_detector
+
+
 def detect_mime_type_from_content(content: str) -> str:
     """Detect MIME type from actual content using python-magic.
 
@@ -43,14 +248,7 @@ def detect_mime_type_from_content(content: str) -> str:
     Returns:
         Detected MIME type
     """
-    try:
-        # Convert string to bytes for magic detection
-        content_bytes = content.encode("utf-8")
-        mime_type = magic.from_buffer(content_bytes, mime=True)
-        return mime_type
-    except (UnicodeDecodeError, Exception) as e:
-        logger.warning(f"Failed to detect mime-type from content ({type(e).__name__}): {e}")
-        return "application/octet-stream"
+    return get_mime_detector().from_content(content)
 
 
 def detect_best_mime_type(filename: str, content: str) -> str:
@@ -60,6 +258,8 @@ def detect_best_mime_type(filename: str, content: str) -> str:
     - Detect from content (python-magic) - authoritative
     - Detect from filename (stdlib) - more specific
     - If both agree on category (e.g., text/*), use filename (more specific)
+    - If only a truncated prefix was sniffed and it looks like plain text, use
+      filename (cut-off JSON, XML, etc. no longer parses as structured data)
     - If they disagree, trust content detection
 
     Args:
@@ -69,13 +269,18 @@ def detect_best_mime_type(filename: str, content: str) -> str:
     Returns:
         Best detected MIME type
     """
-    content_mime = detect_mime_type_from_content(content)
+    detector = get_mime_detector()
+    content_mime = detector.from_content(content)
     filename_mime = detect_mime_type(filename)
 
     # If filename detection failed, use content
     if filename_mime == "application/octet-stream":
         return content_mime
 
+    # A truncated sample of structured text only tells us it is text
+    if content_mime == "text/plain" and len(content) > detector.sniff_chars:
+        return filename_mime
+
     # Extract category (e.g., "text" from "text/plain")
     content_category = content_mime.split("/")[0]
     filename_category = filename_mime.split("/")[0]
@@ -113,9 +318,29 @@ def normalize_document_name(name: str, content: str) -> str:
     Returns:
         Normalized filename with appropriate extension
     """
-    # Detect best mime-type using hybrid approach
+    return _apply_mime_extension(name, detect_best_mime_type(name, content))
+
+
+def resolve_document_type(name: str, content: str) -> Tuple[str, str]:
+    """Normalize a document name and detect its best mime-type, sniffing the content once.
+
+    Args:
+        name: Document filename
+        content: Document content
+
+    Returns:
+        Tuple of the normalized filename and the best mime-type for it
+    """
     detected_mime = detect_best_mime_type(name, content)
+    normalized_name = _apply_mime_extension(name, detected_mime)
+    if normalized_name != name:
+        # Only the filename side changed; the content side is served from the detector's memo
+        detected_mime = detect_best_mime_type(normalized_name, content)
+    return normalized_name, detected_mime
+
 
+def _apply_mime_extension(name: str, detected_mime: str) -> str:
+    """Append the primary extension for a detected mime-type unless the name already has a valid one."""
     # Get valid extensions for this mime-type
     valid_extensions = mimetypes.guess_all_extensions(detected_mime, strict=False)
 
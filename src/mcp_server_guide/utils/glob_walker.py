@@ -0,0 +1,328 @@
+"""Single-pass matching of category glob patterns against a directory tree."""
+
+import glob
+import os
+import posixpath
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Pattern, Sequence, Set, Tuple
+
+from ..logging_config import get_logger
+from .lru_cache import CacheStats, LRUCache
+
+logger = get_logger()
+
+# Maximum number of cached pattern-match results
+DEFAULT_GLOB_CACHE_ENTRIES = 256
+
+# (path, mtime_ns, inode) of a directory scanned during a walk
+DirectoryStamp = Tuple[str, int, int]
+
+# Position of an entry in the tree: its scan index within each directory on its path
+TreeOrder = Tuple[int, ...]
+
+# (search dir, patterns, max depth, limit, excluded suffix)
+GlobCacheKey = Tuple[str, Tuple[str, ...], int, int, str]
+
+
+def _translate(pattern: str) -> Pattern[str]:
+    """Compile a glob pattern with the semantics of ``glob.iglob(recursive=True)``."""
+    return re.compile(glob.translate(pattern, recursive=True, include_hidden=False, seps="/"))
+
+
+@dataclass
+class _PatternMatcher:
+    """One glob pattern compiled for matching paths relative to the search directory."""
+
+    path: Pattern[str]
+    segments: Tuple[Optional[Pattern[str]], ...]  # One per path segment; None for '**'
+    files: List[Tuple[os.DirEntry[str], bool, TreeOrder]] = field(default_factory=list)
+    matched: bool = False  # Whether anything (file or directory) matched
+
+    @classmethod
+    def compile(cls, pattern: str) -> "_PatternMatcher":
+        pattern = posixpath.normpath(pattern)
+        segments = tuple(None if part == "**" else _translate(part) for part in pattern.split("/"))
+        return cls(_translate(pattern), segments)
+
+    @property
+    def trailing_recursive(self) -> bool:
+        """Whether the pattern ends in '**', which ``glob`` expands entry by entry."""
+        return self.segments[-1] is None
+
+    @property
+    def max_depth(self) -> Optional[int]:
+        """Deepest directory level a match can sit at, or None for recursive patterns."""
+        return None if None in self.segments else len(self.segments) - 1
+
+    def may_enter(self, dir_parts: Tuple[str, ...]) -> bool:
+        """Check whether a directory, given as relative path parts, can contain a match."""
+        for index, part in enumerate(dir_parts):
+            if index >= len(self.segments):
+                return False
+            segment = self.segments[index]
+            if segment is None:
+                # '**' never crosses hidden directories; a later segment must name them explicitly
+                later = [s for s in self.segments[index + 1 :] if s is not None]
+                return all(not name.startswith(".") or any(s.match(name) for s in later) for name in dir_parts[index:])
+            if index == len(self.segments) - 1 or not segment.match(part):
+                return False
+        return True
+
+
+def match_category_patterns(
+    search_dir: Path,
+    patterns: Sequence[str],
+    *,
+    max_depth: int,
+    limit: int,
+    exclude_suffix: str,
+) -> List[Path]:
+    """Match glob patterns against a directory tree in a single ``os.scandir`` walk.
+
+    Results keep pattern order, and within a pattern the order ``glob`` would
+    produce: each directory's files before its subdirectories, except for
+    patterns ending in ``**``, whose files and subdirectories interleave in
+    scan order. A pattern
+    without a ``.md`` suffix that matches nothing falls back to the same
+    pattern with ``.md`` appended. Paths are resolved, deduplicated, limited to
+    ``limit`` entries and to files at most ``max_depth`` directories below
+    ``search_dir``; files ending in ``exclude_suffix`` are skipped.
+
+    Directories are pruned during the walk when they are deeper than any
+    pattern can reach or cannot contain a match, and ``DirEntry`` type
+    information avoids a ``stat`` per entry except for symlinks.
+    """
+    return scan_category_patterns(
+        search_dir, patterns, max_depth=max_depth, limit=limit, exclude_suffix=exclude_suffix
+    )[0]
+
+
+def scan_category_patterns(
+    search_dir: Path,
+    patterns: Sequence[str],
+    *,
+    max_depth: int,
+    limit: int,
+    exclude_suffix: str,
+) -> Tuple[List[Path], Tuple[DirectoryStamp, ...]]:
+    """Match patterns like ``match_category_patterns``, also returning stamps of every directory scanned.
+
+    The result cannot change while ``stamps_current`` holds for the stamps.
+    """
+    try:
+        root = search_dir.resolve()
+    except OSError as e:
+        logger.warning(f"Failed to resolve search directory {search_dir}: {e}")
+        return [], ()
+
+    # Each pattern is paired with its implicit .md fallback, if it has one
+    pairs: List[Tuple[_PatternMatcher, Optional[_PatternMatcher]]] = []
+    for pattern in patterns:
+        try:
+            primary = _PatternMatcher.compile(pattern)
+            fallback = None if pattern.endswith(".md") else _PatternMatcher.compile(f"{pattern}.md")
+        except re.error as e:
+            logger.warning(f"Glob pattern '{pattern}' failed: {e}")
+            continue
+        pairs.append((primary, fallback))
+    matchers = [matcher for pair in pairs for matcher in pair if matcher is not None]
+    if not matchers:
+        return [], ()
+
+    depth_limits = [matcher.max_depth for matcher in matchers]
+    walk_depth = max_depth if None in depth_limits else min(max_depth, max(d for d in depth_limits if d is not None))
+
+    stamps = _walk(root, matchers, walk_depth)
+    for matcher in matchers:
+        if matcher.trailing_recursive:
+            # glob yields such matches depth-first in scan order, recursing into each subdirectory as it meets it
+            matcher.files.sort(key=lambda match: match[2])
+
+    matched_files: List[Path] = []
+    seen_files: Set[Path] = set()
+    for primary, fallback in pairs:
+        source = primary if primary.matched or fallback is None else fallback
+        for entry, via_symlink, _ in source.files:
+            if len(matched_files) >= limit:
+                logger.warning(f"Reached maximum document limit ({limit}) for glob search")
+                return matched_files, stamps
+
+            if via_symlink or entry.is_symlink():
+                # Resolve symlinks with error handling
+                try:
+                    resolved_path = Path(entry.path).resolve()
+                    relative_path = resolved_path.relative_to(root)
+                except OSError as e:
+                    logger.warning(f"Failed to resolve symlink {entry.path}: {e}")
+                    continue
+                except ValueError:
+                    logger.debug(f"Skipping file outside search directory: {entry.path}")
+                    continue
+                if len(relative_path.parts) - 1 > max_depth:
+                    continue
+            else:
+                resolved_path = Path(entry.path)
+
+            if resolved_path in seen_files or resolved_path.name.endswith(exclude_suffix):
+                continue
+            matched_files.append(resolved_path)
+            seen_files.add(resolved_path)
+
+    return matched_files, stamps
+
+
+def _walk(root: Path, matchers: List[_PatternMatcher], max_depth: int) -> Tuple[DirectoryStamp, ...]:
+    """Walk the tree once, recording every matcher's hits in glob order.
+
+    Returns a stamp for each directory scanned, taken before it was read so a
+    concurrent change is never mistaken for the state the walk observed.
+    """
+    stamps: List[DirectoryStamp] = []
+    visited: Set[str] = {str(root)}
+    # (directory path, relative parts, tree order, reached through a symlinked directory)
+    stack: List[Tuple[str, Tuple[str, ...], TreeOrder, bool]] = [(str(root), (), (), False)]
+
+    while stack:
+        dir_path, dir_parts, dir_order, via_symlink = stack.pop()
+        try:
+            st = os.stat(dir_path)
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory {dir_path}: {e}")
+            continue
+        stamps.append((dir_path, st.st_mtime_ns, st.st_ino))
+
+        subdirs: List[Tuple[str, Tuple[str, ...], TreeOrder, bool]] = []
+        for index, entry in enumerate(entries):
+            parts = dir_parts + (entry.name,)
+            order = dir_order + (index,)
+            relative = "/".join(parts)
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+
+            if is_dir:
+                for matcher in matchers:
+                    if not matcher.matched and matcher.path.match(relative):
+                        matcher.matched = True
+                if len(parts) > max_depth or not any(matcher.may_enter(parts) for matcher in matchers):
+                    continue
+                if entry.is_symlink():
+                    # Follow symlinked directories only within the tree, and only once
+                    real = os.path.realpath(entry.path)
+                    if real in visited or not real.startswith(str(root) + os.sep):
+                        continue
+                    visited.add(real)
+                    subdirs.append((entry.path, parts, order, True))
+                else:
+                    if not via_symlink:
+                        visited.add(entry.path)
+                    subdirs.append((entry.path, parts, order, via_symlink))
+            elif entry.is_file():
+                for matcher in matchers:
+                    if matcher.path.match(relative):
+                        matcher.matched = True
+                        matcher.files.append((entry, via_symlink, order))
+
+        # Visit subdirectories depth-first in scan order, after this directory's files
+        stack.extend(reversed(subdirs))
+
+    return tuple(stamps)
+
+
+def stamps_current(stamps: Tuple[DirectoryStamp, ...]) -> bool:
+    """Check that every stamped directory still has the same mtime and inode."""
+    for path, mtime_ns, ino in stamps:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        if st.st_mtime_ns != mtime_ns or st.st_ino != ino:
+            return False
+    return True
+
+
+@dataclass
+class _GlobCacheEntry:
+    matched: Tuple[Path, ...]
+    stamps: Tuple[DirectoryStamp, ...]
+
+
+class GlobResultCache:
+    """LRU cache of pattern-match results validated by directory mtimes.
+
+    Adding, removing or renaming an entry updates its parent directory's
+    mtime, so if every directory the walk scanned is unchanged the match
+    result is too, and a hit costs one ``stat`` per scanned directory instead
+    of a traversal. Directories the walk pruned cannot affect the result and
+    are not checked.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_GLOB_CACHE_ENTRIES):
+        self._entries: LRUCache[GlobCacheKey, _GlobCacheEntry] = LRUCache(max_entries=max_entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit/miss/eviction counters."""
+        return self._entries.stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def match(
+        self,
+        search_dir: Path,
+        patterns: Sequence[str],
+        *,
+        max_depth: int,
+        limit: int,
+        exclude_suffix: str,
+    ) -> List[Path]:
+        """Match patterns like ``match_category_patterns``, reusing a still-valid earlier result."""
+        key = (str(search_dir), tuple(patterns), max_depth, limit, exclude_suffix)
+        entry = self._entries.get(key, lambda e: stamps_current(e.stamps))
+        if entry is not None:
+            return list(entry.matched)
+        # An entry still present after a miss has stale stamps
+        self._entries.invalidate(key)
+
+        matched, stamps = scan_category_patterns(
+            search_dir, patterns, max_depth=max_depth, limit=limit, exclude_suffix=exclude_suffix
+        )
+        if stamps:
+            self._entries.put(key, _GlobCacheEntry(tuple(matched), stamps))
+        return matched
+
+    def invalidate_all(self) -> None:
+        """Drop every cached result, e.g. after a category's directory or patterns change."""
+        self._entries.invalidate_all()
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        self._entries.clear()
+
+
+# Global glob result cache instance (singleton)
+_glob_cache: Optional[GlobResultCache] = None
+
+
+def get_glob_cache() -> GlobResultCache:
+    """Get the process-wide glob result cache."""
+    global _glob_cache
+    if _glob_cache is None:
+        _glob_cache = GlobResultCache()
+    return _glob_cache
+
+
+__all__ = [
+    "DirectoryStamp",
+    "GlobResultCache",
+    "get_glob_cache",
+    "match_category_patterns",
+    "scan_category_patterns",
+    "stamps_current",
+]
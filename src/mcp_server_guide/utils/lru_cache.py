@@ -0,0 +1,134 @@
+"""Bounded least-recently-used map with hit and eviction counters."""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss/eviction counters for a cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        """Return counters as a plain dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+class LRUCache(Generic[K, V]):
+    """Map bounded by entry count and, optionally, by the total size of its values.
+
+    The least recently used entries are evicted to make room. Lookups take an
+    optional validity check, so callers can keep stat stamps or fingerprints
+    in their values and have stale entries count as misses. There is no
+    internal locking; caches used from worker threads wrap calls in their own
+    lock.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_size: Optional[int] = None,
+        sizeof: Optional[Callable[[V], int]] = None,
+    ):
+        if max_size is not None and sizeof is None:
+            raise ValueError("max_size requires sizeof")
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.stats = CacheStats()
+        self._sizeof = sizeof
+        self._entries: "OrderedDict[K, V]" = OrderedDict()
+        self._total_size = 0
+
+    @property
+    def total_size(self) -> int:
+        """Total size of the values held, as measured by ``sizeof`` (0 without one)."""
+        return self._total_size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get(self, key: K, valid: Optional[Callable[[V], bool]] = None) -> Optional[V]:
+        """Return the value for ``key`` and mark it most recently used.
+
+        A missing value, or one failing ``valid``, counts as a miss and
+        returns None; an invalid value is left in place for the caller to
+        replace or invalidate.
+        """
+        value = self._entries.get(key)
+        if value is None or (valid is not None and not valid(value)):
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def put(self, key: K, value: V) -> bool:
+        """Store a value, evicting least recently used entries to fit.
+
+        Returns False, leaving no entry for ``key``, if the value alone
+        exceeds the bounds.
+        """
+        self.discard(key)
+        size = self._size(value)
+        if (self.max_size is not None and size > self.max_size) or self.max_entries == 0:
+            return False
+
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) >= self.max_entries)
+            or (self.max_size is not None and self._total_size + size > self.max_size)
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._total_size -= self._size(evicted)
+            self.stats.evictions += 1
+
+        self._entries[key] = value
+        self._total_size += size
+        return True
+
+    def discard(self, key: K) -> bool:
+        """Drop the entry for ``key`` without counting it, returning whether there was one."""
+        if key not in self._entries:
+            return False
+        self._total_size -= self._size(self._entries.pop(key))
+        return True
+
+    def invalidate(self, key: K) -> bool:
+        """Drop the entry for ``key`` because its source changed, returning whether there was one."""
+        if not self.discard(key):
+            return False
+        self.stats.invalidations += 1
+        return True
+
+    def invalidate_all(self) -> None:
+        """Drop every entry because the sources changed."""
+        self.stats.invalidations += len(self._entries)
+        self._entries.clear()
+        self._total_size = 0
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        self._entries.clear()
+        self._total_size = 0
+        self.stats = CacheStats()
+
+    def _size(self, value: V) -> int:
+        return self._sizeof(value) if self._sizeof is not None else 0
+
+
+__all__ = ["CacheStats", "LRUCache"]
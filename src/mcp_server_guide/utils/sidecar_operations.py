@@ -1,32 +1,103 @@
 """Sidecar metadata file operations."""
 
 import json
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from ..logging_config import get_logger
 from ..models.document_metadata import DocumentMetadata
+from .atomic_write import write_text_atomic
 from .document_helpers import get_metadata_path
+from .lru_cache import CacheStats, LRUCache
+from .stat_stamp import FileStamp, stat_stamp
 
 logger = get_logger()
 
+# Maximum number of parsed sidecars kept in memory
+DEFAULT_SIDECAR_CACHE_ENTRIES = 4096
+
+
+class SidecarMetadataCache:
+    """LRU cache of validated sidecar metadata keyed by sidecar path and stat.
+
+    An entry is only served while the sidecar's inode, mtime and size still
+    match the ones it was parsed from, so external edits and replacements
+    are picked up without any explicit invalidation. Callers receive copies, so mutating a returned
+    model never changes the cached one.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_SIDECAR_CACHE_ENTRIES):
+        self._entries: LRUCache[str, Tuple[FileStamp, DocumentMetadata]] = LRUCache(max_entries=max_entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit/miss/eviction counters."""
+        return self._entries.stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, sidecar_path: Path, stamp: FileStamp) -> Optional[DocumentMetadata]:
+        """Return a copy of the cached metadata if it was parsed from a sidecar with this stamp."""
+        entry = self._entries.get(str(sidecar_path), lambda e: e[0] == stamp)
+        return entry[1].model_copy() if entry is not None else None
+
+    def put(self, sidecar_path: Path, stamp: FileStamp, metadata: DocumentMetadata) -> None:
+        """Store metadata parsed from a sidecar, evicting the least recently used entries."""
+        self._entries.put(str(sidecar_path), (stamp, metadata.model_copy()))
+
+    def invalidate(self, sidecar_path: Path) -> None:
+        """Drop the entry for a sidecar, e.g. before it is rewritten."""
+        self._entries.invalidate(str(sidecar_path))
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        self._entries.clear()
+
+
+# Global sidecar cache instance (singleton)
+_sidecar_cache: Optional[SidecarMetadataCache] = None
+
+
+def get_sidecar_cache() -> SidecarMetadataCache:
+    """Get the process-wide sidecar metadata cache."""
+    global _sidecar_cache
+    if _sidecar_cache is None:
+        _sidecar_cache = SidecarMetadataCache()
+    return _sidecar_cache
+
 
 def create_sidecar_metadata(document_path: Path, metadata: DocumentMetadata) -> None:
     """Create sidecar metadata file for a document."""
     sidecar_path = get_metadata_path(document_path)
+    get_sidecar_cache().invalidate(sidecar_path)
 
-    with open(sidecar_path, "w") as f:
-        json.dump(metadata.model_dump(), f, indent=2)
+    # Replaced rather than rewritten in place, so every rewrite gets a new inode and stamp
+    write_text_atomic(sidecar_path, json.dumps(metadata.model_dump(), indent=2))
 
 
 def read_sidecar_metadata(document_path: Path) -> Optional[DocumentMetadata]:
-    """Read sidecar metadata file for a document. Returns None if missing or invalid."""
+    """Read sidecar metadata file for a document. Returns None if missing or invalid.
+
+    Parsed metadata is cached until the sidecar's inode, mtime or size changes.
+    """
     sidecar_path = get_metadata_path(document_path)
+    cache = get_sidecar_cache()
 
     try:
+        # Stat before reading, so a concurrent rewrite can only make the cached entry miss
+        st = os.stat(sidecar_path)
+        stamp = stat_stamp(st)
+        cached = cache.get(sidecar_path, stamp)
+        if cached is not None:
+            return cached
+
         with open(sidecar_path) as f:
             data = json.load(f)
-        return DocumentMetadata(**data)
+        metadata = DocumentMetadata(**data)
+        cache.put(sidecar_path, stamp, metadata)
+        return metadata
     except FileNotFoundError:
         logger.debug(f"Metadata file not found: {sidecar_path}")
         return None
@@ -0,0 +1,13 @@
+"""Stat stamps for telling whether a file changed since it was last read."""
+
+import os
+from typing import Tuple
+
+# (inode, size, mtime_ns) of a file; the inode catches a file renamed over
+# another with the same size and mtime
+FileStamp = Tuple[int, int, int]
+
+
+def stat_stamp(st: os.stat_result) -> FileStamp:
+    """Return the stamp of a file from its ``os.stat`` result."""
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
@@ -2,6 +2,7 @@
 
 from unittest.mock import AsyncMock, Mock, patch
 
+from mcp_server_guide.models.category import Category
 from mcp_server_guide.tools import get_current_project, get_guide, get_project_config, switch_project
 
 
@@ -60,39 +61,34 @@ async def test_switch_project(isolated_config_file):
     assert current == "test-project"
 
 
-@patch("mcp_server_guide.tools.content_tools.get_category_content")
-async def test_get_guide_success(mock_get_category):
+@patch("mcp_server_guide.tools.content_tools.resolve_file_category")
+async def test_get_guide_success(mock_resolve, tmp_path):
     """Test get_guide with successful document retrieval."""
-    mock_get_category.return_value = {
-        "success": True,
-        "content": "# doc1\nSome content\n# doc2\nOther content",
-        "matched_files": ["doc1.md"],
-    }
+    (tmp_path / "doc1.md").write_text("Some content\n")
+    (tmp_path / "doc2.md").write_text("Other content\n")
+    mock_resolve.return_value = (Category(dir="category1/", patterns=["*.md"], description=""), tmp_path)
 
     result = await get_guide("category1", "doc1")
     assert result == "Some content"
-    mock_get_category.assert_called_once_with("category1")
+    mock_resolve.assert_called_once_with("category1")
 
 
-@patch("mcp_server_guide.tools.content_tools.get_category_content")
-async def test_get_guide_missing_document(mock_get_category):
+@patch("mcp_server_guide.tools.content_tools.resolve_file_category")
+async def test_get_guide_missing_document(mock_resolve, tmp_path):
     """Test get_guide with missing document."""
-    mock_get_category.return_value = {
-        "success": True,
-        "content": "# other_doc\nSome content",
-        "matched_files": ["other_doc.md"],
-    }
+    (tmp_path / "other_doc.md").write_text("Some content")
+    mock_resolve.return_value = (Category(dir="category1/", patterns=["*.md"], description=""), tmp_path)
 
     result = await get_guide("category1", "missing_doc")
     assert result is None
-    mock_get_category.assert_called_once_with("category1")
+    mock_resolve.assert_called_once_with("category1")
 
 
-@patch("mcp_server_guide.tools.content_tools.get_category_content")
-async def test_get_guide_invalid_category(mock_get_category):
+@patch("mcp_server_guide.tools.content_tools.resolve_file_category")
+async def test_get_guide_invalid_category(mock_resolve):
     """Test get_guide with invalid category."""
-    mock_get_category.side_effect = Exception("Invalid category")
+    mock_resolve.side_effect = Exception("Invalid category")
 
     result = await get_guide("invalid_category", "doc1")
     assert result is None
-    mock_get_category.assert_called_once_with("invalid_category")
+    mock_resolve.assert_called_once_with("invalid_category")
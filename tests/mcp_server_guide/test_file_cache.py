@@ -1,11 +1,12 @@
 """Tests for HTTP-aware file caching system (Issue 003 Phase 3)."""
 
+import os
 import tempfile
 import time
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
-from mcp_server_guide.file_cache import CacheEntry, FileCache
+from mcp_server_guide.file_cache import CacheEntry, FileCache, TieredFileCache
 
 
 async def test_cache_entry_with_http_headers():
@@ -169,6 +170,11 @@ async def test_file_accessor_with_http_caching():
                 assert call_args[1]["if_modified_since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
                 assert call_args[1]["if_none_match"] == '"v1-etag"'
 
+                # 304 restarts the freshness window, so the next read needs no request
+                content3 = await accessor.read_file("guide.md", http_source)
+                assert content3 == "# Guide v1"
+                assert mock_client.get_conditional.call_count == 1
+
 
 async def test_file_accessor_cache_invalidation():
     """Test cache invalidation when remote content changes."""
@@ -323,3 +329,164 @@ async def test_file_cache_permission_error_fallback():
     assert entry.etag == "123456"
     # Test cache entry validation
     assert not entry.needs_validation()  # Should not need validation with max-age
+
+
+async def test_file_cache_shards_entries_by_key_prefix():
+    """Cache files live in hash-prefix subdirectories."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = FileCache(cache_dir=temp_dir)
+        cache.put("https://example.com/guide.md", "content")
+
+        key = cache._generate_key("https://example.com/guide.md")
+        assert (Path(temp_dir) / key[:2] / f"{key}.json").exists()
+        assert not list(Path(temp_dir).glob("*.json"))
+        assert not list(Path(temp_dir).rglob("*.tmp"))
+
+
+async def test_file_cache_enforces_max_size_with_lru_eviction():
+    """Least recently used entries are evicted once max_size_mb is exceeded."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = FileCache(cache_dir=temp_dir, max_size_mb=1)
+        chunk = "x" * 400_000
+
+        cache.put("https://example.com/a.md", chunk)
+        cache.put("https://example.com/b.md", chunk)
+        with patch("time.time", return_value=time.time() + 10):
+            assert cache.get("https://example.com/a.md") is not None
+            cache.put("https://example.com/c.md", chunk)
+
+        assert cache.get("https://example.com/b.md") is None
+        assert cache.get("https://example.com/a.md") is not None
+        assert cache.get("https://example.com/c.md") is not None
+        assert cache.total_size <= cache.max_size_bytes
+
+
+async def test_file_cache_compacts_directory_on_first_use():
+    """Startup compaction migrates flat entries, drops temp files and enforces the limit."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        seed = FileCache(cache_dir=temp_dir)
+        key = seed._generate_key("https://example.com/legacy.md")
+        (Path(temp_dir) / f"{key}.json").write_text('{"content": "legacy", "headers": {}, "cached_at": 0}')
+        (Path(temp_dir) / "ab").mkdir()
+        abandoned = Path(temp_dir) / "ab" / "partial.tmp"
+        abandoned.write_text("interrupted")
+        old = time.time() - FileCache.STALE_TEMP_SECONDS - 60
+        os.utime(abandoned, (old, old))
+        in_progress = Path(temp_dir) / "ab" / "writing.tmp"
+        in_progress.write_text("another process")
+
+        cache = FileCache(cache_dir=temp_dir)
+        entry = cache.get("https://example.com/legacy.md")
+
+        assert entry is not None and entry.content == "legacy"
+        assert (Path(temp_dir) / key[:2] / f"{key}.json").exists()
+        assert not abandoned.exists()
+        assert in_progress.exists()
+
+        cache.max_size_mb = 0
+        cache.compact()
+        assert cache.total_size == 0
+        assert cache.get("https://example.com/legacy.md") is None
+
+
+async def test_file_cache_sees_entries_written_by_another_process():
+    """Entries written after the index was built are found on lookup and indexed."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        reader = FileCache(cache_dir=temp_dir)
+        assert reader.get("https://example.com/guide.md") is None
+
+        FileCache(cache_dir=temp_dir).put("https://example.com/guide.md", "shared")
+
+        entry = reader.get("https://example.com/guide.md")
+        assert entry is not None and entry.content == "shared"
+        assert reader.total_size > 0
+
+
+async def test_file_cache_async_operations():
+    """Async variants read and write through a worker thread."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = FileCache(cache_dir=temp_dir)
+        await cache.put_async("https://example.com/guide.md", "async content", {"etag": '"v1"'})
+
+        entry = await cache.get_async("https://example.com/guide.md")
+        assert entry.content == "async content"
+        assert entry.etag == '"v1"'
+
+        await cache.clear_async()
+        assert await cache.get_async("https://example.com/guide.md") is None
+
+
+async def test_tiered_cache_serves_hot_entries_from_memory():
+    """Memory hits never read the disk tier; disk hits are promoted."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        FileCache(cache_dir=temp_dir).put("https://example.com/a.md", "alpha", {"etag": '"a"'})
+        cache = TieredFileCache(FileCache(cache_dir=temp_dir))
+
+        assert (await cache.get_async("https://example.com/a.md")).content == "alpha"
+        assert cache.memory_size == 5
+
+        with patch.object(cache.disk, "get", side_effect=AssertionError("disk read")):
+            entry = await cache.get_async("https://example.com/a.md")
+        assert entry.etag == '"a"'
+
+
+async def test_tiered_cache_demotes_to_disk_within_memory_budget():
+    """Entries demoted from memory remain readable from disk."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = TieredFileCache(FileCache(cache_dir=temp_dir), max_memory_bytes=10)
+        await cache.put_async("https://example.com/a.md", "aaaa")
+        await cache.put_async("https://example.com/b.md", "bbbb")
+        cache.get("https://example.com/a.md")
+        await cache.put_async("https://example.com/c.md", "cccc")
+
+        assert cache.memory_size == 8
+        assert "https://example.com/b.md" not in cache._memory
+        assert (await cache.get_async("https://example.com/b.md")).content == "bbbb"
+
+        await cache.put_async("https://example.com/big.md", "x" * 20)
+        assert "https://example.com/big.md" not in cache._memory
+        assert cache.get("https://example.com/big.md").content == "x" * 20
+
+        await cache.clear_async()
+        assert cache.memory_size == 0
+        assert cache.get("https://example.com/a.md") is None
+
+
+async def test_tiered_cache_memory_hits_refresh_disk_lru_order():
+    """Entries served from memory are not the first evicted from disk."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        disk = FileCache(cache_dir=temp_dir, max_size_mb=1)
+        cache = TieredFileCache(disk)
+        chunk = "x" * 400_000
+
+        await cache.put_async("https://example.com/a.md", chunk)
+        await cache.put_async("https://example.com/b.md", chunk)
+        with patch("time.time", return_value=time.time() + 10):
+            assert cache.get("https://example.com/a.md") is not None
+            await cache.put_async("https://example.com/c.md", chunk)
+
+        assert disk.get("https://example.com/a.md") is not None
+        assert disk.get("https://example.com/b.md") is None
+
+
+async def test_tiered_cache_preserves_validation_state():
+    """Promoted entries keep their original cached_at, so staleness is unchanged."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with patch("time.time", return_value=1000):
+            FileCache(cache_dir=temp_dir).put("https://example.com/a.md", "alpha", {"last-modified": "x"})
+        cache = TieredFileCache(FileCache(cache_dir=temp_dir))
+
+        with patch("time.time", return_value=1000 + 7200):
+            assert cache.get("https://example.com/a.md").needs_validation()
+            assert cache.get("https://example.com/a.md").needs_validation()
+
+
+def test_file_accessor_layers_memory_tier_over_disk_cache():
+    """FileAccessor puts a memory tier in front of a plain disk cache."""
+    from mcp_server_guide.file_source import FileAccessor
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        accessor = FileAccessor(cache_dir=temp_dir, max_memory_bytes=1024)
+        assert isinstance(accessor.cache, TieredFileCache)
+        assert accessor.cache.max_memory_bytes == 1024
+        assert FileAccessor(cache=accessor.cache).cache is accessor.cache
@@ -8,7 +8,7 @@ from unittest.mock import patch
 
 import pytest
 
-from mcp_server_guide.file_lock import is_process_running, lock_update
+from mcp_server_guide.file_lock import is_process_running, lock_update, try_lock_update
 
 
 async def test_lock_update_creates_lock_file():
@@ -272,3 +272,92 @@ async def test_lock_file_read_errors_handled(tmp_path, monkeypatch):
     result = await lock_update(config_file, test_func)
 
     assert result == "success"
+
+
+async def test_waiter_is_woken_promptly_on_release(tmp_path):
+    """Test that a second caller waits for the holder and starts as soon as it releases."""
+    import asyncio
+
+    config_file = tmp_path / "config.yaml"
+    events = []
+    released_at = 0.0
+
+    async def writer(file_path):
+        nonlocal released_at
+        events.append("writer start")
+        await asyncio.sleep(0.05)
+        events.append("writer end")
+        released_at = time.monotonic()
+
+    async def reader(file_path):
+        events.append("reader")
+        return time.monotonic()
+
+    writer_task = asyncio.create_task(lock_update(config_file, writer))
+    await asyncio.sleep(0.01)
+    reader_started = await lock_update(config_file, reader)
+    await writer_task
+
+    assert events == ["writer start", "writer end", "reader"]
+    # The old lock-file protocol slept a full second between attempts
+    assert reader_started - released_at < 0.1
+
+
+async def test_lock_held_by_another_open_file_is_waited_for(tmp_path):
+    """Test that a flock held elsewhere (as by another process) is respected."""
+    import asyncio
+    import fcntl
+
+    config_file = tmp_path / "config.yaml"
+    lock_file = tmp_path / "config.yaml.lock"
+    fd = os.open(lock_file, os.O_RDWR | os.O_CREAT)
+    fcntl.flock(fd, fcntl.LOCK_EX)
+
+    async def func(file_path):
+        return "success"
+
+    task = asyncio.create_task(lock_update(config_file, func))
+    await asyncio.sleep(0.05)
+    assert not task.done()
+
+    fcntl.flock(fd, fcntl.LOCK_UN)
+    os.close(fd)
+    assert await asyncio.wait_for(task, timeout=1) == "success"
+
+
+async def test_lock_file_protocol_used_without_flock(tmp_path):
+    """Test that the lock-file protocol is used where flock is unavailable."""
+    import asyncio
+
+    config_file = tmp_path / "config.yaml"
+    lock_file = tmp_path / "config.yaml.lock"
+    order = []
+
+    async def func(file_path, name):
+        assert lock_file.read_text() == f"{os.uname().nodename.split('.')[0]}:{os.getpid()}"
+        order.append(f"{name} start")
+        await asyncio.sleep(0.02)
+        order.append(f"{name} end")
+
+    with patch("mcp_server_guide.file_lock.fcntl", None):
+        await asyncio.gather(
+            lock_update(config_file, func, "first"),
+            lock_update(config_file, func, "second"),
+        )
+
+    assert order == ["first start", "first end", "second start", "second end"]
+    assert not lock_file.exists()
+
+
+async def test_try_lock_update_skips_when_lock_is_held():
+    """Test that try_lock_update runs func when the lock is free and returns None without waiting when held."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_file = Path(temp_dir) / "config.yaml"
+
+        assert try_lock_update(config_file, lambda file_path, value: value, "ran") == "ran"
+
+        async def nested(file_path):
+            return try_lock_update(file_path, lambda path: "ran")
+
+        assert await lock_update(config_file, nested) is None
+        assert not config_file.with_suffix(config_file.suffix + ".lock").exists()
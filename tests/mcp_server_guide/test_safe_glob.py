@@ -1,5 +1,6 @@
 """Tests for safe glob functionality with limits and symlink detection."""
 
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
@@ -126,17 +127,60 @@ async def test_safe_glob_deduplication():
         assert results[0].name == "test.md"
 
 
-async def test_safe_glob_memory_efficiency():
-    """Test that safe glob uses iglob for memory efficiency."""
-    with patch("mcp_server_guide.tools.category_tools.glob.iglob") as mock_iglob:
-        mock_iglob.return_value = []
+async def test_safe_glob_single_pruned_walk():
+    """Test that all patterns share one walk that skips directories no pattern can reach."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_path = Path(temp_dir)
+        (base_path / "top.md").write_text("top")
+        (base_path / "docs").mkdir()
+        (base_path / "docs" / "guide.md").write_text("guide")
+        (base_path / "other").mkdir()
+        (base_path / "other" / "skip.md").write_text("skip")
+
+        with patch("mcp_server_guide.utils.glob_walker.os.scandir", wraps=os.scandir) as mock_scandir:
+            results = _safe_glob_search(base_path, ["*.md", "docs/*.md", "top"])
+
+        assert [f.name for f in results] == ["top.md", "guide.md"]
+        scanned = sorted(Path(call.args[0]).name for call in mock_scandir.call_args_list)
+        assert scanned == sorted([base_path.resolve().name, "docs"])
+
+
+async def test_safe_glob_order_and_hidden_files():
+    """Test glob ordering (pattern order, files before subdirectories) and hidden-file rules."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_path = Path(temp_dir)
+        (base_path / "sub").mkdir()
+        (base_path / "sub" / "b.md").write_text("b")
+        (base_path / "a.md").write_text("a")
+        (base_path / ".hidden.md").write_text("hidden")
+        (base_path / ".git").mkdir()
+        (base_path / ".git" / "c.md").write_text("c")
+        (base_path / "x.txt").write_text("x")
+
+        results = _safe_glob_search(base_path, ["*.txt", "**/*.md"])
+        assert [f.name for f in results] == ["x.txt", "a.md", "b.md"]
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            base_path = Path(temp_dir)
-            _safe_glob_search(base_path, ["*.md"])
+        results = _safe_glob_search(base_path, [".hidden.md", ".git/*.md"])
+        assert [f.name for f in results] == [".hidden.md", "c.md"]
 
-        # Should use iglob instead of glob.glob
-        mock_iglob.assert_called()
+
+@pytest.mark.parametrize("pattern", ["**", "docs/**", "**/*.md"])
+async def test_safe_glob_recursive_order_matches_glob(pattern):
+    """Test that recursive patterns list files in the order glob.iglob yields them."""
+    import glob
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_path = Path(temp_dir)
+        for name in ["z.md", "docs/x.md", "docs/b/y.md", "m.md", "c/q.md", "c/d/r.md", "docs/k.md", "k.md"]:
+            (base_path / name).parent.mkdir(parents=True, exist_ok=True)
+            (base_path / name).write_text(name)
+
+        expected = [
+            Path(match).resolve()
+            for match in glob.iglob(str(base_path / pattern), recursive=True)
+            if Path(match).is_file()
+        ]
+        assert _safe_glob_search(base_path, [pattern]) == expected
 
 
 async def test_safe_glob_error_handling():
@@ -179,3 +223,49 @@ async def test_safe_glob_outside_search_directory():
         result_names = [f.name for f in results]
         assert "inside.md" in result_names
         # outside.md should be skipped due to being outside search directory
+
+
+async def test_glob_cache_reuses_results_for_unchanged_tree():
+    """Test that repeated searches of an unchanged tree skip the walk."""
+    from mcp_server_guide.utils.glob_walker import GlobResultCache
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_path = Path(temp_dir)
+        (base_path / "sub").mkdir()
+        (base_path / "a.md").write_text("a")
+        (base_path / "sub" / "b.md").write_text("b")
+        cache = GlobResultCache()
+        search = dict(max_depth=MAX_GLOB_DEPTH, limit=MAX_DOCUMENTS_PER_GLOB, exclude_suffix="_.json")
+
+        first = cache.match(base_path, ["**/*.md"], **search)
+        with patch("mcp_server_guide.utils.glob_walker.os.scandir") as mock_scandir:
+            second = cache.match(base_path, ["**/*.md"], **search)
+            mock_scandir.assert_not_called()
+        assert second == first
+        assert cache.stats.hits == 1
+
+        # Editing a file leaves the match list valid
+        (base_path / "sub" / "b.md").write_text("b, revised")
+        assert cache.match(base_path, ["**/*.md"], **search) == first
+        assert cache.stats.hits == 2
+
+        # Adding a file in a scanned subdirectory is detected
+        (base_path / "sub" / "c.md").write_text("c")
+        third = cache.match(base_path, ["**/*.md"], **search)
+        assert sorted(f.name for f in third) == ["a.md", "b.md", "c.md"]
+        assert cache.stats.invalidations == 1
+
+
+async def test_glob_cache_invalidated_by_category_changes():
+    """Test that category configuration changes drop cached glob results."""
+    from mcp_server_guide.tools.category_tools import _invalidate_category_caches
+    from mcp_server_guide.utils.glob_walker import get_glob_cache
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_path = Path(temp_dir)
+        (base_path / "a.md").write_text("a")
+        _safe_glob_search(base_path, ["*.md"])
+        assert len(get_glob_cache()) > 0
+
+        await _invalidate_category_caches("docs")
+        assert len(get_glob_cache()) == 0
@@ -60,3 +60,29 @@ async def test_server_integration_with_session_paths():
         finally:
             # Ensure proper cleanup
             SessionManager.clear()
+
+
+async def test_server_configures_content_cache_budget():
+    """Test that the content_cache_bytes option sets the content cache budget."""
+    from mcp_server_guide.content_cache import DEFAULT_CONTENT_CACHE_BYTES, configure_content_cache, get_content_cache
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            await create_server(cache_dir=temp_dir, content_cache_bytes=4096)
+
+        assert get_content_cache().max_bytes == 4096
+    finally:
+        configure_content_cache(DEFAULT_CONTENT_CACHE_BYTES)
+
+
+async def test_server_configures_concurrent_reads():
+    """Test that the max_concurrent_reads option bounds category file reads."""
+    from mcp_server_guide.tools import category_tools
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            await create_server(cache_dir=temp_dir, max_concurrent_reads=3)
+
+        assert category_tools._max_concurrent_reads == 3
+    finally:
+        category_tools.configure_concurrent_reads(category_tools.DEFAULT_MAX_CONCURRENT_READS)
@@ -6,7 +6,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import aiohttp
 import pytest
 
-from mcp_server_guide.http.async_client import AsyncHTTPClient
+from mcp_server_guide.http.async_client import AsyncHTTPClient, HTTPClientPool
 
 
 class TestAsyncHTTPClient:
@@ -99,6 +99,8 @@ class TestAsyncHTTPClient:
     async def test_get_success(self):
         """Test successful GET request."""
         mock_response = Mock()
+        mock_response.status = 200
+        mock_response.headers = {"ETag": '"v1"'}
         mock_response.raise_for_status = Mock()
         mock_response.text = AsyncMock(return_value="response content")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
@@ -112,7 +114,9 @@ class TestAsyncHTTPClient:
             async with AsyncHTTPClient() as client:
                 result = await client.get("http://example.com")
 
-                assert result == "response content"
+                assert result.content == "response content"
+                assert result.status == 200
+                assert result.headers == {"etag": '"v1"'}
                 mock_session.get.assert_called_once_with("http://example.com", headers=None)
                 mock_response.raise_for_status.assert_called_once()
 
@@ -120,6 +124,8 @@ class TestAsyncHTTPClient:
     async def test_get_with_headers(self):
         """Test GET request with custom headers."""
         mock_response = Mock()
+        mock_response.status = 200
+        mock_response.headers = {"ETag": '"v1"'}
         mock_response.raise_for_status = Mock()
         mock_response.text = AsyncMock(return_value="response content")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
@@ -135,7 +141,9 @@ class TestAsyncHTTPClient:
             async with AsyncHTTPClient() as client:
                 result = await client.get("http://example.com", headers=headers)
 
-                assert result == "response content"
+                assert result.content == "response content"
+                assert result.status == 200
+                assert result.headers == {"etag": '"v1"'}
                 mock_session.get.assert_called_once_with("http://example.com", headers=headers)
 
     @pytest.mark.asyncio
@@ -274,3 +282,91 @@ class TestAsyncHTTPClient:
             async with AsyncHTTPClient() as client:
                 with pytest.raises(ValueError, match="Invalid URL scheme"):
                     await client.post("ftp://example.com")
+
+    @pytest.mark.asyncio
+    async def test_get_conditional_sends_validators(self):
+        """Conditional GET sends If-None-Match/If-Modified-Since alongside caller headers."""
+        mock_response = Mock(status=200, headers={"Last-Modified": "Thu, 22 Oct 2015 08:30:00 GMT"})
+        mock_response.raise_for_status = Mock()
+        mock_response.text = AsyncMock(return_value="new content")
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+
+        mock_session = Mock()
+        mock_session.get = Mock(return_value=mock_response)
+        mock_session.close = AsyncMock()
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with AsyncHTTPClient() as client:
+                result = await client.get_conditional(
+                    "http://example.com",
+                    if_modified_since="Wed, 21 Oct 2015 07:28:00 GMT",
+                    if_none_match='"v1"',
+                    headers={"Authorization": "Bearer token"},
+                )
+
+        assert result.content == "new content"
+        assert result.headers == {"last-modified": "Thu, 22 Oct 2015 08:30:00 GMT"}
+        mock_session.get.assert_called_once_with(
+            "http://example.com",
+            headers={
+                "Authorization": "Bearer token",
+                "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+                "If-None-Match": '"v1"',
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_conditional_not_modified(self):
+        """A 304 response returns None without raising."""
+        mock_response = Mock(status=304, headers={})
+        mock_response.raise_for_status = Mock()
+        mock_response.text = AsyncMock(return_value="")
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+
+        mock_session = Mock()
+        mock_session.get = Mock(return_value=mock_response)
+        mock_session.close = AsyncMock()
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with AsyncHTTPClient() as client:
+                assert await client.get_conditional("http://example.com", if_none_match='"v1"') is None
+
+
+class TestHTTPClientPool:
+    """Test the shared, long-lived HTTP session pool."""
+
+    @pytest.mark.asyncio
+    async def test_clients_share_one_session(self):
+        """Pooled clients borrow the same session and leave it open on exit."""
+        with patch("aiohttp.ClientSession") as mock_session_class:
+            mock_session = Mock(closed=False)
+            mock_session.close = AsyncMock()
+            mock_session_class.return_value = mock_session
+            pool = HTTPClientPool(limit_per_host=3)
+
+            for _ in range(3):
+                async with AsyncHTTPClient(pool=pool) as client:
+                    assert client._session is mock_session
+
+            mock_session_class.assert_called_once()
+            mock_session.close.assert_not_called()
+            assert mock_session_class.call_args.kwargs["connector"].limit_per_host == 3
+
+            await pool.close()
+            mock_session.close.assert_called_once()
+            assert pool.closed
+
+    @pytest.mark.asyncio
+    async def test_session_recreated_after_close(self):
+        """A closed pool opens a fresh session on next use."""
+        with patch("aiohttp.ClientSession") as mock_session_class:
+            first, second = Mock(closed=False), Mock(closed=False)
+            first.close = AsyncMock()
+            mock_session_class.side_effect = [first, second]
+            pool = HTTPClientPool()
+
+            assert await pool.session() is first
+            await pool.close()
+            assert await pool.session() is second
@@ -6,7 +6,6 @@ from pathlib import Path
 import pytest
 
 from mcp_server_guide.tools.category_tools import _safe_glob_search
-from mcp_server_guide.tools.content_tools import _extract_document_from_content
 from mcp_server_guide.utils.file_extensions import get_extension_candidates, try_file_with_extensions
 
 
@@ -128,42 +127,6 @@ class TestFileExtensionUtilities:
         assert candidates == ["test.txt"]  # No .md added
 
 
-class TestContentExtractionWithExtensions:
-    """Test content extraction with extension fallback."""
-
-    def test_extract_document_with_extension_fallback(self):
-        """Test that document extraction tries extension fallback."""
-        content = """# test.md
-
-This is the markdown content.
-
-# other.txt
-
-This is other content.
-"""
-
-        # Should find test.md when searching for "test"
-        result = _extract_document_from_content(content, "test")
-        assert result is not None
-        assert "This is the markdown content." in result
-
-    def test_extract_document_exact_match_priority(self):
-        """Test that exact matches take priority in content extraction."""
-        content = """# test
-
-This is exact match content.
-
-# test.md
-
-This is the markdown content.
-"""
-
-        # Should find exact match first
-        result = _extract_document_from_content(content, "test")
-        assert result is not None
-        assert "This is exact match content." in result
-
-
 class TestFileExtensionFallback:
     """Test file extension auto-addition in content retrieval."""
 
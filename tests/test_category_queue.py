@@ -0,0 +1,193 @@
+"""Tests for the supervised category processing queue."""
+
+import asyncio
+import queue
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mcp_server_guide.path_resolver import LazyPath
+from mcp_server_guide.queue import category_queue
+from mcp_server_guide.queue.category_queue import (
+    CategoryQueue,
+    _run_supervisor,
+    add_category,
+    get_queue_stats,
+    is_supervisor_running,
+    shutdown_supervisor,
+)
+
+
+@pytest.fixture(autouse=True)
+async def fresh_queue(monkeypatch):
+    monkeypatch.setattr(category_queue, "_category_queue", CategoryQueue())
+    yield
+    await shutdown_supervisor()
+
+
+async def _wait_for(condition, timeout=2.0):
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    pytest.fail("condition not reached")
+
+
+def test_pending_duplicates_are_coalesced():
+    """Adding a category that is already pending keeps a single entry."""
+    q = CategoryQueue()
+    assert q.put_nowait("a") is True
+    assert q.put_nowait("b") is True
+    assert q.put_nowait("a") is False
+
+    assert len(q) == 2
+    assert q.stats.coalesced == 1
+    assert q.get_nowait() == "a"
+    assert q.get_nowait() == "b"
+    with pytest.raises(queue.Empty):
+        q.get_nowait()
+
+
+def test_full_queue_drops_oldest():
+    """A full queue makes room by discarding its oldest entry."""
+    q = CategoryQueue(maxsize=2)
+    for category in ("a", "b", "c"):
+        q.put_nowait(category)
+
+    assert len(q) == 2
+    assert q.stats.dropped == 1
+    assert [q.get_nowait(), q.get_nowait()] == ["b", "c"]
+
+
+def test_active_category_is_held_back_until_done():
+    """A category being processed is not handed out again until released."""
+    q = CategoryQueue()
+    q.put_nowait("a")
+    assert q.get_nowait() == "a"
+
+    q.put_nowait("a")
+    q.put_nowait("b")
+    assert q.get_nowait() == "b"
+    with pytest.raises(queue.Empty):
+        q.get_nowait()
+
+    q.task_done("a", elapsed=0.5)
+    assert q.get_nowait() == "a"
+    assert q.stats.processed == 1
+    assert q.stats.max_processing_seconds == 0.5
+
+
+async def test_add_category_drives_cleanup(monkeypatch):
+    """Queued categories are processed by the supervisor's workers."""
+    processed = []
+
+    async def process(category_dir):
+        processed.append(category_dir)
+
+    monkeypatch.setattr(category_queue, "_cleanup_category_documents", process)
+
+    add_category("/docs/a")
+    add_category("/docs/b")
+    assert is_supervisor_running()
+
+    await _wait_for(lambda: len(processed) == 2)
+    assert sorted(processed) == ["/docs/a", "/docs/b"]
+    stats = get_queue_stats()
+    assert stats["depth"] == 0
+    assert stats["processed"] == 2
+
+
+async def test_crashed_worker_is_restarted():
+    """A worker that raises is replaced and later categories still get processed."""
+    processed = []
+
+    async def process(category_dir):
+        if category_dir == "boom":
+            raise RuntimeError("boom")
+        processed.append(category_dir)
+
+    q = category_queue.get_queue()
+    supervisor = asyncio.create_task(_run_supervisor(process, workers=1))
+    try:
+        q.put_nowait("boom")
+        await _wait_for(lambda: q.stats.restarts == 1)
+        q.put_nowait("ok")
+        await _wait_for(lambda: processed == ["ok"])
+        assert q.stats.failed == 1
+    finally:
+        supervisor.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await supervisor
+
+
+async def test_same_category_is_never_processed_concurrently():
+    """Re-adding a category while it is processed queues it behind the running pass."""
+    running = 0
+    overlap = False
+    release = asyncio.Event()
+    passes = 0
+
+    async def process(category_dir):
+        nonlocal running, overlap, passes
+        running += 1
+        overlap = overlap or running > 1
+        await release.wait()
+        running -= 1
+        passes += 1
+
+    q = category_queue.get_queue()
+    supervisor = asyncio.create_task(_run_supervisor(process, workers=2))
+    try:
+        q.put_nowait("a")
+        await _wait_for(lambda: q.active == 1)
+        q.put_nowait("a")
+        await asyncio.sleep(0.05)
+        assert q.active == 1
+
+        release.set()
+        await _wait_for(lambda: passes == 2)
+        assert not overlap
+    finally:
+        supervisor.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await supervisor
+
+
+async def test_cancelled_worker_is_not_restarted():
+    """A worker that is cancelled has stopped normally and is not counted as a crash."""
+
+    async def process(category_dir):
+        asyncio.current_task().cancel()
+        await asyncio.sleep(0)
+
+    q = category_queue.get_queue()
+    q.put_nowait("a")
+    await asyncio.wait_for(_run_supervisor(process, workers=1), timeout=2.0)
+
+    assert q.stats.restarts == 0
+
+
+async def test_listed_category_is_cleaned_up_under_docroot(tmp_path, monkeypatch):
+    """Listing a relative category queues its docroot path, whatever the working directory."""
+    from mcp_server_guide.tools.document_tools import list_mcp_documents
+
+    docroot = tmp_path / "docroot"
+    (docroot / "review").mkdir(parents=True)
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
+
+    processed = []
+
+    async def process(category_dir):
+        processed.append(category_dir)
+
+    monkeypatch.setattr(category_queue, "_cleanup_category_documents", process)
+
+    with patch("mcp_server_guide.session_manager.SessionManager") as mock_session_class:
+        mock_session_class.return_value = Mock(docroot=LazyPath(str(docroot)))
+        result = await list_mcp_documents(category_dir="review")
+
+    assert result["success"] is True
+    await _wait_for(lambda: len(processed) == 1)
+    assert processed == [str(docroot.resolve() / "review")]
@@ -0,0 +1,172 @@
+"""Tests for the background category watcher."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from mcp_server_guide.category_watcher import CategoryWatcher, get_category_watcher, set_category_watcher
+from mcp_server_guide.constants import METADATA_SUFFIX
+from mcp_server_guide.content_cache import get_content_cache
+from mcp_server_guide.tools.category_tools import (
+    MAX_DOCUMENTS_PER_GLOB,
+    MAX_GLOB_DEPTH,
+    _assemble_category_content,
+    _invalidate_category_caches,
+    refresh_category_index,
+)
+
+
+def _watcher(refresh, **kwargs) -> CategoryWatcher:
+    return CategoryWatcher(
+        refresh,
+        max_depth=MAX_GLOB_DEPTH,
+        limit=MAX_DOCUMENTS_PER_GLOB,
+        exclude_suffix=METADATA_SUFFIX,
+        use_native=False,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def docs(tmp_path) -> Path:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.md").write_text("alpha")
+    return docs
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    get_content_cache().clear()
+    yield
+    set_category_watcher(None)
+    get_content_cache().clear()
+
+
+async def test_scan_refreshes_on_first_scan_and_changes_only(docs):
+    """The first scan refreshes once; later scans refresh only when files change."""
+    refresh = AsyncMock()
+    watcher = _watcher(refresh)
+    watcher.watch("docs", docs, ["*.md"])
+
+    await watcher.scan_once()
+    refresh.assert_awaited_once_with("docs", docs, ("*.md",))
+
+    await watcher.scan_once()
+    assert refresh.await_count == 1
+
+    (docs / "a.md").write_text("alpha, edited")
+    await watcher.scan_once()
+    assert refresh.await_count == 2
+
+    (docs / "b.md").write_text("beta")
+    await watcher.scan_once()
+    assert refresh.await_count == 3
+
+
+async def test_unmatched_files_do_not_trigger_refresh(docs):
+    """Changes the patterns cannot see leave the category alone."""
+    refresh = AsyncMock()
+    watcher = _watcher(refresh)
+    watcher.watch("docs", docs, ["*.md"])
+    await watcher.scan_once()
+
+    (docs / "notes.txt").write_text("ignored")
+    await watcher.scan_once()
+
+    assert refresh.await_count == 1
+
+
+async def test_is_current_tracks_scans_and_events(docs):
+    """Cached results are trusted only while running with no unscanned change."""
+    watcher = _watcher(AsyncMock(), poll_interval=3600)
+    watcher.watch("docs", docs, ["*.md"])
+    assert not watcher.is_current("docs", docs, ["*.md"])
+
+    await watcher.start()
+    try:
+        await watcher.scan_once()
+        assert watcher.is_current("docs", docs, ["*.md"])
+        assert not watcher.is_current("docs", docs, ["*.txt"])
+        assert not watcher.is_current("other", docs, ["*.md"])
+
+        watcher.path_changed(str((docs / "a.md").resolve()))
+        assert not watcher.is_current("docs", docs, ["*.md"])
+
+        await watcher.scan_once()
+        assert watcher.is_current("docs", docs, ["*.md"])
+    finally:
+        await watcher.stop()
+
+    assert not watcher.is_current("docs", docs, ["*.md"])
+
+
+async def test_unrelated_event_paths_are_ignored(docs, tmp_path):
+    """Events outside a category's directory do not affect it."""
+    watcher = _watcher(AsyncMock(), poll_interval=3600)
+    watcher.watch("docs", docs, ["*.md"])
+    await watcher.start()
+    try:
+        await watcher.scan_once()
+        watcher.path_changed(str(tmp_path.resolve() / "docs-other" / "a.md"))
+        assert watcher.is_current("docs", docs, ["*.md"])
+    finally:
+        await watcher.stop()
+
+
+async def test_polling_picks_up_external_edit(docs):
+    """A background poll rebuilds the cached content after an external edit."""
+    watcher = _watcher(refresh_category_index, poll_interval=0.01)
+    set_category_watcher(watcher)
+    await watcher.start()
+    try:
+        assembled = await _assemble_category_content("docs", docs, ["*.md"])
+        assert "alpha" in assembled.content
+
+        (docs / "a.md").write_text("changed externally")
+        for _ in range(200):
+            cached = get_content_cache().peek("docs", str(docs), ["*.md"])
+            if cached is not None and "changed externally" in cached.content:
+                break
+            await asyncio.sleep(0.01)
+        else:
+            pytest.fail("watcher did not refresh the category")
+    finally:
+        await watcher.stop()
+
+
+async def test_current_category_is_served_without_filesystem_checks(docs):
+    """While the watcher vouches for a category, reads skip the glob walk and fingerprinting."""
+    watcher = _watcher(refresh_category_index, poll_interval=3600)
+    set_category_watcher(watcher)
+    await watcher.start()
+    try:
+        await _assemble_category_content("docs", docs, ["*.md"])
+        await watcher.scan_once()
+        assert watcher.is_current("docs", docs, ["*.md"])
+
+        with (
+            patch("mcp_server_guide.tools.category_tools._safe_glob_search") as glob_search,
+            patch("mcp_server_guide.tools.category_tools.fingerprint_files") as fingerprint,
+        ):
+            assembled = await _assemble_category_content("docs", docs, ["*.md"])
+
+        glob_search.assert_not_called()
+        fingerprint.assert_not_called()
+        assert "alpha" in assembled.content
+    finally:
+        await watcher.stop()
+
+
+async def test_config_change_unwatches_category(docs):
+    """Invalidating a category's caches drops its registration until it is read again."""
+    watcher = _watcher(AsyncMock())
+    set_category_watcher(watcher)
+    watcher.watch("docs", docs, ["*.md"])
+
+    await _invalidate_category_caches("docs")
+
+    assert len(watcher) == 0
+    assert get_category_watcher() is watcher
@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from mcp_server_guide.content_cache import AssembledContent, ContentSection
 from mcp_server_guide.models.category import Category
 from mcp_server_guide.models.collection import Collection
 from mcp_server_guide.models.project_config import ProjectConfig
@@ -15,6 +16,19 @@ from mcp_server_guide.tools.collection_tools import (
 )
 
 
+def _indexed(documents: dict) -> AssembledContent:
+    """Build indexed category content from a mapping of file path to body."""
+    parts, sections, offset = [], [], 0
+    for path, body in documents.items():
+        header = f"# {path.rsplit('/', 1)[-1]}\n\n"
+        parts.append(header + body)
+        sections.append(ContentSection(path.rsplit("/", 1)[-1], offset + len(header), len(body), path))
+        offset += len(header) + len(body) + 2
+    return AssembledContent(
+        {"success": True, "content": "\n\n".join(parts), "matched_files": list(documents)}, tuple(sections)
+    )
+
+
 class TestCollectionDocumentSearch:
     """Tests for collection document search and retrieval."""
 
@@ -91,23 +105,17 @@ class TestCollectionDocumentSearch:
 
         with (
             patch("mcp_server_guide.session_manager.SessionManager") as mock_sm,
-            patch("mcp_server_guide.tools.collection_tools.get_category_content") as mock_get_cat,
-            patch("mcp_server_guide.tools.content_tools._extract_document_from_content") as mock_extract,
+            patch("mcp_server_guide.tools.collection_tools.get_indexed_category_content") as mock_get_cat,
         ):
             mock_session = Mock()
             mock_sm.return_value = mock_session
             mock_session.get_project_name.return_value = "test"
             mock_session.get_or_create_project_config = AsyncMock(return_value=config)
-            mock_get_cat.return_value = {
-                "success": True,
-                "matched_files": ["/path/to/document.md"],
-                "content": "# Document content",
-            }
-            mock_extract.return_value = "# Document content"  # Mock successful extraction
+            mock_get_cat.return_value = _indexed({"/path/to/document.md": "Document content"})
 
             result = await get_collection_document("test", "document.md")
             assert result["success"]
-            assert result["content"] == "# Document content"
+            assert result["content"] == "Document content"
             assert result["found_in_category"] == "cat1"
             assert result["document"] == "document.md"
 
@@ -121,17 +129,13 @@ class TestCollectionDocumentSearch:
 
         with (
             patch("mcp_server_guide.session_manager.SessionManager") as mock_sm,
-            patch("mcp_server_guide.tools.collection_tools.get_category_content") as mock_get_cat,
+            patch("mcp_server_guide.tools.collection_tools.get_indexed_category_content") as mock_get_cat,
         ):
             mock_session = Mock()
             mock_sm.return_value = mock_session
             mock_session.get_project_name.return_value = "test"
             mock_session.get_or_create_project_config = AsyncMock(return_value=config)
-            mock_get_cat.return_value = {
-                "success": True,
-                "matched_files": ["/path/to/other.md"],
-                "content": "# Other content",
-            }
+            mock_get_cat.return_value = _indexed({"/path/to/other.md": "Other content"})
 
             result = await get_collection_document("test", "missing.md")
             assert not result["success"]
@@ -162,7 +166,7 @@ class TestCollectionDocumentSearch:
 
         with (
             patch("mcp_server_guide.session_manager.SessionManager") as mock_sm,
-            patch("mcp_server_guide.tools.collection_tools.get_category_content") as mock_get_cat,
+            patch("mcp_server_guide.tools.collection_tools.get_indexed_category_content") as mock_get_cat,
             patch("mcp_server_guide.tools.collection_tools.logger") as mock_logger,
         ):
             mock_session = Mock()
@@ -187,21 +191,15 @@ class TestCollectionDocumentSearch:
 
         with (
             patch("mcp_server_guide.session_manager.SessionManager") as mock_sm,
-            patch("mcp_server_guide.tools.collection_tools.get_category_content") as mock_get_cat,
-            patch("mcp_server_guide.tools.content_tools._extract_document_from_content") as mock_extract,
+            patch("mcp_server_guide.tools.collection_tools.get_indexed_category_content") as mock_get_cat,
         ):
             mock_session = Mock()
             mock_sm.return_value = mock_session
             mock_session.get_project_name.return_value = "test"
             mock_session.get_or_create_project_config = AsyncMock(return_value=config)
-            mock_extract.return_value = "# Content"  # Mock successful extraction
 
             # Test exact match in filename
-            mock_get_cat.return_value = {
-                "success": True,
-                "matched_files": ["/path/to/mydocument.md"],
-                "content": "# Content",
-            }
+            mock_get_cat.return_value = _indexed({"/path/to/mydocument.md": "Content"})
 
             result = await get_collection_document("test", "document", partial_match=True)
             assert result["success"]
@@ -209,11 +207,7 @@ class TestCollectionDocumentSearch:
             assert result.get("file_path") == "/path/to/mydocument.md"
 
             # Test path ending match
-            mock_get_cat.return_value = {
-                "success": True,
-                "matched_files": ["/path/to/document"],
-                "content": "# Content",
-            }
+            mock_get_cat.return_value = _indexed({"/path/to/document": "Content"})
 
             result = await get_collection_document("test", "document")
             assert result["success"]
@@ -221,11 +215,7 @@ class TestCollectionDocumentSearch:
             assert result.get("file_path") == "/path/to/document"
 
             # Test .md extension match
-            mock_get_cat.return_value = {
-                "success": True,
-                "matched_files": ["/path/to/document.md"],
-                "content": "# Content",
-            }
+            mock_get_cat.return_value = _indexed({"/path/to/document.md": "Content"})
 
             result = await get_collection_document("test", "document")
             assert result["success"]
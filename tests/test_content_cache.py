@@ -0,0 +1,225 @@
+"""Tests for the fingerprint-validated category content cache."""
+
+import asyncio
+import os
+from unittest.mock import AsyncMock, Mock, patch
+
+import aiofiles
+import pytest
+
+from mcp_server_guide.content_cache import (
+    AssembledContent,
+    CategoryContentCache,
+    configure_content_cache,
+    fingerprint_files,
+    get_content_cache,
+)
+from mcp_server_guide.models.category import Category
+from mcp_server_guide.path_resolver import LazyPath
+from mcp_server_guide.project_config import ProjectConfig
+from mcp_server_guide.tools.category_tools import (
+    DEFAULT_MAX_CONCURRENT_READS,
+    configure_concurrent_reads,
+    get_category_content,
+    get_indexed_category_content,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_content_cache():
+    """Give each test an empty process-wide content cache."""
+    get_content_cache().clear()
+    yield
+    get_content_cache().clear()
+
+
+@pytest.fixture
+def category_session(tmp_path):
+    """Mock session with a single file-based category rooted in tmp_path."""
+    (tmp_path / "docs").mkdir()
+    with patch("mcp_server_guide.session_manager.SessionManager") as mock:
+        session_instance = Mock()
+        mock.return_value = session_instance
+        session_instance.get_project_name = Mock(return_value="test-project")
+        config = ProjectConfig(categories={"docs": Category(dir="docs/", patterns=["*.md"], description="")})
+        session_instance.get_or_create_project_config = AsyncMock(return_value=config)
+        config_manager = Mock()
+        config_manager.docroot = LazyPath(str(tmp_path))
+        session_instance.config_manager = Mock(return_value=config_manager)
+        yield tmp_path / "docs"
+
+
+def _result(content: str) -> AssembledContent:
+    return AssembledContent({"success": True, "content": content, "matched_files": ["a.md"]})
+
+
+def test_fingerprint_files_includes_stat_fields(tmp_path):
+    """Fingerprints carry path, size, mtime_ns and inode."""
+    doc = tmp_path / "a.md"
+    doc.write_text("hello")
+    st = os.stat(doc)
+
+    assert fingerprint_files([doc]) == ((str(doc), 5, st.st_mtime_ns, st.st_ino),)
+
+
+def test_fingerprint_files_missing_file_returns_none(tmp_path):
+    """A file that cannot be stat'ed makes the fingerprint unusable."""
+    assert fingerprint_files([tmp_path / "missing.md"]) is None
+
+
+def test_cache_hit_requires_matching_fingerprint():
+    """Entries are only served for an identical fingerprint, directory and patterns."""
+    cache = CategoryContentCache()
+    fingerprint = (("/docs/a.md", 1, 1, 1),)
+    cache.put("docs", "/docs", ["*.md"], fingerprint, _result("x"))
+
+    assert cache.get("docs", "/docs", ["*.md"], fingerprint).content == "x"
+    assert cache.get("docs", "/docs", ["*.md"], (("/docs/a.md", 2, 1, 1),)) is None
+    assert cache.get("docs", "/other", ["*.md"], fingerprint) is None
+    assert cache.get("docs", "/docs", ["*.txt"], fingerprint) is None
+    assert cache.stats.as_dict() == {"hits": 1, "misses": 3, "evictions": 0, "invalidations": 0}
+
+
+def test_cache_returns_copies():
+    """Mutating a returned result must not corrupt the cached entry."""
+    cache = CategoryContentCache()
+    fingerprint = (("/docs/a.md", 1, 1, 1),)
+    cache.put("docs", "/docs", ["*.md"], fingerprint, _result("x"))
+
+    cache.get("docs", "/docs", ["*.md"], fingerprint).result["matched_files"].append("b.md")
+
+    assert cache.get("docs", "/docs", ["*.md"], fingerprint).result["matched_files"] == ["a.md"]
+
+
+def test_cache_evicts_least_recently_used_within_budget():
+    """The byte budget is enforced with LRU eviction."""
+    cache = CategoryContentCache(max_bytes=10)
+    fingerprint = (("/f", 1, 1, 1),)
+    cache.put("one", "/d", ["*"], fingerprint, _result("aaaa"))
+    cache.put("two", "/d", ["*"], fingerprint, _result("bbbb"))
+    cache.get("one", "/d", ["*"], fingerprint)
+
+    cache.put("three", "/d", ["*"], fingerprint, _result("cccc"))
+
+    assert cache.get("two", "/d", ["*"], fingerprint) is None
+    assert cache.get("one", "/d", ["*"], fingerprint) is not None
+    assert cache.total_bytes == 8
+    assert cache.stats.evictions == 1
+
+
+def test_cache_skips_entries_larger_than_budget():
+    """Oversized results are never cached."""
+    cache = CategoryContentCache(max_bytes=3)
+    cache.put("docs", "/d", ["*"], (("/f", 1, 1, 1),), _result("too large"))
+
+    assert len(cache) == 0
+    assert cache.total_bytes == 0
+
+
+def test_configure_content_cache_replaces_singleton():
+    """configure_content_cache installs a new process-wide cache."""
+    original = get_content_cache()
+    try:
+        cache = configure_content_cache(1024)
+        assert get_content_cache() is cache
+        assert cache.max_bytes == 1024
+        with pytest.raises(ValueError):
+            configure_content_cache(-1)
+    finally:
+        configure_content_cache(original.max_bytes)
+
+
+async def test_get_category_content_served_from_cache(category_session):
+    """A second read of an unchanged category does not re-read any files."""
+    (category_session / "a.md").write_text("alpha")
+
+    first = await get_category_content("docs")
+    with patch("mcp_server_guide.tools.category_tools.aiofiles.open") as mock_open:
+        second = await get_category_content("docs")
+        mock_open.assert_not_called()
+
+    assert second == first
+    assert get_content_cache().stats.hits == 1
+
+
+async def test_get_category_content_detects_changes(category_session):
+    """Modifying or adding a file invalidates the cached assembly."""
+    doc = category_session / "a.md"
+    doc.write_text("alpha")
+    await get_category_content("docs")
+
+    doc.write_text("alpha, revised")
+    result = await get_category_content("docs")
+    assert "alpha, revised" in result["content"]
+
+    (category_session / "b.md").write_text("beta")
+    result = await get_category_content("docs")
+    assert result["file_count"] == 2
+    assert get_content_cache().stats.hits == 0
+
+
+async def test_section_index_slices_each_document(category_session):
+    """Every section slices exactly its document body out of the combined content."""
+    (category_session / "a.md").write_text("alpha body")
+    (category_session / "b.md").write_text("# Heading\n\nbeta body\n")
+
+    assembled = await get_indexed_category_content("docs")
+
+    assert sorted(section.header for section in assembled.sections) == ["a.md", "b.md"]
+    for section in assembled.sections:
+        assert assembled.section_text(section) == open(section.path).read()
+        assert assembled.content[: section.offset].endswith(f"# {section.header}\n\n")
+    assert assembled.section_for_path(str(category_session / "b.md")).header == "b.md"
+
+
+async def test_section_index_cached_with_content(category_session):
+    """Cache hits return the section index recorded at assembly time."""
+    (category_session / "a.md").write_text("alpha body")
+
+    first = await get_indexed_category_content("docs")
+    second = await get_indexed_category_content("docs")
+
+    assert get_content_cache().stats.hits == 1
+    assert second.sections == first.sections
+    assert second.section_text(second.sections[0]) == "alpha body"
+
+
+async def test_indexed_content_none_for_unknown_category(category_session):
+    """Only file-based categories have indexed content."""
+    assert await get_indexed_category_content("missing") is None
+
+
+async def test_assembly_reads_concurrently_in_match_order(category_session):
+    """Files are read under the concurrency bound and assembled in match order."""
+    for index in range(6):
+        (category_session / f"doc{index}.md").write_text(f"body {index}")
+    real_open = aiofiles.open
+    active = peak = 0
+
+    class TrackingOpen:
+        def __init__(self, *args, **kwargs):
+            self._cm = real_open(*args, **kwargs)
+
+        async def __aenter__(self):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            return await self._cm.__aenter__()
+
+        async def __aexit__(self, *exc):
+            nonlocal active
+            active -= 1
+            return await self._cm.__aexit__(*exc)
+
+    configure_concurrent_reads(2)
+    try:
+        with patch("mcp_server_guide.tools.category_tools.aiofiles.open", TrackingOpen):
+            assembled = await get_indexed_category_content("docs")
+    finally:
+        configure_concurrent_reads(DEFAULT_MAX_CONCURRENT_READS)
+
+    assert peak == 2
+    assert [section.path for section in assembled.sections] == assembled.result["matched_files"]
+    for section in assembled.sections:
+        assert assembled.section_text(section) == open(section.path).read()
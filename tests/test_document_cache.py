@@ -1,10 +1,18 @@
 """Tests for document cache functionality."""
 
+import os
 from unittest.mock import patch
 
 import pytest
 
-from mcp_server_guide.document_cache import CategoryDocumentCache, DocumentCacheEntry
+from mcp_server_guide.document_cache import (
+    DEFAULT_MAX_ENTRIES,
+    DEFAULT_NEGATIVE_TTL,
+    DEFAULT_POSITIVE_TTL,
+    CategoryDocumentCache,
+    DocumentCacheEntry,
+    directory_fingerprint,
+)
 from mcp_server_guide.tools.category_tools import update_category
 
 
@@ -266,3 +274,112 @@ class TestConcurrentCacheAccess:
         for i in range(5):
             result = await CategoryDocumentCache.get(f"category_{i}", f"doc_{i}")
             assert result is None
+
+
+class TestCacheExpiryAndBounds:
+    """Test TTL expiry, LRU bounds and fingerprint invalidation."""
+
+    @pytest.fixture(autouse=True)
+    async def setup_cache(self):
+        """Clear cache and restore default configuration around each test."""
+        await CategoryDocumentCache.clear_all()
+        yield
+        CategoryDocumentCache.configure(
+            max_entries=DEFAULT_MAX_ENTRIES, positive_ttl=DEFAULT_POSITIVE_TTL, negative_ttl=DEFAULT_NEGATIVE_TTL
+        )
+        await CategoryDocumentCache.clear_all()
+
+    @pytest.mark.asyncio
+    async def test_negative_entries_use_shorter_ttl(self):
+        """Positive and negative entries expire independently."""
+        CategoryDocumentCache.configure(positive_ttl=100, negative_ttl=10)
+        with patch("mcp_server_guide.document_cache.time.monotonic", return_value=1000.0):
+            await CategoryDocumentCache.set("cat", "present", True, ["present.md"])
+            await CategoryDocumentCache.set("cat", "absent", False, None)
+
+        with patch("mcp_server_guide.document_cache.time.monotonic", return_value=1050.0):
+            assert await CategoryDocumentCache.get("cat", "present") is not None
+            assert await CategoryDocumentCache.get("cat", "absent") is None
+
+        with patch("mcp_server_guide.document_cache.time.monotonic", return_value=1200.0):
+            assert await CategoryDocumentCache.get("cat", "present") is None
+
+    @pytest.mark.asyncio
+    async def test_per_entry_ttl_override(self):
+        """An explicit ttl overrides the configured default."""
+        with patch("mcp_server_guide.document_cache.time.monotonic", return_value=0.0):
+            await CategoryDocumentCache.set("cat", "doc", True, ["doc.md"], ttl=1)
+        with patch("mcp_server_guide.document_cache.time.monotonic", return_value=2.0):
+            assert await CategoryDocumentCache.get("cat", "doc") is None
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_at_max_entries(self):
+        """The least recently used entry is evicted once the bound is reached."""
+        CategoryDocumentCache.configure(max_entries=2)
+        await CategoryDocumentCache.set("cat", "one", True, ["one.md"])
+        await CategoryDocumentCache.set("cat", "two", True, ["two.md"])
+        await CategoryDocumentCache.get("cat", "one")
+
+        await CategoryDocumentCache.set("cat", "three", True, ["three.md"])
+
+        assert await CategoryDocumentCache.get("cat", "two") is None
+        assert await CategoryDocumentCache.get("cat", "one") is not None
+        assert await CategoryDocumentCache.get("cat", "three") is not None
+
+    @pytest.mark.asyncio
+    async def test_configure_rejects_invalid_bound(self):
+        """max_entries must allow at least one entry."""
+        with pytest.raises(ValueError):
+            CategoryDocumentCache.configure(max_entries=0)
+
+    @pytest.mark.asyncio
+    async def test_changed_directory_fingerprint_invalidates_entry(self, tmp_path):
+        """Adding a file to the category directory invalidates a negative entry."""
+        before = directory_fingerprint(tmp_path)
+        await CategoryDocumentCache.set("cat", "new-doc", False, None, fingerprint=before)
+        assert await CategoryDocumentCache.get("cat", "new-doc", before) is not None
+
+        (tmp_path / "new-doc.md").write_text("# New")
+        os.utime(tmp_path, ns=(0, before[0][1] + 1_000_000))
+        after = directory_fingerprint(tmp_path)
+
+        assert after != before
+        assert await CategoryDocumentCache.get("cat", "new-doc", after) is None
+
+    @pytest.mark.asyncio
+    async def test_directory_fingerprint_handles_missing_directories(self, tmp_path):
+        """Missing directories fingerprint as zeros rather than raising."""
+        fingerprint = directory_fingerprint(tmp_path / "missing")
+        assert all(mtime == 0 and ino == 0 for _, mtime, ino in fingerprint)
+
+    @pytest.mark.asyncio
+    async def test_get_content_sees_document_added_after_negative_lookup(self, tmp_path):
+        """A document created on disk is found even after a cached miss."""
+        from unittest.mock import AsyncMock, Mock
+
+        from mcp_server_guide.models.category import Category
+        from mcp_server_guide.path_resolver import LazyPath
+        from mcp_server_guide.project_config import ProjectConfig
+        from mcp_server_guide.tools.content_tools import get_content
+
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        (docs_dir / "existing.md").write_text("# Existing")
+        config = ProjectConfig(categories={"docs": Category(dir="docs/", patterns=["*.md"], description="")})
+
+        with patch("mcp_server_guide.session_manager.SessionManager") as mock_session_class:
+            session = Mock()
+            session.get_project_name = Mock(return_value="test-project")
+            session.get_or_create_project_config = AsyncMock(return_value=config)
+            config_manager = Mock()
+            config_manager.docroot = LazyPath(str(tmp_path))
+            session.config_manager = Mock(return_value=config_manager)
+            mock_session_class.return_value = session
+
+            assert await get_content("docs", "later") is None
+
+            before = os.stat(docs_dir).st_mtime_ns
+            (docs_dir / "later.md").write_text("Later content")
+            os.utime(docs_dir, ns=(before + 1_000_000, before + 1_000_000))
+
+            assert await get_content("docs", "later") == "Later content"
@@ -168,3 +168,123 @@ async def test_list_mcp_documents_corrupted_metadata():
         # Find the corrupted document
         corrupted_doc_info = next(doc for doc in result["documents"] if doc["name"] == "corrupted.md")
         assert corrupted_doc_info["source_type"] == "unknown"  # Should default when metadata is corrupted
+
+
+@pytest.mark.asyncio
+async def test_list_mcp_documents_pagination():
+    """Test cursor pagination walks every document once, in name order."""
+    from mcp_server_guide.tools.document_tools import create_mcp_document, list_mcp_documents
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        category_dir = Path(temp_dir)
+        for i in range(5):
+            await create_mcp_document(
+                category_dir=str(category_dir),
+                name=f"doc{i}.md",
+                content=f"# Document {i}",
+                explicit_action="CREATE_DOCUMENT",
+            )
+
+        names = []
+        cursor = None
+        pages = 0
+        while True:
+            result = await list_mcp_documents(category_dir=str(category_dir), limit=2, cursor=cursor)
+            assert result["success"] is True
+            assert len(result["documents"]) <= 2
+            names.extend(doc["name"] for doc in result["documents"])
+            pages += 1
+            cursor = result["next_cursor"]
+            if cursor is None:
+                break
+
+        assert names == [f"doc{i}.md" for i in range(5)]
+        assert pages == 3
+
+
+@pytest.mark.asyncio
+async def test_list_mcp_documents_unpaged_by_default():
+    """Test a call without limit or cursor returns every document."""
+    from mcp_server_guide.tools.document_tools import (
+        DEFAULT_DOCUMENT_PAGE_SIZE,
+        create_mcp_document,
+        list_mcp_documents,
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        category_dir = Path(temp_dir)
+        count = DEFAULT_DOCUMENT_PAGE_SIZE + 5
+        for i in range(count):
+            await create_mcp_document(
+                category_dir=str(category_dir),
+                name=f"doc{i:03d}.md",
+                content=f"# Document {i}",
+                explicit_action="CREATE_DOCUMENT",
+            )
+
+        result = await list_mcp_documents(category_dir=str(category_dir))
+
+        assert len(result["documents"]) == count
+        assert result["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_mcp_documents_pagination_applies_filters_first():
+    """Test pages are filled with matching documents only."""
+    from mcp_server_guide.tools.document_tools import create_mcp_document, list_mcp_documents
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        category_dir = Path(temp_dir)
+        for i in range(4):
+            await create_mcp_document(
+                category_dir=str(category_dir),
+                name=f"doc{i}.md",
+                content=f"# Document {i}",
+                explicit_action="CREATE_DOCUMENT",
+                source_type="imported" if i % 2 else "manual",
+            )
+
+        result = await list_mcp_documents(category_dir=str(category_dir), source_type="imported", limit=2)
+
+        assert [doc["name"] for doc in result["documents"]] == ["doc1.md", "doc3.md"]
+        assert result["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_mcp_documents_uses_current_manifest_metadata():
+    """Test sidecars are not parsed while the manifest records them as current."""
+    from unittest.mock import patch
+
+    from mcp_server_guide.tools.document_tools import create_mcp_document, list_mcp_documents
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        category_dir = Path(temp_dir)
+        await create_mcp_document(
+            category_dir=str(category_dir),
+            name="doc.md",
+            content="# Document",
+            explicit_action="CREATE_DOCUMENT",
+            source_type="imported",
+        )
+
+        with patch("mcp_server_guide.tools.document_tools.read_sidecar_metadata") as read_sidecar:
+            result = await list_mcp_documents(category_dir=str(category_dir))
+
+        read_sidecar.assert_not_called()
+        assert result["documents"][0]["source_type"] == "imported"
+
+
+@pytest.mark.asyncio
+async def test_list_mcp_documents_rejects_bad_paging_arguments():
+    """Test invalid limits and cursors are reported as validation errors."""
+    from mcp_server_guide.tools.document_tools import MAX_DOCUMENT_PAGE_SIZE, list_mcp_documents
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for limit in (0, MAX_DOCUMENT_PAGE_SIZE + 1):
+            result = await list_mcp_documents(category_dir=temp_dir, limit=limit)
+            assert result["success"] is False
+            assert result["error_type"] == "validation"
+
+        result = await list_mcp_documents(category_dir=temp_dir, cursor="not base64!")
+        assert result["success"] is False
+        assert result["error_type"] == "validation"
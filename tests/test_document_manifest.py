@@ -0,0 +1,241 @@
+"""Tests for the per-directory managed document manifest."""
+
+import asyncio
+import json
+import os
+from unittest.mock import patch
+
+from mcp_server_guide.constants import DOCUMENT_MANIFEST, DOCUMENT_SUBDIR, METADATA_SUFFIX
+from mcp_server_guide.file_lock import lock_update
+from mcp_server_guide.tools.document_tools import create_mcp_document, delete_mcp_document, update_mcp_document
+from mcp_server_guide.utils import document_manifest
+from mcp_server_guide.utils.document_discovery import get_category_documents_by_path
+from mcp_server_guide.utils.document_manifest import load_manifest
+from mcp_server_guide.utils.document_utils import generate_content_hash
+
+
+def _write_doc(docs_dir, name, content, metadata=None):
+    (docs_dir / name).write_text(content)
+    if metadata is not None:
+        (docs_dir / f"{name}{METADATA_SUFFIX}").write_text(json.dumps(metadata))
+
+
+def _metadata(mime_type="text/markdown"):
+    return {"source_type": "manual", "content_hash": "sha256:abc", "mime_type": mime_type}
+
+
+def test_load_builds_and_persists_manifest(tmp_path):
+    """The first load reads every document and writes the manifest."""
+    docs_dir = tmp_path / DOCUMENT_SUBDIR
+    docs_dir.mkdir()
+    _write_doc(docs_dir, "a.md", "# A", _metadata())
+    _write_doc(docs_dir, "b.txt", "plain")
+
+    entries = load_manifest(docs_dir)
+
+    assert sorted(entries) == ["a.md", "b.txt"]
+    assert entries["a.md"].content_hash == generate_content_hash("# A")
+    assert entries["a.md"].metadata == _metadata()
+    assert entries["a.md"].metadata_valid is True
+    assert entries["b.txt"].metadata is None
+
+    stored = json.loads((docs_dir / DOCUMENT_MANIFEST).read_text())
+    assert [doc["name"] for doc in stored["documents"]] == ["a.md", "b.txt"]
+
+
+def test_unchanged_directory_is_served_from_manifest(tmp_path):
+    """Once the manifest is current, loading opens no document or sidecar."""
+    docs_dir = tmp_path / DOCUMENT_SUBDIR
+    docs_dir.mkdir()
+    for i in range(5):
+        _write_doc(docs_dir, f"doc{i}.md", f"# Doc {i}", _metadata())
+    first = load_manifest(docs_dir)
+    manifest_mtime = os.stat(docs_dir / DOCUMENT_MANIFEST).st_mtime_ns
+
+    with patch("mcp_server_guide.utils.document_manifest._build_entry") as build_entry:
+        second = load_manifest(docs_dir)
+
+    build_entry.assert_not_called()
+    assert second == first
+    assert os.stat(docs_dir / DOCUMENT_MANIFEST).st_mtime_ns == manifest_mtime
+
+
+def test_drift_rebuilds_only_changed_entries(tmp_path):
+    """External edits, additions and deletions are picked up on the next load."""
+    docs_dir = tmp_path / DOCUMENT_SUBDIR
+    docs_dir.mkdir()
+    _write_doc(docs_dir, "keep.md", "# Keep", _metadata())
+    _write_doc(docs_dir, "edit.md", "# Edit", _metadata())
+    _write_doc(docs_dir, "gone.md", "# Gone", _metadata())
+    load_manifest(docs_dir)
+
+    (docs_dir / "edit.md").write_text("# Edited externally")
+    (docs_dir / "gone.md").unlink()
+    _write_doc(docs_dir, "new.md", "# New")
+
+    with patch.object(document_manifest, "_build_entry", wraps=document_manifest._build_entry) as build_entry:
+        entries = load_manifest(docs_dir)
+
+    assert sorted(call.args[0] for call in build_entry.call_args_list) == ["edit.md", "new.md"]
+    assert sorted(entries) == ["edit.md", "keep.md", "new.md"]
+    assert entries["edit.md"].content_hash == generate_content_hash("# Edited externally")
+    stored = json.loads((docs_dir / DOCUMENT_MANIFEST).read_text())
+    assert [doc["name"] for doc in stored["documents"]] == ["edit.md", "keep.md", "new.md"]
+
+
+def test_sidecar_change_is_drift(tmp_path):
+    """Rewriting a sidecar refreshes the recorded metadata."""
+    docs_dir = tmp_path / DOCUMENT_SUBDIR
+    docs_dir.mkdir()
+    _write_doc(docs_dir, "a.md", "# A", _metadata())
+    load_manifest(docs_dir)
+
+    (docs_dir / f"a.md{METADATA_SUFFIX}").write_text(json.dumps(_metadata("text/x-markdown")))
+
+    assert load_manifest(docs_dir)["a.md"].metadata["mime_type"] == "text/x-markdown"
+
+
+def test_replacement_with_same_size_and_mtime_is_drift(tmp_path):
+    """A file renamed over a document is picked up even when its size and mtime match."""
+    docs_dir = tmp_path / DOCUMENT_SUBDIR
+    docs_dir.mkdir()
+    _write_doc(docs_dir, "a.md", "# A")
+    load_manifest(docs_dir)
+
+    replacement = tmp_path / "a.md"
+    replacement.write_text("# B")
+    st = os.stat(docs_dir / "a.md")
+    os.utime(replacement, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.replace(replacement, docs_dir / "a.md")
+
+    assert load_manifest(docs_dir)["a.md"].content_hash == generate_content_hash("# B")
+
+
+def test_corrupt_manifest_is_rebuilt(tmp_path):
+    """An unreadable manifest is ignored and replaced."""
+    docs_dir = tmp_path / DOCUMENT_SUBDIR
+    docs_dir.mkdir()
+    _write_doc(docs_dir, "a.md", "# A", _metadata())
+    (docs_dir / DOCUMENT_MANIFEST).write_text("{ not json")
+
+    assert list(load_manifest(docs_dir)) == ["a.md"]
+    assert json.loads((docs_dir / DOCUMENT_MANIFEST).read_text())["documents"][0]["name"] == "a.md"
+
+
+def test_discovery_skips_manifest_and_reports_invalid_metadata_as_empty(tmp_path):
+    """Discovery lists documents from the manifest, never the manifest itself."""
+    docs_dir = tmp_path / DOCUMENT_SUBDIR
+    docs_dir.mkdir()
+    _write_doc(docs_dir, "a.md", "# A", _metadata())
+    _write_doc(docs_dir, "b.md", "# B", {"unexpected": True})
+
+    documents = {doc.path.name: doc for doc in get_category_documents_by_path(tmp_path)}
+
+    assert sorted(documents) == ["a.md", "b.md"]
+    assert documents["a.md"].metadata == _metadata()
+    assert documents["b.md"].metadata == {}
+
+
+async def test_crud_operations_keep_manifest_current(tmp_path):
+    """Create, update and delete record their changes in the manifest."""
+    docs_dir = tmp_path / DOCUMENT_SUBDIR
+
+    result = await create_mcp_document(str(tmp_path), "doc.md", "# Doc", explicit_action="CREATE_DOCUMENT")
+    assert result["success"] is True
+
+    stored = json.loads((docs_dir / DOCUMENT_MANIFEST).read_text())["documents"]
+    assert [doc["name"] for doc in stored] == ["doc.md"]
+    assert stored[0]["content_hash"] == generate_content_hash("# Doc\n")
+
+    # The recorded entry is current, so loading needs no rebuild
+    with patch("mcp_server_guide.utils.document_manifest._build_entry") as build_entry:
+        load_manifest(docs_dir)
+    build_entry.assert_not_called()
+
+    await update_mcp_document(str(tmp_path), "doc.md", "# Doc v2", explicit_action="UPDATE_DOCUMENT")
+    stored = json.loads((docs_dir / DOCUMENT_MANIFEST).read_text())["documents"]
+    assert stored[0]["content_hash"] == generate_content_hash("# Doc v2\n")
+
+    await delete_mcp_document(str(tmp_path), "doc.md", explicit_action="DELETE_DOCUMENT")
+    assert json.loads((docs_dir / DOCUMENT_MANIFEST).read_text())["documents"] == []
+
+
+async def test_recorded_entry_matches_rebuild_for_crlf_content(tmp_path):
+    """The entry create records is the one a rebuild would produce, even for CRLF content."""
+    docs_dir = tmp_path / DOCUMENT_SUBDIR
+
+    result = await create_mcp_document(
+        str(tmp_path), "doc.md", "# Doc\r\n\r\nBody\r\n", explicit_action="CREATE_DOCUMENT"
+    )
+    assert result["success"] is True
+    recorded = document_manifest.read_manifest(docs_dir)
+
+    (docs_dir / DOCUMENT_MANIFEST).unlink()
+    rebuilt = load_manifest(docs_dir)
+
+    assert recorded == rebuilt
+
+
+def test_binary_document_with_crlf_is_listed(tmp_path):
+    """A binary document containing CRLF bytes is listed alongside text documents."""
+    docs_dir = tmp_path / DOCUMENT_SUBDIR
+    docs_dir.mkdir()
+    (docs_dir / "a.pdf").write_bytes(b"%PDF-1.4\r\n\xff\xfe\x00binary\r\n")
+    _write_doc(docs_dir, "b.md", "# B")
+
+    names = sorted(doc.path.name for doc in get_category_documents_by_path(tmp_path))
+
+    assert names == ["a.pdf", "b.md"]
+
+
+def test_unreadable_document_is_still_listed(tmp_path):
+    """A document that cannot be hashed keeps its entry, and is rehashed once readable."""
+    docs_dir = tmp_path / DOCUMENT_SUBDIR
+    docs_dir.mkdir()
+    _write_doc(docs_dir, "a.md", "# A")
+
+    with patch.object(document_manifest, "generate_file_hash", side_effect=OSError("I/O error")):
+        entries = load_manifest(docs_dir)
+    assert entries["a.md"].content_hash == document_manifest.UNKNOWN_HASH
+    assert [doc.path.name for doc in get_category_documents_by_path(tmp_path)] == ["a.md"]
+
+    assert load_manifest(docs_dir)["a.md"].content_hash == generate_content_hash("# A")
+
+
+async def test_write_back_keeps_documents_recorded_during_the_scan(tmp_path):
+    """A rebuild merges in entries the server recorded after the manifest was read."""
+    docs_dir = tmp_path / DOCUMENT_SUBDIR
+    docs_dir.mkdir()
+    _write_doc(docs_dir, "a.md", "# A")
+    load_manifest(docs_dir)
+    _write_doc(docs_dir, "b.md", "# B")
+    build_entry = document_manifest._build_entry
+
+    def record_during_scan(*args):
+        # The server records a new document while this load is still rebuilding
+        (docs_dir / "c.md").write_text("# C\n")
+        metadata = document_manifest.DocumentMetadata(**_metadata())
+        asyncio.run(document_manifest.record_document(docs_dir / "c.md", metadata))
+        return build_entry(*args)
+
+    with patch.object(document_manifest, "_build_entry", side_effect=record_during_scan):
+        entries = await asyncio.to_thread(load_manifest, docs_dir)
+
+    assert sorted(entries) == ["a.md", "b.md"]
+    stored = json.loads((docs_dir / DOCUMENT_MANIFEST).read_text())
+    assert [doc["name"] for doc in stored["documents"]] == ["a.md", "b.md", "c.md"]
+
+
+async def test_write_back_is_skipped_while_the_manifest_is_locked(tmp_path):
+    """A load never waits for the manifest lock; it returns its scan and leaves the file alone."""
+    docs_dir = tmp_path / DOCUMENT_SUBDIR
+    docs_dir.mkdir()
+    _write_doc(docs_dir, "a.md", "# A")
+
+    async def load_while_locked(manifest_path):
+        return load_manifest(docs_dir)
+
+    entries = await lock_update(docs_dir / DOCUMENT_MANIFEST, load_while_locked)
+
+    assert list(entries) == ["a.md"]
+    assert not (docs_dir / DOCUMENT_MANIFEST).exists()
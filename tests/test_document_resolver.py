@@ -0,0 +1,92 @@
+"""Tests for direct per-document resolution in file-based categories."""
+
+from pathlib import Path
+
+import pytest
+
+from mcp_server_guide.document_resolver import (
+    CategoryNameIndex,
+    get_name_index,
+    invalidate_name_index,
+    read_category_document,
+)
+
+
+def _paths(*names: str) -> list:
+    return [Path("/docs") / name for name in names]
+
+
+def test_resolve_exact_and_extension_fallback():
+    """Names resolve exactly first, then with the .md fallback."""
+    index = CategoryNameIndex.build(_paths("guide", "guide.md", "notes.txt"))
+
+    assert index.resolve("guide") == Path("/docs/guide")
+    assert index.resolve("guide.md") == Path("/docs/guide.md")
+    assert index.resolve("notes") == Path("/docs/notes.txt")
+    assert index.resolve("missing") is None
+
+
+def test_resolve_is_case_insensitive():
+    """Lookups ignore case like the section extraction did."""
+    index = CategoryNameIndex.build(_paths("README.md"))
+
+    assert index.resolve("readme") == Path("/docs/README.md")
+    assert index.resolve("ReadMe.MD") == Path("/docs/README.md")
+
+
+def test_resolve_prefers_first_matched_file():
+    """When several files answer to a name, match order decides."""
+    index = CategoryNameIndex.build(_paths("api.txt", "api.md"))
+
+    assert index.resolve("api") == Path("/docs/api.txt")
+
+
+def test_resolve_dotted_prefixes():
+    """Multi-dot file names resolve from each dot-delimited prefix."""
+    index = CategoryNameIndex.build(_paths("guide.v2.md", ".hidden.md"))
+
+    assert index.resolve("guide.v2") == Path("/docs/guide.v2.md")
+    assert index.resolve(".hidden") == Path("/docs/.hidden.md")
+
+
+def test_name_index_reused_until_matches_change():
+    """The per-category index is rebuilt only when the matched files change."""
+    invalidate_name_index("cat")
+    first = get_name_index("cat", _paths("a.md"))
+
+    assert get_name_index("cat", _paths("a.md")) is first
+    assert get_name_index("cat", _paths("a.md", "b.md")) is not first
+
+    invalidate_name_index("cat")
+    assert get_name_index("cat", _paths("a.md", "b.md")) is not first
+
+
+@pytest.mark.parametrize(
+    ("document", "expected"),
+    [
+        ("alpha", "First document"),
+        ("alpha.md", "First document"),
+        ("beta", "Second document"),
+        ("BETA.md", "Second document"),
+        ("gamma", "Third"),
+        ("missing", None),
+    ],
+)
+async def test_resolution_reads_one_document(tmp_path, document, expected):
+    """Direct resolution returns the matched document's stripped text, as the combined sections did."""
+    files = {"alpha.md": "First document\n", "beta.md": "\nSecond document", "gamma.txt": "Third"}
+    paths = []
+    for name, body in files.items():
+        (tmp_path / name).write_text(body)
+        paths.append(tmp_path / name)
+
+    resolved = CategoryNameIndex.build(paths).resolve(document)
+    direct = await read_category_document(resolved) if resolved else None
+
+    assert direct == expected
+
+
+async def test_read_category_document_reports_errors(tmp_path):
+    """Unreadable documents produce the same error text as combined content."""
+    result = await read_category_document(tmp_path / "missing.md")
+    assert result.startswith("Error reading file:")
@@ -1,9 +1,15 @@
 """Tests for extension normalization and validation."""
 
+import json
+from unittest.mock import patch
+
 from src.mcp_server_guide.utils.document_utils import (
+    MIME_SNIFF_CHARS,
+    MimeDetector,
     detect_mime_type_from_content,
     get_extension_for_mime_type,
     normalize_document_name,
+    resolve_document_type,
 )
 
 
@@ -78,3 +84,42 @@ class TestNormalizeDocumentName:
         result = normalize_document_name("file", "binary\x00content")
         # Binary content might get extension or stay as-is
         assert "file" in result
+
+
+class TestMimeDetector:
+    """Test the shared content sniffing service."""
+
+    def test_repeated_content_is_sniffed_once(self):
+        detector = MimeDetector()
+        assert detector.from_content('{"key": "value"}') == "application/json"
+        assert detector.from_content('{"key": "value"}') == "application/json"
+        assert detector.stats.misses == 1
+        assert detector.stats.hits == 1
+
+    def test_only_a_bounded_prefix_is_inspected(self):
+        detector = MimeDetector(sniff_chars=16)
+        detector.from_content("x" * 16)
+        detector.from_content("x" * 16 + "different tail")
+        assert len(detector) == 1
+        assert detector.stats.hits == 1
+
+
+class TestResolveDocumentType:
+    """Test name normalization and mime-type detection in one pass."""
+
+    def test_matches_separate_detection(self):
+        name, mime_type = resolve_document_type("file", "# Markdown content")
+        assert name == normalize_document_name("file", "# Markdown content")
+        assert mime_type == "text/plain"
+
+    def test_content_is_sniffed_once(self):
+        detector = MimeDetector()
+        with patch("src.mcp_server_guide.utils.document_utils.get_mime_detector", return_value=detector):
+            name, _ = resolve_document_type("file", "Plain text content")
+        assert name == "file.txt"
+        assert detector.stats.misses == 1
+
+    def test_large_json_keeps_filename_type(self):
+        content = json.dumps([{"id": i, "name": f"item-{i}"} for i in range(10000)])
+        assert len(content) > MIME_SNIFF_CHARS
+        assert resolve_document_type("data.json", content) == ("data.json", "application/json")
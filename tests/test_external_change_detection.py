@@ -101,6 +101,41 @@ async def test_external_modification_detection():
         assert "Modified Content" in new_content
 
 
+@pytest.mark.asyncio
+async def test_external_edit_keeps_user_set_metadata():
+    """Syncing after an external edit keeps source_type and other recorded fields."""
+    from mcp_server_guide.models.document_metadata import DocumentMetadata
+    from mcp_server_guide.services.external_sync import _cleanup_category_documents
+    from mcp_server_guide.tools.document_tools import create_mcp_document, list_mcp_documents
+    from mcp_server_guide.utils.sidecar_operations import create_sidecar_metadata, read_sidecar_metadata
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        await create_mcp_document(
+            category_dir=temp_dir,
+            name="test.md",
+            content="# Original",
+            explicit_action="CREATE_DOCUMENT",
+            source_type="manual",
+        )
+        doc_path = Path(temp_dir) / DOCUMENT_SUBDIR / "test.md"
+        metadata = read_sidecar_metadata(doc_path)
+        create_sidecar_metadata(doc_path, DocumentMetadata(**metadata.model_dump(), author="someone"))
+
+        doc_path.write_text("# Edited outside the server\n", encoding="utf-8")
+        await list_mcp_documents(temp_dir)
+        # The listing queues the category; this is what the queue's workers run
+        await _cleanup_category_documents(temp_dir)
+
+        synced = read_sidecar_metadata(doc_path)
+        assert synced.content_hash != metadata.content_hash
+        assert synced.source_type == "manual"
+        assert synced.model_dump()["author"] == "someone"
+
+        listed = (await list_mcp_documents(temp_dir))["documents"]
+        assert listed[0]["source_type"] == "manual"
+        assert listed[0]["content_hash"] == synced.content_hash
+
+
 @pytest.mark.asyncio
 async def test_category_cleanup_trigger():
     """Test category access triggers async cleanup task."""
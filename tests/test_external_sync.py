@@ -2,14 +2,19 @@
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from mcp_server_guide.constants import DOCUMENT_MANIFEST, DOCUMENT_SUBDIR
 from mcp_server_guide.services.external_sync import (
+    _cleanup_category_documents,
     get_recent_changes,
     sync_document_metadata,
     validate_document_integrity,
 )
+from mcp_server_guide.utils.document_manifest import load_manifest
+from mcp_server_guide.utils.document_utils import generate_file_hash
 
 
 class TestValidateDocumentIntegrity:
@@ -80,3 +85,46 @@ class TestGetRecentChanges:
         """Test getting recent changes filtered by category."""
         result = await get_recent_changes("test_category")
         assert isinstance(result, dict)
+
+
+class TestIncrementalCleanup:
+    """Test integrity scans only rehash documents whose stat signature changed."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_documents_are_not_rehashed(self, tmp_path):
+        """Test scans reuse the document manifest's hashes and a changed file is rehashed."""
+        from mcp_server_guide.tools.document_tools import create_mcp_document
+
+        for name in ("a.md", "b.md"):
+            await create_mcp_document(str(tmp_path), name, f"# {name}", explicit_action="CREATE_DOCUMENT")
+        docs_dir = tmp_path / DOCUMENT_SUBDIR
+
+        with patch(
+            "mcp_server_guide.utils.document_manifest.generate_file_hash", wraps=generate_file_hash
+        ) as file_hash:
+            # Creating the documents recorded their hashes in the manifest
+            await _cleanup_category_documents(str(tmp_path))
+            await _cleanup_category_documents(str(tmp_path))
+            file_hash.assert_not_called()
+
+            (docs_dir / "a.md").write_text("# edited externally\n")
+            await _cleanup_category_documents(str(tmp_path))
+            assert {call.args[0].name for call in file_hash.call_args_list} == {"a.md"}
+
+        # The edit was synced into the sidecar, so the next scan has nothing to do
+        assert load_manifest(docs_dir)["a.md"].metadata["content_hash"] == generate_file_hash(docs_dir / "a.md")
+        with patch("mcp_server_guide.services.external_sync.sync_document_metadata") as sync:
+            await _cleanup_category_documents(str(tmp_path))
+        sync.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_scan_keeps_no_state_of_its_own(self, tmp_path):
+        """Test the scan stores nothing beside the documents other than the manifest."""
+        from mcp_server_guide.tools.document_tools import create_mcp_document
+
+        await create_mcp_document(str(tmp_path), "a.md", "# a", explicit_action="CREATE_DOCUMENT")
+        docs_dir = tmp_path / DOCUMENT_SUBDIR
+        await _cleanup_category_documents(str(tmp_path))
+
+        hidden = sorted(path.name for path in docs_dir.iterdir() if path.name.startswith("."))
+        assert hidden == [DOCUMENT_MANIFEST]
@@ -0,0 +1,75 @@
+"""Tests for streaming document file hashing."""
+
+import hashlib
+from unittest.mock import patch
+
+import pytest
+
+from mcp_server_guide.utils import document_utils
+from mcp_server_guide.utils.document_utils import generate_content_hash, generate_file_hash, get_file_hash_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_hash_cache():
+    get_file_hash_cache().clear()
+    yield
+    get_file_hash_cache().clear()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"# Title\n\nBody\n",
+        "café — naïve\n".encode(),
+        b"windows\r\nline\r\nendings\r\n",
+        b"old mac\rline endings\r",
+    ],
+)
+def test_file_hash_matches_content_hash_of_text(tmp_path, data):
+    """Hashing a file equals hashing the text read_text would return."""
+    path = tmp_path / "doc.md"
+    path.write_bytes(data)
+
+    assert generate_file_hash(path) == generate_content_hash(path.read_text(encoding="utf-8"))
+
+
+@pytest.mark.parametrize("threshold", [1024 * 1024, 16])
+def test_binary_file_with_crlf_hashes_raw_bytes(tmp_path, monkeypatch, threshold):
+    """A binary document containing CRLF, which cannot be decoded as text, hashes as its bytes."""
+    data = b"%PDF-1.4\r\n\xff\xfe\x00binary\r\n"
+    path = tmp_path / "a.pdf"
+    path.write_bytes(data)
+    monkeypatch.setattr(document_utils, "HASH_MMAP_THRESHOLD", threshold)
+
+    assert generate_file_hash(path) == f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+
+def test_large_files_are_hashed_through_mmap(tmp_path, monkeypatch):
+    """Files above the mmap threshold hash the same as when read in chunks."""
+    path = tmp_path / "big.md"
+    path.write_bytes(b"line of text\n" * 10_000)
+    monkeypatch.setattr(document_utils, "HASH_MMAP_THRESHOLD", 1024)
+
+    with patch("mcp_server_guide.utils.document_utils.mmap.mmap", wraps=document_utils.mmap.mmap) as mapped:
+        content_hash = generate_file_hash(path)
+
+    mapped.assert_called_once()
+    assert content_hash == generate_content_hash(path.read_text(encoding="utf-8"))
+
+
+def test_hash_is_memoized_until_file_changes(tmp_path):
+    """An unchanged file is hashed once; rewriting it invalidates the memo."""
+    path = tmp_path / "doc.md"
+    path.write_text("first")
+
+    with patch.object(document_utils, "_hash_bytes", wraps=document_utils._hash_bytes) as hash_bytes:
+        first = generate_file_hash(path)
+        assert generate_file_hash(path) == first
+        assert hash_bytes.call_count == 1
+
+        path.write_text("second, longer")
+        assert generate_file_hash(path) == generate_content_hash("second, longer")
+        assert hash_bytes.call_count == 2
+
+    assert get_file_hash_cache().stats.hits == 1
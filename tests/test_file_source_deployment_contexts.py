@@ -1,10 +1,13 @@
 """Tests for file source path handling and HTTP edge cases."""
 
+import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from mcp_server_guide.file_source import FileAccessor, FileSource, FileSourceType
+from mcp_server_guide.http.async_client import HTTPResponse
 
 
 class TestSessionPathParsing:
@@ -68,7 +71,8 @@ class TestHttpFileReading:
 
         # No cached entry
         accessor.cache = MagicMock()
-        accessor.cache.get.return_value = None
+        accessor.cache.get_async = AsyncMock(return_value=None)
+        accessor.cache.put_async = AsyncMock()
 
         # Mock HTTP client
         mock_client = AsyncMock()
@@ -83,7 +87,7 @@ class TestHttpFileReading:
             result = await accessor._read_http_file("test.txt", source)
 
             assert result == "fresh content"
-            accessor.cache.put.assert_called_once_with(
+            accessor.cache.put_async.assert_called_once_with(
                 "https://example.com/test.txt", "fresh content", headers={"etag": "xyz789"}
             )
 
@@ -95,7 +99,8 @@ class TestHttpFileReading:
 
         # No cached entry
         accessor.cache = MagicMock()
-        accessor.cache.get.return_value = None
+        accessor.cache.get_async = AsyncMock(return_value=None)
+        accessor.cache.put_async = AsyncMock()
 
         # Mock HTTP client that raises exception
         mock_client = AsyncMock()
@@ -107,6 +112,190 @@ class TestHttpFileReading:
             with pytest.raises(RuntimeError, match="Failed to read HTTP file"):
                 await accessor._read_http_file("test.txt", source)
 
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_share_one_fetch(self):
+        """Concurrent misses for the same URL are coalesced into a single request."""
+        source = FileSource(FileSourceType.HTTP, "https://example.com")
+        accessor = FileAccessor()
+        accessor.cache = MagicMock()
+        accessor.cache.get_async = AsyncMock(return_value=None)
+        accessor.cache.put_async = AsyncMock()
+
+        release = asyncio.Event()
+
+        async def slow_get(url, headers=None):
+            await release.wait()
+            return HTTPResponse(status=200, headers={}, content="shared content")
+
+        mock_client = AsyncMock()
+        mock_client.get.side_effect = slow_get
+
+        with patch("mcp_server_guide.http.async_client.AsyncHTTPClient") as mock_client_class:
+            mock_client_class.return_value.__aenter__.return_value = mock_client
+
+            readers = [asyncio.create_task(accessor._read_http_file("test.txt", source)) for _ in range(5)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*readers)
+
+        assert results == ["shared content"] * 5
+        mock_client.get.assert_called_once()
+        accessor.cache.put_async.assert_called_once()
+        assert accessor._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_reader_does_not_cancel_shared_fetch(self):
+        """A waiter that gives up leaves the in-flight fetch running for the others."""
+        source = FileSource(FileSourceType.HTTP, "https://example.com")
+        accessor = FileAccessor()
+        accessor.cache = None
+
+        release = asyncio.Event()
+
+        async def slow_get(url, headers=None):
+            await release.wait()
+            return HTTPResponse(status=200, headers={}, content="content")
+
+        mock_client = AsyncMock()
+        mock_client.get.side_effect = slow_get
+
+        with patch("mcp_server_guide.http.async_client.AsyncHTTPClient") as mock_client_class:
+            mock_client_class.return_value.__aenter__.return_value = mock_client
+
+            impatient = asyncio.create_task(accessor._read_http_file("test.txt", source))
+            patient = asyncio.create_task(accessor._read_http_file("test.txt", source))
+            await asyncio.sleep(0)
+            impatient.cancel()
+            release.set()
+
+            assert await patient == "content"
+            assert impatient.cancelled()
+            mock_client.get.assert_called_once()
+
+
+class TestStaleWhileRevalidate:
+    """Test serving stale remote content while refreshing in the background."""
+
+    @staticmethod
+    def _stale_accessor(**kwargs):
+        from mcp_server_guide.file_cache import CacheEntry
+
+        accessor = FileAccessor(stale_while_revalidate=3600, **kwargs)
+        stale = CacheEntry("old content", headers={"etag": '"v1"'}, cached_at=time.time() - 600)
+        accessor.cache = MagicMock()
+        accessor.cache.get_async = AsyncMock(return_value=stale)
+        accessor.cache.put_async = AsyncMock()
+        return accessor
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_refreshing(self):
+        """A stale entry inside the window is returned without waiting for the origin."""
+        source = FileSource(FileSourceType.HTTP, "https://example.com")
+        accessor = self._stale_accessor()
+        release = asyncio.Event()
+
+        async def slow_conditional(url, **kwargs):
+            await release.wait()
+            return HTTPResponse(status=200, headers={"etag": '"v2"'}, content="new content")
+
+        mock_client = AsyncMock()
+        mock_client.get_conditional.side_effect = slow_conditional
+
+        with patch("mcp_server_guide.http.async_client.AsyncHTTPClient") as mock_client_class:
+            mock_client_class.return_value.__aenter__.return_value = mock_client
+
+            assert await accessor._read_http_file("test.txt", source) == "old content"
+            assert await accessor._read_http_file("test.txt", source) == "old content"
+            assert len(accessor._inflight) == 1
+
+            release.set()
+            await asyncio.gather(*accessor._inflight.values())
+
+        mock_client.get_conditional.assert_called_once()
+        accessor.cache.put_async.assert_called_once_with(
+            "https://example.com/test.txt", "new content", headers={"etag": '"v2"'}
+        )
+
+    @pytest.mark.asyncio
+    async def test_window_is_measured_from_expiry(self):
+        """A window shorter than max-age still applies, counted from when the entry expired."""
+        from mcp_server_guide.file_cache import CacheEntry
+
+        source = FileSource(FileSourceType.HTTP, "https://example.com")
+        accessor = FileAccessor(stale_while_revalidate=300)
+        accessor.cache = MagicMock()
+        accessor.cache.put_async = AsyncMock()
+        headers = {"cache-control": "max-age=3600"}
+        mock_client = AsyncMock()
+        mock_client.get_conditional.return_value = HTTPResponse(status=200, headers=headers, content="new content")
+
+        with patch("mcp_server_guide.http.async_client.AsyncHTTPClient") as mock_client_class:
+            mock_client_class.return_value.__aenter__.return_value = mock_client
+
+            # Expired 100s ago: inside the window, so served stale
+            recent = CacheEntry("old content", headers=headers, cached_at=time.time() - 3700)
+            accessor.cache.get_async = AsyncMock(return_value=recent)
+            assert await accessor._read_http_file("test.txt", source) == "old content"
+            await asyncio.gather(*accessor._inflight.values())
+
+            # Expired 400s ago: past the window, so the read waits for the origin
+            old = CacheEntry("old content", headers=headers, cached_at=time.time() - 4000)
+            accessor.cache.get_async = AsyncMock(return_value=old)
+            assert await accessor._read_http_file("test.txt", source) == "new content"
+
+    def test_stale_while_revalidate_is_off_by_default(self):
+        """Servers only serve stale remote content when configured to."""
+        from mcp_server_guide.server import DEFAULT_STALE_WHILE_REVALIDATE
+
+        assert FileAccessor().stale_while_revalidate == 0
+        assert DEFAULT_STALE_WHILE_REVALIDATE == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_backs_off(self):
+        """After a failed refresh no new refresh starts until the backoff elapses."""
+        source = FileSource(FileSourceType.HTTP, "https://example.com")
+        accessor = self._stale_accessor(refresh_backoff=60)
+        mock_client = AsyncMock()
+        mock_client.get_conditional.side_effect = Exception("origin down")
+
+        with patch("mcp_server_guide.http.async_client.AsyncHTTPClient") as mock_client_class:
+            mock_client_class.return_value.__aenter__.return_value = mock_client
+
+            assert await accessor._read_http_file("test.txt", source) == "old content"
+            await asyncio.gather(*accessor._inflight.values())
+            assert accessor._refresh_failures == {"https://example.com/test.txt": 1}
+
+            assert await accessor._read_http_file("test.txt", source) == "old content"
+            assert accessor._inflight == {}
+            mock_client.get_conditional.assert_called_once()
+
+            accessor._refresh_retry_at["https://example.com/test.txt"] = 0.0
+            await accessor._read_http_file("test.txt", source)
+            await asyncio.gather(*accessor._inflight.values())
+            assert accessor._refresh_failures == {"https://example.com/test.txt": 2}
+
+    @pytest.mark.asyncio
+    async def test_cleanup_cancels_background_refresh(self):
+        """Shutdown cancels refreshes still waiting on the origin."""
+        source = FileSource(FileSourceType.HTTP, "https://example.com")
+        accessor = self._stale_accessor()
+
+        async def hang(url, **kwargs):
+            await asyncio.Event().wait()
+
+        mock_client = AsyncMock()
+        mock_client.get_conditional.side_effect = hang
+
+        with patch("mcp_server_guide.http.async_client.AsyncHTTPClient") as mock_client_class:
+            mock_client_class.return_value.__aenter__.return_value = mock_client
+
+            await accessor._read_http_file("test.txt", source)
+            task = next(iter(accessor._inflight.values()))
+            await accessor.cleanup()
+
+        assert task.cancelled()
+        assert accessor._inflight == {}
+
 
 class TestContextDefaults:
     """Test default file source context behaviour."""
@@ -0,0 +1,55 @@
+"""Tests for the shared LRU map behind the in-memory caches."""
+
+import pytest
+
+from mcp_server_guide.utils.lru_cache import LRUCache
+
+
+def test_entry_bound_evicts_least_recently_used():
+    """Once max_entries is reached the least recently used entry makes room."""
+    cache: LRUCache[str, int] = LRUCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_size_bound_evicts_to_fit_and_rejects_oversized_values():
+    """Values are evicted to keep the total size in budget; a value larger than the budget is not stored."""
+    cache: LRUCache[str, str] = LRUCache(max_size=8, sizeof=len)
+    cache.put("a", "aaaa")
+    cache.put("b", "bbbb")
+    cache.put("c", "cccc")
+
+    assert "a" not in cache
+    assert cache.total_size == 8
+
+    assert cache.put("b", "too large") is False
+    assert "b" not in cache
+    assert cache.total_size == 4
+
+
+def test_invalid_entries_are_misses_until_invalidated():
+    """An entry failing the validity check counts as a miss and stays until invalidated."""
+    cache: LRUCache[str, int] = LRUCache()
+    cache.put("a", 1)
+
+    assert cache.get("a", lambda value: value == 2) is None
+    assert "a" in cache
+    assert cache.invalidate("a") is True
+    assert cache.invalidate("a") is False
+    assert cache.stats.as_dict() == {"hits": 0, "misses": 1, "evictions": 0, "invalidations": 1}
+
+    cache.clear()
+    assert cache.stats.misses == 0
+
+
+def test_size_bound_requires_sizeof():
+    """A size budget without a way to measure values is rejected."""
+    with pytest.raises(ValueError):
+        LRUCache(max_size=1)
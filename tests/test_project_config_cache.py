@@ -0,0 +1,76 @@
+"""Tests for the parsed config file cache in ProjectConfigManager."""
+
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from mcp_server_guide.models.category import Category
+from mcp_server_guide.project_config import ProjectConfig, ProjectConfigManager
+
+CONFIG = """
+docroot: docs
+projects:
+  alpha:
+    categories: {}
+    collections: {}
+  beta:
+    categories: {}
+    collections: {}
+"""
+
+
+@pytest.fixture
+def manager(tmp_path):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(CONFIG)
+    manager = ProjectConfigManager()
+    manager.set_config_filename(config_file)
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_unchanged_file_is_parsed_once(manager):
+    """Loads, project switches and listings reuse the parsed config file."""
+    with patch("mcp_server_guide.project_config.yaml.safe_load", wraps=yaml.safe_load) as safe_load:
+        assert await manager.load_config("alpha") is not None
+        assert await manager.load_config("beta") is not None
+        assert sorted(await manager.list_all_projects()) == ["alpha", "beta"]
+        await manager.get_speckit_config()
+
+    assert safe_load.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_external_change_is_reparsed(manager):
+    """Rewriting the file from outside invalidates the cached parse."""
+    await manager.load_config("alpha")
+
+    manager.get_config_filename().write_text(CONFIG.replace("beta", "gamma"))
+
+    assert await manager.load_config("beta") is None
+    assert await manager.load_config("gamma") is not None
+
+
+@pytest.mark.asyncio
+async def test_loaded_config_is_a_copy(manager):
+    """Modifying a loaded project never leaks into later loads."""
+    config = await manager.load_config("alpha")
+    config.categories["scratch"] = Category(dir="scratch/", patterns=["*.md"], description="")
+
+    reloaded = await manager.load_config("alpha")
+    assert "scratch" not in reloaded.categories
+
+
+@pytest.mark.asyncio
+async def test_save_primes_cache(manager):
+    """A saved config is served to the next load without parsing the file again."""
+    config = ProjectConfig(categories={"docs": Category(dir="docs/", patterns=["*.md"], description="Docs")})
+    await manager.save_config("alpha", config)
+
+    with patch("mcp_server_guide.project_config.yaml.safe_load") as safe_load:
+        loaded = await manager.load_config("alpha")
+
+    safe_load.assert_not_called()
+    assert loaded == config
+    assert loaded is not config
@@ -30,3 +30,78 @@ class TestConcurrentSave:
             call_args = mock_lock_update.call_args
             assert len(call_args[0]) >= 3  # config_file, function, project_name, config
             assert call_args[0][1].__name__ == "_save_config_locked"
+
+    async def test_reads_do_not_take_the_lock(self, tmp_path):
+        """Test that loading and listing an existing config file never waits on the lock."""
+        config_manager = ProjectConfigManager()
+        config_manager.set_config_filename(tmp_path / "test_config.yaml")
+        await config_manager.save_config("test_project", ProjectConfig())
+
+        with patch("mcp_server_guide.project_config.lock_update") as mock_lock_update:
+            assert await config_manager.load_config("test_project") is not None
+            assert await config_manager.list_all_projects() == ["test_project"]
+            await config_manager.get_speckit_config()
+
+        mock_lock_update.assert_not_called()
+
+    async def test_save_replaces_file_atomically(self, tmp_path):
+        """Test that saves swap in a complete file, keeping its permissions and leaving no temp files."""
+        import asyncio
+        import os
+
+        import yaml
+
+        config_file = tmp_path / "test_config.yaml"
+        config_manager = ProjectConfigManager()
+        config_manager.set_config_filename(config_file)
+        await config_manager.save_config("project0", ProjectConfig())
+        os.chmod(config_file, 0o640)
+        inode = os.stat(config_file).st_ino
+
+        async def read_continuously(stop):
+            while not stop.is_set():
+                data = yaml.safe_load(config_file.read_text())
+                assert "project0" in data["projects"]
+                await asyncio.sleep(0)
+
+        stop = asyncio.Event()
+        reader = asyncio.create_task(read_continuously(stop))
+        for i in range(1, 20):
+            await config_manager.save_config(f"project{i}", ProjectConfig())
+        stop.set()
+        await reader
+
+        assert os.stat(config_file).st_ino != inode
+        assert os.stat(config_file).st_mode & 0o777 == 0o640
+        assert not list(tmp_path.glob(".test_config.yaml.*"))
+
+    async def test_save_through_symlink_updates_target(self, tmp_path):
+        """Test that saving a symlinked config replaces the target and keeps the link."""
+        import os
+
+        target = tmp_path / "shared" / "config.yaml"
+        target.parent.mkdir()
+        link = tmp_path / "test_config.yaml"
+        config_manager = ProjectConfigManager()
+        config_manager.set_config_filename(target)
+        await config_manager.save_config("project0", ProjectConfig())
+        os.symlink(target, link)
+
+        config_manager.set_config_filename(link)
+        await config_manager.save_config("project1", ProjectConfig())
+
+        assert link.is_symlink()
+        assert "project1" in target.read_text()
+
+    async def test_new_file_mode_follows_umask(self, tmp_path):
+        """Test that a newly created config gets 0o666 less the umask, not mkstemp's 0o600."""
+        import os
+
+        config_file = tmp_path / "test_config.yaml"
+        config_manager = ProjectConfigManager()
+        config_manager.set_config_filename(config_file)
+        await config_manager.save_config("project0", ProjectConfig())
+
+        umask = os.umask(0)
+        os.umask(umask)
+        assert os.stat(config_file).st_mode & 0o777 == 0o666 & ~umask
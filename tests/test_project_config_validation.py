@@ -7,7 +7,6 @@ import pytest
 from mcp_server_guide.models.category import Category
 from mcp_server_guide.models.collection import Collection
 from mcp_server_guide.project_config import ProjectConfig
-from mcp_server_guide.tools.content_tools import _extract_document_from_content
 
 
 class TestProjectConfigValidation:
@@ -33,18 +32,6 @@ class TestProjectConfigValidation:
         with pytest.raises(ValueError, match="must have either"):
             Category(description="test")
 
-    def test_extract_document_no_match(self):
-        """Test document extraction with no match."""
-        content = "Some content without target"
-        result = _extract_document_from_content(content, "missing.md")
-        assert result is None
-
-    def test_extract_document_with_match(self):
-        """Test document extraction with match."""
-        content = "# test.md\nContent here\n\n# other.md\nOther"
-        result = _extract_document_from_content(content, "test.md")
-        assert result == "Content here"
-
     def test_project_config_validation(self):
         """Test ProjectConfig validation."""
         # Test valid config
@@ -1,7 +1,7 @@
 """Tests for server lifespan and deferred configuration."""
 
 import warnings
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -47,3 +47,78 @@ class TestServerLifespan:
 
                 mock_logger.error.assert_called_once()
                 mock_logger.info.assert_any_call("MCP server shutting down")
+
+    @pytest.mark.asyncio
+    async def test_server_lifespan_closes_http_pool(self):
+        """Shutdown releases the server-owned HTTP connection pool."""
+        from mcp_server_guide.file_source import FileAccessor
+        from mcp_server_guide.http.async_client import HTTPClientPool
+        from mcp_server_guide.server import server_lifespan
+        from mcp_server_guide.server_extensions import ServerExtensions
+        from mcp_server_guide.session_manager import SessionManager
+
+        http_pool = HTTPClientPool()
+        http_pool.close = AsyncMock()
+        mock_server = MagicMock()
+        mock_server.extensions = ServerExtensions(
+            _session_manager=SessionManager(), file_accessor=FileAccessor(http_pool=http_pool), http_pool=http_pool
+        )
+
+        with patch("mcp_server_guide.server_lifecycle.logger"):
+            async with server_lifespan(mock_server):
+                http_pool.close.assert_not_called()
+
+        http_pool.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_closes_http_pool_after_earlier_failure(self):
+        """A failing cleanup step is logged and the remaining steps, including closing the pool, still run."""
+        from mcp_server_guide.file_source import FileAccessor
+        from mcp_server_guide.http.async_client import HTTPClientPool
+        from mcp_server_guide.server_extensions import ServerExtensions
+        from mcp_server_guide.session_manager import SessionManager
+
+        http_pool = HTTPClientPool()
+        http_pool.close = AsyncMock()
+        extensions = ServerExtensions(
+            _session_manager=SessionManager(), file_accessor=FileAccessor(http_pool=http_pool), http_pool=http_pool
+        )
+
+        with patch.object(SessionManager, "cleanup", new_callable=AsyncMock, side_effect=OSError("disk full")):
+            with patch("mcp_server_guide.logging_config.get_logger") as mock_get_logger:
+                await extensions.cleanup()
+
+        http_pool.close.assert_awaited_once()
+        mock_get_logger.return_value.error.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_server_lifespan_cleans_up_session_manager_once(self):
+        """Shutdown runs the extensions' teardown, which cleans up the session manager exactly once."""
+        from mcp_server_guide.file_source import FileAccessor
+        from mcp_server_guide.server import server_lifespan
+        from mcp_server_guide.server_extensions import ServerExtensions
+        from mcp_server_guide.session_manager import SessionManager
+
+        session_manager = SessionManager()
+        mock_server = MagicMock()
+        mock_server.extensions = ServerExtensions(_session_manager=session_manager, file_accessor=FileAccessor())
+
+        with patch.object(SessionManager, "cleanup", new_callable=AsyncMock) as mock_cleanup:
+            with patch("mcp_server_guide.server_lifecycle.logger"):
+                async with server_lifespan(mock_server):
+                    pass
+
+        mock_cleanup.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_guide_mcp_cleanup_delegates_to_extensions(self):
+        """GuideMCP.cleanup runs the extensions' teardown rather than its own copy."""
+        from mcp_server_guide.server import GuideMCP
+
+        server = GuideMCP(name="test")
+        server.extensions = MagicMock()
+        server.extensions.cleanup = AsyncMock()
+
+        await server.cleanup()
+
+        server.extensions.cleanup.assert_awaited_once()
@@ -0,0 +1,79 @@
+"""Tests for coalesced session auto-saves."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from mcp_server_guide.session_manager import SessionManager
+
+
+@pytest.fixture
+def session():
+    session = SessionManager()
+    session.set_autosave_delay(0.05)
+    yield session
+    session.set_autosave_delay(None)
+
+
+@pytest.mark.asyncio
+async def test_changes_within_window_are_saved_once(session):
+    """A burst of auto-saves becomes a single write after the delay."""
+    with patch.object(SessionManager, "save_session", new_callable=AsyncMock) as mock_save:
+        for _ in range(50):
+            await session.safe_save_session()
+        mock_save.assert_not_called()
+
+        await asyncio.sleep(0.15)
+        mock_save.assert_called_once()
+
+        # Nothing pending, so nothing more is written
+        await session.flush_session()
+        mock_save.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_pending_changes_immediately(session):
+    """An explicit flush saves at once and replaces the pending timer."""
+    with patch.object(SessionManager, "save_session", new_callable=AsyncMock) as mock_save:
+        await session.safe_save_session()
+        await session.flush_session()
+        mock_save.assert_called_once()
+
+        await asyncio.sleep(0.1)
+        mock_save.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_changes_pending(session):
+    """A flush that fails raises, and the changes are written by the next one."""
+    with patch.object(SessionManager, "save_session", new_callable=AsyncMock) as mock_save:
+        mock_save.side_effect = [OSError("disk full"), None]
+        await session.safe_save_session()
+
+        with pytest.raises(OSError):
+            await session.flush_session()
+        await session.flush_session()
+
+        assert mock_save.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cleanup_flushes_pending_changes(session):
+    """Shutdown writes changes still waiting out the delay."""
+    with patch.object(SessionManager, "save_session", new_callable=AsyncMock) as mock_save:
+        await session.safe_save_session()
+        await session.cleanup()
+
+        mock_save.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_no_delay_saves_immediately():
+    """Without a delay every auto-save writes straight away."""
+    with patch.object(SessionManager, "save_session", new_callable=AsyncMock) as mock_save:
+        session = SessionManager()
+        await session.safe_save_session()
+        await session.safe_save_session()
+
+        assert mock_save.call_count == 2
@@ -106,3 +106,90 @@ def test_read_sidecar_metadata_permission_error():
         finally:
             # Restore permissions for cleanup
             os.chmod(sidecar_path, 0o644)
+
+
+def test_read_sidecar_metadata_is_cached_until_sidecar_changes(tmp_path):
+    """Test repeated reads reuse the parsed model until the sidecar changes."""
+    from unittest.mock import patch
+
+    from mcp_server_guide.utils.sidecar_operations import get_sidecar_cache, read_sidecar_metadata
+
+    get_sidecar_cache().clear()
+    doc_path = tmp_path / "test.md"
+    sidecar_path = tmp_path / "test.md_.json"
+    sidecar_path.write_text(
+        json.dumps({"source_type": "manual", "content_hash": "sha256:a", "mime_type": "text/plain"})
+    )
+
+    first = read_sidecar_metadata(doc_path)
+    with patch("mcp_server_guide.utils.sidecar_operations.json.load") as json_load:
+        second = read_sidecar_metadata(doc_path)
+    json_load.assert_not_called()
+    assert second == first
+
+    # Callers get copies, so mutating one does not affect later reads
+    second.source_type = "external"
+    assert read_sidecar_metadata(doc_path).source_type == "manual"
+
+    sidecar_path.write_text(
+        json.dumps({"source_type": "imported", "content_hash": "sha256:bb", "mime_type": "text/plain"})
+    )
+    assert read_sidecar_metadata(doc_path).source_type == "imported"
+
+
+def test_read_sidecar_metadata_sees_same_size_replacement(tmp_path):
+    """Test a replaced sidecar with the same size and mtime is not served from the cache."""
+    from mcp_server_guide.utils.sidecar_operations import get_sidecar_cache, read_sidecar_metadata
+
+    get_sidecar_cache().clear()
+    doc_path = tmp_path / "test.md"
+    sidecar_path = tmp_path / "test.md_.json"
+    sidecar_path.write_text(json.dumps({"source_type": "manual", "content_hash": "", "mime_type": "text/plain"}))
+    assert read_sidecar_metadata(doc_path).source_type == "manual"
+
+    original = os.stat(sidecar_path)
+    replacement = tmp_path / "replacement.json"
+    replacement.write_text(json.dumps({"source_type": "import", "content_hash": "", "mime_type": "text/plain"}))
+    os.utime(replacement, ns=(original.st_atime_ns, original.st_mtime_ns))
+    os.replace(replacement, sidecar_path)
+
+    assert os.stat(sidecar_path).st_size == original.st_size
+    assert read_sidecar_metadata(doc_path).source_type == "import"
+
+
+def test_create_sidecar_metadata_invalidates_cache(tmp_path):
+    """Test writing a sidecar drops its cached model."""
+    from mcp_server_guide.models.document_metadata import DocumentMetadata
+    from mcp_server_guide.utils.sidecar_operations import (
+        create_sidecar_metadata,
+        get_sidecar_cache,
+        read_sidecar_metadata,
+    )
+
+    cache = get_sidecar_cache()
+    cache.clear()
+    doc_path = tmp_path / "test.md"
+    create_sidecar_metadata(doc_path, DocumentMetadata(source_type="manual", content_hash="", mime_type="text/plain"))
+    read_sidecar_metadata(doc_path)
+    assert len(cache) == 1
+
+    create_sidecar_metadata(doc_path, DocumentMetadata(source_type="sync", content_hash="", mime_type="text/plain"))
+
+    assert len(cache) == 0
+    assert read_sidecar_metadata(doc_path).source_type == "sync"
+
+
+def test_sidecar_cache_is_bounded(tmp_path):
+    """Test the cache evicts least recently used entries beyond its bound."""
+    from mcp_server_guide.models.document_metadata import DocumentMetadata
+    from mcp_server_guide.utils.sidecar_operations import SidecarMetadataCache
+
+    cache = SidecarMetadataCache(max_entries=2)
+    metadata = DocumentMetadata(source_type="manual", content_hash="", mime_type="text/plain")
+    for name in ("a", "b", "c"):
+        cache.put(tmp_path / name, (1, 1, 1), metadata)
+
+    assert len(cache) == 2
+    assert cache.get(tmp_path / "a", (1, 1, 1)) is None
+    assert cache.get(tmp_path / "c", (1, 1, 1)) == metadata
+    assert cache.stats.evictions == 1